@@ -24,7 +24,9 @@ from app.models.venture import Venture
 from app.models.task import Task
 from app.models.announcement import Announcement, AnnouncementAck
 from app.models.leave import Leave, Holiday
-from app.models.time_log import TimeLog
+from app.models.time_log import TimeLog, TimeLogDaily
+from app.models.table_version import TableVersion
+from app.models.search import search_indexes
 from app.core.config import settings
 
 target_metadata = Base.metadata
@@ -37,6 +39,13 @@ target_metadata = Base.metadata
 def get_url():
     return settings.get_database_url()
 
+def include_object(object, name, type_, reflected, compare_to):
+    # Search index DDL is created with its table, outside the metadata (app.models.search);
+    # autogenerate would otherwise emit DROPs for it. SQLite triggers are never reflected
+    if reflected and compare_to is None:
+        return not any(index.owns(object, name, type_) for index in search_indexes)
+    return True
+
 def run_migrations_offline() -> None:
     """Run migrations in 'offline' mode.
 
@@ -55,6 +64,7 @@ def run_migrations_offline() -> None:
         target_metadata=target_metadata,
         literal_binds=True,
         dialect_opts={"paramstyle": "named"},
+        include_object=include_object,
     )
 
     with context.begin_transaction():
@@ -62,7 +72,7 @@ def run_migrations_offline() -> None:
 
 
 def do_run_migrations(connection: Connection) -> None:
-    context.configure(connection=connection, target_metadata=target_metadata)
+    context.configure(connection=connection, target_metadata=target_metadata, include_object=include_object)
 
     with context.begin_transaction():
         context.run_migrations()
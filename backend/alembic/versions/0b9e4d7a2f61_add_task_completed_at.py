@@ -0,0 +1,30 @@
+"""add_task_completed_at
+
+Revision ID: 0b9e4d7a2f61
+Revises: f2b7d4a9c3e1
+Create Date: 2026-10-18 18:21:47.091355
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b9e4d7a2f61'
+down_revision: Union[str, None] = 'f2b7d4a9c3e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('completed_at', sa.DateTime(), nullable=True))
+    # Best available history: completed tasks were last changed when they were completed
+    op.execute("UPDATE tasks SET completed_at = updated_at WHERE status = 'COMPLETED'")
+    op.create_index('ix_tasks_completed_at', 'tasks', ['completed_at'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_completed_at', table_name='tasks')
+    op.drop_column('tasks', 'completed_at')
@@ -0,0 +1,39 @@
+"""add_timer_owner
+
+Revision ID: 3b8e6f0d2c47
+Revises: 7d2f9a4c8e15
+Create Date: 2026-10-18 15:10:44.902136
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e6f0d2c47'
+down_revision: Union[str, None] = '7d2f9a4c8e15'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('active_timer_user_id', sa.Integer(), nullable=True))
+    op.add_column('tasks', sa.Column('last_timer_started_at', sa.DateTime(), nullable=True))
+    # No batch rebuild on SQLite (it would drop the tasks_fts triggers), see 7d2f9a4c8e15
+    if op.get_bind().dialect.name != 'sqlite':
+        op.create_foreign_key('fk_tasks_active_timer_user_id_users', 'tasks', 'users', ['active_timer_user_id'], ['id'])
+    op.create_index(
+        'ix_tasks_active_timer_user_id', 'tasks', ['active_timer_user_id'], unique=False,
+        sqlite_where=sa.text('active_timer_start IS NOT NULL'),
+        postgresql_where=sa.text('active_timer_start IS NOT NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_active_timer_user_id', table_name='tasks')
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint('fk_tasks_active_timer_user_id_users', 'tasks', type_='foreignkey')
+    op.drop_column('tasks', 'last_timer_started_at')
+    op.drop_column('tasks', 'active_timer_user_id')
@@ -0,0 +1,56 @@
+"""add_hot_path_indexes
+
+Revision ID: 4c1d9e2a7b3f
+Revises: 8083e15f7e9d
+Create Date: 2026-10-18 10:12:40.512307
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4c1d9e2a7b3f'
+down_revision: Union[str, None] = '8083e15f7e9d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Drop duplicate acks (keep the first) so the unique index can be built
+    op.execute(
+        "DELETE FROM announcement_acks WHERE id NOT IN ("
+        "SELECT MIN(id) FROM announcement_acks GROUP BY announcement_id, user_id)"
+    )
+    op.create_index(op.f('ix_tasks_status'), 'tasks', ['status'], unique=False)
+    op.create_index(op.f('ix_tasks_created_by_id'), 'tasks', ['created_by_id'], unique=False)
+    op.create_index('ix_tasks_assigned_to_id_status', 'tasks', ['assigned_to_id', 'status'], unique=False)
+    op.create_index(
+        'ix_tasks_active_timer_start', 'tasks', ['active_timer_start'], unique=False,
+        sqlite_where=sa.text('active_timer_start IS NOT NULL'),
+        postgresql_where=sa.text('active_timer_start IS NOT NULL'),
+    )
+    op.create_index(op.f('ix_time_logs_task_id'), 'time_logs', ['task_id'], unique=False)
+    op.create_index(op.f('ix_time_logs_start_time'), 'time_logs', ['start_time'], unique=False)
+    op.create_index(op.f('ix_leaves_status'), 'leaves', ['status'], unique=False)
+    op.create_index('ix_leaves_user_id_status', 'leaves', ['user_id', 'status'], unique=False)
+    op.create_index(op.f('ix_announcements_is_active'), 'announcements', ['is_active'], unique=False)
+    op.create_index(
+        'ux_announcement_acks_announcement_id_user_id', 'announcement_acks',
+        ['announcement_id', 'user_id'], unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ux_announcement_acks_announcement_id_user_id', table_name='announcement_acks')
+    op.drop_index(op.f('ix_announcements_is_active'), table_name='announcements')
+    op.drop_index('ix_leaves_user_id_status', table_name='leaves')
+    op.drop_index(op.f('ix_leaves_status'), table_name='leaves')
+    op.drop_index(op.f('ix_time_logs_start_time'), table_name='time_logs')
+    op.drop_index(op.f('ix_time_logs_task_id'), table_name='time_logs')
+    op.drop_index('ix_tasks_active_timer_start', table_name='tasks')
+    op.drop_index('ix_tasks_assigned_to_id_status', table_name='tasks')
+    op.drop_index(op.f('ix_tasks_created_by_id'), table_name='tasks')
+    op.drop_index(op.f('ix_tasks_status'), table_name='tasks')
@@ -0,0 +1,38 @@
+"""add_task_time_totals
+
+Revision ID: 5a7c2e91d4b6
+Revises: 9e5b07c3d812
+Create Date: 2026-10-18 12:20:41.309115
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5a7c2e91d4b6'
+down_revision: Union[str, None] = '9e5b07c3d812'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('total_logged_minutes', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('time_log_count', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('tasks', sa.Column('last_logged_at', sa.DateTime(), nullable=True))
+    # Backfill from existing logs (same statement as repair_time_totals.py)
+    op.execute(
+        "UPDATE tasks SET "
+        "total_logged_minutes = (SELECT COALESCE(SUM(duration_minutes), 0) FROM time_logs WHERE time_logs.task_id = tasks.id), "
+        "time_log_count = (SELECT COUNT(id) FROM time_logs WHERE time_logs.task_id = tasks.id), "
+        "last_logged_at = (SELECT MAX(end_time) FROM time_logs WHERE time_logs.task_id = tasks.id)"
+    )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table('tasks') as batch_op:
+        batch_op.drop_column('last_logged_at')
+        batch_op.drop_column('time_log_count')
+        batch_op.drop_column('total_logged_minutes')
@@ -0,0 +1,36 @@
+"""add_task_venture_id
+
+Revision ID: 7d2f9a4c8e15
+Revises: e4a93b7c15d2
+Create Date: 2026-10-18 14:22:09.482517
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d2f9a4c8e15'
+down_revision: Union[str, None] = 'e4a93b7c15d2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('tasks', sa.Column('venture_id', sa.Integer(), nullable=True))
+    # SQLite can only add the constraint through a batch (copy-and-move) rebuild,
+    # which would drop the tasks_fts triggers; it does not enforce it by default anyway
+    if op.get_bind().dialect.name != 'sqlite':
+        op.create_foreign_key('fk_tasks_venture_id_ventures', 'tasks', 'ventures', ['venture_id'], ['id'])
+    # Backfill from the assignees
+    op.execute("UPDATE tasks SET venture_id = (SELECT users.venture_id FROM users WHERE users.id = tasks.assigned_to_id)")
+    op.create_index('ix_tasks_venture_id_status', 'tasks', ['venture_id', 'status'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_venture_id_status', table_name='tasks')
+    if op.get_bind().dialect.name != 'sqlite':
+        op.drop_constraint('fk_tasks_venture_id_ventures', 'tasks', type_='foreignkey')
+    op.drop_column('tasks', 'venture_id')
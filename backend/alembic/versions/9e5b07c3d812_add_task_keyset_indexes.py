@@ -0,0 +1,28 @@
+"""add_task_keyset_indexes
+
+Revision ID: 9e5b07c3d812
+Revises: 4c1d9e2a7b3f
+Create Date: 2026-10-18 11:03:18.774051
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9e5b07c3d812'
+down_revision: Union[str, None] = '4c1d9e2a7b3f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index('ix_tasks_updated_at_id', 'tasks', ['updated_at', 'id'], unique=False)
+    op.create_index('ix_tasks_due_date_id', 'tasks', ['due_date', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_tasks_due_date_id', table_name='tasks')
+    op.drop_index('ix_tasks_updated_at_id', table_name='tasks')
@@ -0,0 +1,30 @@
+"""add_time_log_client_entry_id
+
+Revision ID: a6c3e8f1b9d4
+Revises: 3b8e6f0d2c47
+Create Date: 2026-10-18 15:52:30.217764
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a6c3e8f1b9d4'
+down_revision: Union[str, None] = '3b8e6f0d2c47'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column('time_logs', sa.Column('client_entry_id', sa.String(), nullable=True))
+    op.create_index('ux_time_logs_user_id_client_entry_id', 'time_logs', ['user_id', 'client_entry_id'], unique=True)
+    op.create_index('ix_time_logs_user_id_start_time', 'time_logs', ['user_id', 'start_time'], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index('ix_time_logs_user_id_start_time', table_name='time_logs')
+    op.drop_index('ux_time_logs_user_id_client_entry_id', table_name='time_logs')
+    op.drop_column('time_logs', 'client_entry_id')
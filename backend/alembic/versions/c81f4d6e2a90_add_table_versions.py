@@ -0,0 +1,34 @@
+"""add_table_versions
+
+Revision ID: c81f4d6e2a90
+Revises: 5a7c2e91d4b6
+Create Date: 2026-10-18 13:05:12.640282
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c81f4d6e2a90'
+down_revision: Union[str, None] = '5a7c2e91d4b6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    table_versions = op.create_table('table_versions',
+        sa.Column('table_name', sa.String(), nullable=False),
+        sa.Column('version', sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint('table_name')
+    )
+    op.bulk_insert(table_versions, [
+        {'table_name': name, 'version': 1}
+        for name in ('announcement_acks', 'announcements', 'holidays', 'leaves', 'tasks', 'time_logs', 'users', 'ventures')
+    ])
+
+
+def downgrade() -> None:
+    op.drop_table('table_versions')
@@ -0,0 +1,60 @@
+"""add_full_text_search
+
+Revision ID: e4a93b7c15d2
+Revises: c81f4d6e2a90
+Create Date: 2026-10-18 13:48:27.115904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4a93b7c15d2'
+down_revision: Union[str, None] = 'c81f4d6e2a90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, title column, body column), as declared in app.models.search.SearchIndex
+SEARCHABLE = [('tasks', 'title', 'description'), ('announcements', 'title', 'content')]
+
+
+def upgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, title, body in SEARCHABLE:
+        if dialect == 'sqlite':
+            fts, cols = f'{table}_fts', f'{title}, {body}'
+            new = f'new.id, new.{title}, new.{body}'
+            old = f"'delete', old.id, old.{title}, old.{body}"
+            op.execute(f"CREATE VIRTUAL TABLE {fts} USING fts5({cols}, content='{table}', content_rowid='id', tokenize='porter unicode61')")
+            op.execute(f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {table} BEGIN INSERT INTO {fts}(rowid, {cols}) VALUES ({new}); END")
+            op.execute(f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {table} BEGIN INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ({old}); END")
+            op.execute(
+                f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {table} BEGIN "
+                f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ({old}); "
+                f"INSERT INTO {fts}(rowid, {cols}) VALUES ({new}); END"
+            )
+            # Index the existing rows
+            op.execute(f"INSERT INTO {fts}({fts}) VALUES ('rebuild')")
+        elif dialect == 'postgresql':
+            op.execute(
+                f"ALTER TABLE {table} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+                f"setweight(to_tsvector('english', coalesce({title}, '')), 'A') || "
+                f"setweight(to_tsvector('english', coalesce({body}, '')), 'B')) STORED"
+            )
+            op.execute(f"CREATE INDEX ix_{table}_search_vector ON {table} USING GIN (search_vector)")
+
+
+def downgrade() -> None:
+    dialect = op.get_bind().dialect.name
+    for table, _, _ in SEARCHABLE:
+        if dialect == 'sqlite':
+            for suffix in ('ai', 'ad', 'au'):
+                op.execute(f"DROP TRIGGER IF EXISTS {table}_fts_{suffix}")
+            op.execute(f"DROP TABLE IF EXISTS {table}_fts")
+        elif dialect == 'postgresql':
+            op.drop_index(f'ix_{table}_search_vector', table_name=table)
+            op.drop_column(table, 'search_vector')
@@ -0,0 +1,51 @@
+"""add_time_log_daily
+
+Revision ID: f2b7d4a9c3e1
+Revises: a6c3e8f1b9d4
+Create Date: 2026-10-18 17:04:12.530918
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f2b7d4a9c3e1'
+down_revision: Union[str, None] = 'a6c3e8f1b9d4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'time_log_daily',
+        sa.Column('day', sa.Date(), nullable=False),
+        sa.Column('user_id', sa.Integer(), nullable=False),
+        sa.Column('task_id', sa.Integer(), nullable=False),
+        sa.Column('venture_id', sa.Integer(), nullable=True),
+        sa.Column('minutes', sa.Integer(), server_default='0', nullable=False),
+        sa.Column('log_count', sa.Integer(), server_default='0', nullable=False),
+        sa.ForeignKeyConstraint(['user_id'], ['users.id']),
+        sa.ForeignKeyConstraint(['task_id'], ['tasks.id']),
+        sa.ForeignKeyConstraint(['venture_id'], ['ventures.id']),
+        sa.PrimaryKeyConstraint('day', 'user_id', 'task_id'),
+        sqlite_with_rowid=False,
+    )
+    op.create_index('ix_time_log_daily_task_id_day', 'time_log_daily', ['task_id', 'day'], unique=False)
+    op.create_index('ix_time_log_daily_venture_id_day', 'time_log_daily', ['venture_id', 'day'], unique=False)
+    # Backfill from existing logs (same query as crud.time_log.rebuild_time_log_daily)
+    op.execute(
+        "INSERT INTO time_log_daily (day, user_id, task_id, venture_id, minutes, log_count) "
+        "SELECT date(time_logs.start_time), time_logs.user_id, time_logs.task_id, users.venture_id, "
+        "sum(time_logs.duration_minutes), count(time_logs.id) "
+        "FROM time_logs JOIN users ON users.id = time_logs.user_id "
+        "GROUP BY date(time_logs.start_time), time_logs.user_id, time_logs.task_id, users.venture_id"
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('ix_time_log_daily_venture_id_day', table_name='time_log_daily')
+    op.drop_index('ix_time_log_daily_task_id_day', table_name='time_log_daily')
+    op.drop_table('time_log_daily')
@@ -1,94 +1,246 @@
-from typing import Any
-from fastapi import APIRouter, Depends
+from typing import Any, Dict, Hashable, List, Optional, Set
+from fastapi import APIRouter, Depends, HTTPException
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, func
-from datetime import datetime, timedelta
+from sqlalchemy import Date, cast, select, func, case, type_coerce
+from datetime import date, datetime, time, timedelta
 
 from app.api.v1 import deps
-from app.database import get_db
+from app.api.v1.tasks import visible_tasks
+from app.core.config import settings
+from app.core.result_cache import dashboard_cache, timeseries_cache
+from app.database import commit_hooks, get_read_db
 from app.models.task import Task, TaskStatus
-from app.models.time_log import TimeLog
-from app.models.user import User
+from app.models.time_log import TimeLogDaily
+from app.models.user import User, UserRole
+from app.schemas import analytics as analytics_schema
 
-router = APIRouter()
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
-@router.get("/dashboard")
-async def get_dashboard_analytics(
-    db: AsyncSession = Depends(get_db),
-    current_user: User = Depends(deps.get_current_active_user),
-) -> Any:
+# Tables the dashboard and time series are computed from; a commit touching any of them drops both
+DASHBOARD_TABLES = frozenset({"tasks", "time_logs", "time_log_daily", "users"})
+
+
+def _invalidate_dashboard(tables: Set[str]) -> None:
+    if not DASHBOARD_TABLES.isdisjoint(tables):
+        dashboard_cache.invalidate()
+        timeseries_cache.invalidate()
+
+
+commit_hooks.append(_invalidate_dashboard)
+
+
+def dashboard_scope(current_user: User) -> Hashable:
+    """Cache key: users with the same `visible_tasks` filter share one result."""
+    if current_user.role == UserRole.EMPLOYEE:
+        return ("user", current_user.id)
+    if current_user.role == UserRole.MANAGER:
+        # Managers also see the tasks they created, so the venture alone is not enough
+        return ("venture", current_user.venture_id, current_user.id)
+    return ("global",)
+
+
+def scoped_rollup(query, current_user: User, task_columns: bool = False):
     """
-    Get dashboard analytics data.
-    Returns task statistics and time tracking metrics.
+    Restrict a TimeLogDaily query to the caller's visible tasks: managers through
+    Task.venture_id, employees through Task.assigned_to_id, each joined on
+    ix_time_log_daily_task_id_day. Admins see everything, so they skip the join
+    unless the query reads task columns (`task_columns`).
     """
-    
-    # For now, show all tasks regardless of venture
-    # In future can filter via joins with User table if needed
-    venture_filter = []
-    
-    # Tasks completed count
-    completed_query = select(func.count(Task.id)).where(
-        Task.status == TaskStatus.COMPLETED,
-        *venture_filter
-    )
-    completed_result = await db.execute(completed_query)
-    tasks_completed = completed_result.scalar() or 0
-    
-    # Total tasks count
-    total_query = select(func.count(Task.id)).where(*venture_filter)
-    total_result = await db.execute(total_query)
-    total_tasks = total_result.scalar() or 0
-    
-    # Tasks by status
-    status_query = select(
-        Task.status,
-        func.count(Task.id).label('count')
-    ).where(*venture_filter).group_by(Task.status)
-    status_result = await db.execute(status_query)
-    tasks_by_status = {row.status: row.count for row in status_result}
-    
-    # Total hours logged (from TimeLog)
-    hours_query = select(func.sum(TimeLog.duration_minutes))
-    if current_user.role == "MANAGER" and current_user.venture_id:
-        # Join with Task to filter by venture
-        hours_query = hours_query.join(Task).where(Task.venture_id == current_user.venture_id)
-    
-    hours_result = await db.execute(hours_query)
-    total_minutes = hours_result.scalar() or 0
-    total_hours_logged = round(total_minutes / 60, 2)
-    
-    # Active timers count
-    active_timers_query = select(func.count(Task.id)).where(
-        Task.active_timer_start.isnot(None),
-        *venture_filter
-    )
-    active_timers_result = await db.execute(active_timers_query)
-    active_timers = active_timers_result.scalar() or 0
-    
-    # Recent activity (last 7 days)
-    seven_days_ago = datetime.utcnow() - timedelta(days=7)
-    recent_query = select(
-        func.date(TimeLog.start_time).label('date'),
-        func.sum(TimeLog.duration_minutes).label('minutes')
-    ).where(TimeLog.start_time >= seven_days_ago)
-    
-    recent_query = recent_query.group_by(func.date(TimeLog.start_time)).order_by(func.date(TimeLog.start_time))
-    recent_result = await db.execute(recent_query)
-    
+    if task_columns or current_user.role != UserRole.ADMIN:
+        query = query.join(Task, TimeLogDaily.task_id == Task.id)
+    return visible_tasks(query, current_user)
+
+
+async def compute_dashboard(db: AsyncSession, current_user: User) -> dict:
+    # Same scoping as GET /tasks/: managers their venture, employees their own tasks
+    def scoped(query):
+        return visible_tasks(query, current_user)
+
+    # Task counters in one pass: conditional aggregates instead of a query each
+    task_query = scoped(select(
+        func.count(Task.id).label("total"),
+        func.count(Task.id).filter(Task.status == TaskStatus.COMPLETED).label("completed"),
+        func.count(Task.id).filter(Task.active_timer_start.isnot(None)).label("active_timers"),
+        *(
+            func.count(Task.id).filter(Task.status == status).label(status.value)
+            for status in TaskStatus
+        ),
+    ))
+    counts = (await db.execute(task_query)).one()
+    total_tasks = counts.total
+    tasks_completed = counts.completed
+    tasks_by_status = {
+        status.value: counts._mapping[status.value]
+        for status in TaskStatus
+        if counts._mapping[status.value]
+    }
+
+    # Time logged: one grouped query over the daily rollup (O(days), not O(logs));
+    # days older than the window fall in the NULL group
+    seven_days_ago = (datetime.utcnow() - timedelta(days=7)).date()
+    day = case((TimeLogDaily.day >= seven_days_ago, TimeLogDaily.day))
+    hours_query = scoped_rollup(select(
+        day.label("date"),
+        func.sum(TimeLogDaily.minutes).label("minutes"),
+    ), current_user).group_by(day)
+    days = (await db.execute(hours_query)).all()
+
+    total_minutes = sum(row.minutes or 0 for row in days)
     weekly_activity = [
         {
             "date": str(row.date),
-            "hours": round(row.minutes / 60, 2)
+            "hours": round((row.minutes or 0) / 60, 2)
         }
-        for row in recent_result
+        for row in sorted((row for row in days if row.date is not None), key=lambda row: str(row.date))
     ]
-    
+
     return {
         "tasks_completed": tasks_completed,
         "total_tasks": total_tasks,
         "tasks_by_status": tasks_by_status,
-        "total_hours_logged": total_hours_logged,
-        "active_timers": active_timers,
+        "total_hours_logged": round(total_minutes / 60, 2),
+        "active_timers": counts.active_timers,
         "weekly_activity": weekly_activity,
         "completion_rate": round((tasks_completed / total_tasks * 100), 2) if total_tasks > 0 else 0
     }
+
+
+@router.get("/dashboard")
+async def get_dashboard_analytics(
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Get dashboard analytics data.
+    Returns task statistics and time tracking metrics, cached per visibility
+    scope for DASHBOARD_CACHE_TTL_SECONDS and dropped on any task/time-log write.
+    """
+    return await dashboard_cache.get_or_compute(
+        dashboard_scope(current_user),
+        lambda: compute_dashboard(db, current_user),
+    )
+
+
+def bucket_start(dialect: str, bucket: str, day):
+    """SQL for the first day of the day/week (Monday)/month bucket containing `day`."""
+    if dialect == "postgresql":
+        return cast(day if bucket == "day" else func.date_trunc(bucket, day), Date)
+    modifiers = {"day": (), "week": ("weekday 0", "-6 days"), "month": ("start of month",)}[bucket]
+    return type_coerce(func.date(day, *modifiers), Date)
+
+
+def bucket_starts(start: date, end: date, bucket: str) -> List[date]:
+    """Every bucket between start and end, so empty ones are reported as zeros."""
+    if bucket == "week":
+        current = start - timedelta(days=start.weekday())
+    elif bucket == "month":
+        current = start.replace(day=1)
+    else:
+        current = start
+    starts = []
+    while current <= end:
+        starts.append(current)
+        if bucket == "month":
+            current = (current + timedelta(days=32)).replace(day=1)
+        else:
+            current += timedelta(days=7 if bucket == "week" else 1)
+    return starts
+
+
+def _breakdown_columns(breakdown: Optional[str]):
+    """(hours key, completions key): hours are attributed to whoever logged them."""
+    if breakdown == "venture":
+        return TimeLogDaily.venture_id, Task.venture_id
+    if breakdown == "user":
+        return TimeLogDaily.user_id, Task.assigned_to_id
+    if breakdown == "priority":
+        return Task.priority, Task.priority
+    if breakdown == "status":
+        return Task.status, Task.status
+    return None, None
+
+
+async def compute_timeseries(
+    db: AsyncSession, current_user: User, start: date, end: date, bucket: str, breakdown: Optional[str]
+) -> dict:
+    buckets = bucket_starts(start, end, bucket)
+    dialect = (await db.connection()).dialect.name
+    hours_key, completions_key = _breakdown_columns(breakdown)
+
+    def grouped(query, bucket_column, key):
+        bucket_column = bucket_start(dialect, bucket, bucket_column).label("bucket")
+        columns = [bucket_column] + ([key.label("key")] if key is not None else [])
+        return query.add_columns(*columns).group_by(*columns)
+
+    hours_query = grouped(
+        scoped_rollup(
+            select(func.sum(TimeLogDaily.minutes).label("value"))
+            .where(TimeLogDaily.day >= start, TimeLogDaily.day <= end),
+            current_user, task_columns=breakdown in ("priority", "status"),
+        ),
+        TimeLogDaily.day, hours_key,
+    )
+    completions_query = grouped(
+        visible_tasks(
+            select(func.count(Task.id).label("value")).where(
+                Task.completed_at >= datetime.combine(start, time.min),
+                Task.completed_at < datetime.combine(end + timedelta(days=1), time.min),
+            ),
+            current_user,
+        ),
+        Task.completed_at, completions_key,
+    )
+
+    position = {day: i for i, day in enumerate(buckets)}
+    series: Dict[Any, Dict[str, list]] = {}
+
+    def row_for(key):
+        if key not in series:
+            series[key] = {"hours": [0.0] * len(buckets), "completions": [0] * len(buckets)}
+        return series[key]
+
+    if breakdown is None:
+        row_for(None)
+    for metric, query in (("hours", hours_query), ("completions", completions_query)):
+        for row in await db.execute(query):
+            key = row.key if breakdown is not None else None
+            value = round(row.value / 60, 2) if metric == "hours" else row.value
+            row_for(getattr(key, "value", key))[metric][position[row.bucket]] = value
+
+    # Stable order, with the "none" key (unassigned, no venture) last
+    keys = sorted(series, key=lambda key: (key is None, key if key is not None else 0))
+    return {
+        "bucket": bucket,
+        "breakdown": breakdown,
+        "buckets": buckets,
+        "keys": keys,
+        "hours": [series[key]["hours"] for key in keys],
+        "completions": [series[key]["completions"] for key in keys],
+    }
+
+
+@router.get("/timeseries", response_model=analytics_schema.TimeSeries)
+async def get_timeseries(
+    start: Optional[date] = None,
+    end: Optional[date] = None,
+    bucket: analytics_schema.Bucket = "day",
+    breakdown: Optional[analytics_schema.Breakdown] = None,
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Hours logged and tasks completed per bucket between `start` and `end`
+    (inclusive, default the last 30 days), optionally one series per venture,
+    user, priority or status. Scoped like GET /tasks/; bucketing and grouping
+    run in SQL (two queries, hours from the daily rollup). Cached like the dashboard.
+    """
+    end = end or datetime.utcnow().date()
+    start = start or end - timedelta(days=29)
+    if start > end:
+        raise HTTPException(status_code=400, detail="start must not be after end")
+    if len(bucket_starts(start, end, bucket)) > settings.ANALYTICS_MAX_BUCKETS:
+        raise HTTPException(status_code=400, detail=f"At most {settings.ANALYTICS_MAX_BUCKETS} buckets per request")
+    return await timeseries_cache.get_or_compute(
+        (dashboard_scope(current_user), start, end, bucket, breakdown),
+        lambda: compute_timeseries(db, current_user, start, end, bucket, breakdown),
+    )
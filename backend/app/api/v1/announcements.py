@@ -1,31 +1,42 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
+from sqlalchemy.exc import IntegrityError
 
 from app.api.v1 import deps
-from app.database import get_db
+from app.core.etag import not_modified, table_versions, weak_etag
+from app.database import get_db, get_read_db
+from app.models import loading
 from app.models.announcement import Announcement, AnnouncementAck
 from app.models.user import User, UserRole
 from app.schemas import announcement as announcement_schema
 
-router = APIRouter()
-
-from sqlalchemy.orm import selectinload
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
 @router.get("/", response_model=List[announcement_schema.Announcement])
 async def read_announcements(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Retrieve announcements with acknowledgements.
+    Supports If-None-Match; everyone sees the same list.
     """
+    etag = weak_etag(
+        "announcements", str(request.url.query),
+        *await table_versions(db, "announcements", "announcement_acks", "users"),
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     # Eager load acks and the nested user within acks
-    query = select(Announcement)\
-        .options(selectinload(Announcement.acks).selectinload(AnnouncementAck.user))\
+    query = loading.ANNOUNCEMENT_WITH_ACKS.apply(select(Announcement))\
         .filter(Announcement.is_active == True)\
         .offset(skip).limit(limit)
     
@@ -82,6 +93,16 @@ async def acknowledge_announcement(
     
     ack = AnnouncementAck(announcement_id=id, user_id=current_user.id)
     db.add(ack)
-    await db.commit()
-    await db.refresh(ack)
-    return ack
+    try:
+        await db.commit()
+    except IntegrityError:
+        # Lost a race with a concurrent ack (unique announcement_id, user_id)
+        await db.rollback()
+        raise HTTPException(status_code=400, detail="Already acknowledged")
+    # current_user may come from the principal cache, so load the nested user explicitly
+    result = await db.execute(
+        loading.ACK_WITH_USER.apply(select(AnnouncementAck))
+        .where(AnnouncementAck.id == ack.id)
+        .execution_options(populate_existing=True)
+    )
+    return result.scalars().first()
@@ -5,12 +5,13 @@ from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
+from app.api.v1 import deps
 from app.core import security
 from app.core.config import settings
 from app.database import get_db
 from app.models.user import User
 
-router = APIRouter()
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
 @router.post("/login/access-token")
 async def login_access_token(
@@ -23,8 +24,11 @@ async def login_access_token(
     stmt = select(User).where(User.emp_id == form_data.username)
     result = await db.execute(stmt)
     user = result.scalars().first()
+    # End the read transaction: the connection (the only writer connection in
+    # SQLite production mode) goes back to the pool while bcrypt runs
+    await db.commit()
 
-    if not user or not security.verify_password(form_data.password, user.hashed_password):
+    if not user or not await security.verify_password_async(form_data.password, user.hashed_password):
         raise HTTPException(status_code=400, detail="Incorrect employee ID or password")
     
     if not user.is_active:
@@ -1,13 +1,51 @@
-from typing import Generator, Optional
-from fastapi import Depends, HTTPException, status
+import functools
+import inspect
+from typing import Callable, Generator, Optional
+from fastapi import Depends, HTTPException, Request, Response, status
+from fastapi.routing import APIRoute
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from pydantic import ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 from app.core import security
 from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.models import loading
 from app.models.user import User
-from app.database import get_db
+from app.database import current_user_id, get_db, release_request_sessions, request_sessions
+
+class ReleaseSessionRoute(APIRoute):
+    """
+    Route that closes the request's DB sessions as soon as the endpoint returns,
+    so response serialization does not hold a pooled connection.
+    """
+
+    def __init__(self, path: str, endpoint: Callable, **kwargs):
+        if inspect.iscoroutinefunction(endpoint):
+            original = endpoint
+
+            @functools.wraps(original)
+            async def endpoint(*args, **kwargs):
+                try:
+                    return await original(*args, **kwargs)
+                finally:
+                    await release_request_sessions()
+
+        super().__init__(path, endpoint, **kwargs)
+
+    def get_route_handler(self) -> Callable:
+        handler = super().get_route_handler()
+
+        async def route_handler(request: Request) -> Response:
+            token = request_sessions.set([])
+            user_token = current_user_id.set(None)
+            try:
+                return await handler(request)
+            finally:
+                current_user_id.reset(user_token)
+                request_sessions.reset(token)
+
+        return route_handler
 
 reusable_oauth2 = OAuth2PasswordBearer(
     tokenUrl=f"{settings.API_V1_STR}/login/access-token"
@@ -40,14 +78,27 @@ async def get_current_user(
     # In security.py create_access_token(subject), subject is string.
     
     # Let's query by ID for stability, assuming subject is user.id
-    from sqlalchemy import select
-    result = await db.execute(select(User).where(User.id == int(token_data)))
-    user = result.scalars().first()
-    
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
+    user_id = int(token_data)
+    user = principal_cache.get(user_id, token)
+    if user is None:
+        from sqlalchemy import select
+        result = await db.execute(
+            loading.PRINCIPAL.apply(select(User).where(User.id == user_id))
+        )
+        user = result.scalars().first()
+
+        if not user:
+            raise HTTPException(status_code=404, detail="User not found")
+        # Detach so the cached principal is never flushed by another request's session
+        db.expunge(user)
+        # End the read transaction: the connection (the only writer connection in
+        # SQLite production mode) goes back to the pool until the handler needs one
+        await db.commit()
+        principal_cache.set(user_id, token, user)
+
     if not user.is_active:
         raise HTTPException(status_code=400, detail="Inactive user")
+    current_user_id.set(user.id)
     return user
 
 def get_current_active_user(
@@ -0,0 +1,202 @@
+import csv
+import io
+import json
+from datetime import date, datetime, time, timedelta
+from typing import Any, AsyncIterator, Callable, List, Literal, Optional, Tuple
+
+from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
+from sqlalchemy import Date, DateTime, Enum as SAEnum, String, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.api.v1 import deps
+from app.api.v1.tasks import visible_tasks
+from app.core.config import settings
+from app.database import get_read_db
+from app.models.task import Task
+from app.models.time_log import TimeLog
+from app.models.user import User
+
+# Sessions are released when the endpoint returns; the stream then checks out
+# a connection of its own for exactly as long as it runs (see _stream)
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
+
+ExportFormat = Literal["csv", "jsonl"]
+
+MEDIA_TYPES = {"csv": "text/csv; charset=utf-8", "jsonl": "application/x-ndjson"}
+
+
+class ExportFilters:
+    """Date range (inclusive days), venture and user filters shared by the exports."""
+
+    def __init__(
+        self,
+        start: Optional[date] = None,
+        end: Optional[date] = None,
+        venture_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+    ):
+        if start is not None and end is not None and start > end:
+            raise HTTPException(status_code=400, detail="start must not be after end")
+        self.start = start
+        self.end = end
+        self.venture_id = venture_id
+        self.user_id = user_id
+
+    def between(self, column, query):
+        if self.start is not None:
+            query = query.where(column >= datetime.combine(self.start, time.min))
+        if self.end is not None:
+            query = query.where(column < datetime.combine(self.end + timedelta(days=1), time.min))
+        return query
+
+
+# Spreadsheets run a cell starting with one of these as a formula
+FORMULA_PREFIXES = ("=", "+", "-", "@", "\t", "\r")
+
+
+def _csv_text(value: Optional[str]) -> Optional[str]:
+    # User-entered text (titles, names) is shown literally: a leading ' keeps it a string
+    if value and value.startswith(FORMULA_PREFIXES):
+        return "'" + value
+    return value
+
+
+def _encoders(stmt, fmt: str) -> List[Tuple[int, Callable[[Any], Any]]]:
+    """(position, encoder) for the columns whose values are not plain CSV/JSON scalars."""
+    encoders = []
+    for i, column in enumerate(stmt.selected_columns):
+        if isinstance(column.type, (DateTime, Date)):
+            encoders.append((i, lambda v: v.isoformat() if v is not None else None))
+        elif isinstance(column.type, SAEnum):
+            encoders.append((i, lambda v: v.value if v is not None else None))
+        elif isinstance(column.type, String) and fmt == "csv":
+            encoders.append((i, _csv_text))
+    return encoders
+
+
+def _encode(rows, encoders) -> list:
+    if not encoders:
+        return rows
+    encoded = []
+    for row in rows:
+        row = list(row)
+        for i, encoder in encoders:
+            row[i] = encoder(row[i])
+        encoded.append(row)
+    return encoded
+
+
+async def _stream(db: AsyncSession, stmt, fmt: str) -> AsyncIterator[str]:
+    """
+    Encode `stmt`'s rows as they arrive: a server-side cursor (stream_results)
+    fetches EXPORT_BATCH_SIZE rows per round trip, and plain column rows keep
+    the identity map empty, so memory stays flat however many rows there are.
+    """
+    columns = [column.name for column in stmt.selected_columns]
+    encoders = _encoders(stmt, fmt)
+    try:
+        result = await db.stream(stmt.execution_options(yield_per=settings.EXPORT_BATCH_SIZE))
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer, lineterminator="\n")
+            writer.writerow(columns)
+            async for rows in result.partitions():
+                writer.writerows(_encode(rows, encoders))
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            async for rows in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(columns, row)), separators=(",", ":")) + "\n"
+                    for row in _encode(rows, encoders)
+                )
+    finally:
+        await db.close()
+
+
+def _response(db: AsyncSession, stmt, fmt: str, name: str) -> StreamingResponse:
+    return StreamingResponse(
+        _stream(db, stmt, fmt),
+        media_type=MEDIA_TYPES[fmt],
+        headers={"Content-Disposition": f'attachment; filename="{name}.{fmt}"'},
+    )
+
+
+@router.get("/time-logs")
+async def export_time_logs(
+    format: ExportFormat = "csv",
+    filters: ExportFilters = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Stream time logs (one row each, with task and user) as CSV or JSONL,
+    ordered by start time. Same visibility as GET /tasks/; the date range
+    applies to start_time and venture_id to the user who logged the time.
+    """
+    stmt = visible_tasks(
+        select(
+            TimeLog.id,
+            TimeLog.task_id,
+            Task.title.label("task_title"),
+            TimeLog.user_id,
+            User.emp_id,
+            User.full_name,
+            User.venture_id,
+            TimeLog.start_time,
+            TimeLog.end_time,
+            TimeLog.duration_minutes,
+        )
+        .join(Task, TimeLog.task_id == Task.id)
+        .join(User, TimeLog.user_id == User.id),
+        current_user,
+    )
+    stmt = filters.between(TimeLog.start_time, stmt)
+    if filters.venture_id is not None:
+        stmt = stmt.where(User.venture_id == filters.venture_id)
+    if filters.user_id is not None:
+        stmt = stmt.where(TimeLog.user_id == filters.user_id)
+    return _response(db, stmt.order_by(TimeLog.start_time, TimeLog.id), format, "time-logs")
+
+
+@router.get("/tasks")
+async def export_tasks(
+    format: ExportFormat = "csv",
+    filters: ExportFilters = Depends(),
+    db: AsyncSession = Depends(get_read_db),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Stream tasks with their time totals as CSV or JSONL, ordered by id.
+    Same visibility as GET /tasks/; the date range applies to created_at,
+    venture_id to the task's venture and user_id to the assignee.
+    """
+    stmt = visible_tasks(
+        select(
+            Task.id,
+            Task.title,
+            Task.status,
+            Task.priority,
+            Task.progress,
+            Task.assigned_to_id,
+            Task.venture_id,
+            Task.created_by_id,
+            Task.created_at,
+            Task.due_date,
+            Task.completed_at,
+            Task.total_logged_minutes,
+            Task.time_log_count,
+            Task.last_logged_at,
+        ),
+        current_user,
+    )
+    stmt = filters.between(Task.created_at, stmt)
+    if filters.venture_id is not None:
+        stmt = stmt.where(Task.venture_id == filters.venture_id)
+    if filters.user_id is not None:
+        stmt = stmt.where(Task.assigned_to_id == filters.user_id)
+    return _response(db, stmt.order_by(Task.id), format, "tasks")
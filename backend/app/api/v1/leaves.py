@@ -1,22 +1,23 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, Body
+from fastapi import APIRouter, Depends, HTTPException, Body, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 from datetime import datetime
 
 from app.api.v1 import deps
-from app.database import get_db
+from app.core.etag import not_modified, table_versions, weak_etag
+from app.database import get_db, get_read_db
 from app.models.leave import Leave, Holiday, LeaveStatus
 from app.models.user import User, UserRole
 from app.schemas import leave as leave_schema
 
-router = APIRouter()
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
 # --- Leaves ---
 
 @router.get("/", response_model=List[leave_schema.Leave])
 async def read_leaves(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_user),
@@ -84,11 +85,20 @@ async def update_leave_status(
 
 @router.get("/holidays", response_model=List[leave_schema.Holiday])
 async def read_holidays(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
+    """
+    Retrieve holidays. Supports If-None-Match.
+    """
+    etag = weak_etag("holidays", str(request.url.query), *await table_versions(db, "holidays"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
     result = await db.execute(select(Holiday).offset(skip).limit(limit))
     return result.scalars().all()
 
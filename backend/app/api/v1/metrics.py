@@ -0,0 +1,28 @@
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.api.v1 import deps
+from app.core.hashing import password_hasher
+from app.core.principal_cache import principal_cache
+from app.core.result_cache import dashboard_cache, timeseries_cache
+from app.core.sql_metrics import pool_metrics, sql_metrics
+from app.database import engine
+from app.models.user import User
+
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
+
+@router.get("/")
+async def read_metrics(
+    current_user: User = Depends(deps.get_current_active_admin),
+) -> Any:
+    """
+    Runtime counters of in-process caches, executors and the DB pool (Admin only).
+    """
+    return {
+        "principal_cache": principal_cache.stats(),
+        "dashboard_cache": dashboard_cache.stats(),
+        "timeseries_cache": timeseries_cache.stats(),
+        "password_hashing": password_hasher.stats(),
+        "sql": sql_metrics.stats(),
+        "db_pool": pool_metrics.stats(engine.pool),
+    }
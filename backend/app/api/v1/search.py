@@ -0,0 +1,72 @@
+from typing import Any, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import and_, literal, or_, select, union_all
+
+from app.api.v1 import deps
+from app.api.v1.tasks import visible_tasks
+from app.core.pagination import decode_cursor, encode_cursor
+from app.database import get_read_db
+from app.models.announcement import Announcement, announcement_search
+from app.models.search import fts5_query
+from app.models.task import Task, task_search
+from app.models.user import User
+from app.schemas import search as search_schema
+
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
+
+@router.get("/", response_model=search_schema.SearchPage)
+async def search(
+    db: AsyncSession = Depends(get_read_db),
+    q: str = Query(..., min_length=1, max_length=200),
+    type: Optional[str] = Query(None, pattern="^(task|announcement)$"),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Full-text search over tasks (title, description) and active announcements
+    (title, content), best match first, with keyset pagination.
+    Tasks are limited to the ones GET /tasks/ shows the caller.
+    Paging is best-effort, not a snapshot: the cursor keys on the relevance score,
+    which depends on the whole corpus, so writes between pages shift scores and
+    a later page may skip or repeat hits.
+    """
+    if not fts5_query(q):
+        raise HTTPException(status_code=400, detail="Query has no searchable words")
+    dialect = (await db.connection()).dialect.name
+
+    queries = []
+    if type in (None, "task"):
+        stmt, score = task_search.match(select(Task.__table__), dialect, q)
+        queries.append(visible_tasks(
+            stmt.with_only_columns(literal("task").label("type"), Task.id, Task.title, score.label("score")),
+            current_user,
+        ))
+    if type in (None, "announcement"):
+        stmt, score = announcement_search.match(select(Announcement.__table__), dialect, q)
+        queries.append(
+            stmt.with_only_columns(literal("announcement").label("type"), Announcement.id, Announcement.title, score.label("score"))
+            .where(Announcement.is_active == True)
+        )
+    hits = union_all(*queries).subquery() if len(queries) > 1 else queries[0].subquery()
+
+    query = select(hits)
+    if cursor is not None:
+        try:
+            score, kind, last_id = decode_cursor(cursor, "search")
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(or_(
+            hits.c.score > score,
+            and_(hits.c.score == score, or_(hits.c.type > kind, and_(hits.c.type == kind, hits.c.id > last_id))),
+        ))
+    query = query.order_by(hits.c.score, hits.c.type, hits.c.id).limit(limit + 1)
+
+    rows = (await db.execute(query)).all()
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        next_cursor = encode_cursor("search", [last.score, last.type, last.id])
+    return {"items": [row._mapping for row in rows], "next_cursor": next_cursor}
@@ -1,44 +1,334 @@
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from collections import defaultdict
+from typing import Any, List, Optional, Union
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import and_, case, func, insert, or_, select, update
+from sqlalchemy.orm import aliased
 
 from app.api.v1 import deps
-from app.database import get_db
+from app.core.config import settings
+from app.core.etag import not_modified, table_versions, weak_etag
+from app.core.pagination import decode_cursor, encode_cursor, parse_datetime
+from app.crud.task import sync_task_ventures
+from app.crud.time_log import record_time_logs
+from app.database import get_db, get_read_db
 from datetime import datetime
-from app.models.task import Task, TaskStatus
+from app.models import loading
+from app.models.task import Task, TaskStatus, TaskPriority
 from app.models.user import User, UserRole
 from app.models.time_log import TimeLog
 from app.schemas import task as task_schema
+from app.schemas import time_log as time_log_schema
 
-router = APIRouter()
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
-@router.get("/", response_model=List[task_schema.Task])
-async def read_tasks(
-    db: AsyncSession = Depends(get_db),
-    skip: int = 0,
-    limit: int = 100,
-    current_user: User = Depends(deps.get_current_active_user),
-) -> Any:
+async def _load_tasks(db: AsyncSession, ids: List[int]) -> List[Task]:
+    # Re-read written tasks with exactly the relationships the Task schema renders
+    result = await db.execute(
+        loading.TASK_DETAIL.apply(select(Task).where(Task.id.in_(ids)))
+        .order_by(Task.id)
+        .execution_options(populate_existing=True)
+    )
+    return list(result.scalars().all())
+
+def visible_tasks(query, current_user: User):
     """
-    Retrieve tasks.
-    Manager sees all in venture / created by them.
+    Restrict a Task query to what `current_user` may see.
+    Manager sees tasks assigned within their venture, plus those they created.
     Employee sees assigned to them.
+    Shared by every task read (lists, search, analytics).
     """
-    query = select(Task).offset(skip).limit(limit)
-    
     if current_user.role == UserRole.EMPLOYEE:
         query = query.where(Task.assigned_to_id == current_user.id)
     elif current_user.role == UserRole.MANAGER:
-        # Initial MVP: Manage tasks they created or tasks in their venture (if we link tasks to venture directly, which we didn't, we linked users to venture)
-        # So manager sees tasks where assignee.venture_id == manager.venture_id OR created_by == manager
-        # Simplified: Manager sees all tasks created by them for now
-        query = query.where(Task.created_by_id == current_user.id)
+        # Task.venture_id is the assignee's venture (ix_tasks_venture_id_status);
+        # created_by_id keeps their unassigned and cross-venture tasks visible
+        scope = Task.created_by_id == current_user.id
+        if current_user.venture_id is not None:
+            scope = or_(Task.venture_id == current_user.venture_id, scope)
+        query = query.where(scope)
     # Admin sees all? Or we can add filters
-    
+    return query
+
+class TaskFilters:
+    """Server-side task list filters, shared by the list endpoints."""
+
+    def __init__(
+        self,
+        status: Optional[List[TaskStatus]] = Query(None),
+        priority: Optional[List[TaskPriority]] = Query(None),
+        assignee_id: Optional[int] = None,
+        due_from: Optional[datetime] = None,
+        due_to: Optional[datetime] = None,
+        timer_running: Optional[bool] = None,
+    ):
+        self.status = status
+        self.priority = priority
+        self.assignee_id = assignee_id
+        self.due_from = due_from
+        self.due_to = due_to
+        self.timer_running = timer_running
+
+    def apply(self, query):
+        if self.status:
+            query = query.where(Task.status.in_(self.status))
+        if self.priority:
+            query = query.where(Task.priority.in_(self.priority))
+        if self.assignee_id is not None:
+            query = query.where(Task.assigned_to_id == self.assignee_id)
+        if self.due_from is not None:
+            query = query.where(Task.due_date >= self.due_from)
+        if self.due_to is not None:
+            query = query.where(Task.due_date <= self.due_to)
+        if self.timer_running is not None:
+            query = query.where(
+                Task.active_timer_start.isnot(None) if self.timer_running else Task.active_timer_start.is_(None)
+            )
+        return query
+
+def _parse_include(include: Optional[str]) -> bool:
+    """True when the full time_logs array was requested (include=time_logs)."""
+    fields = {f.strip() for f in (include or "").split(",") if f.strip()}
+    unknown = fields - {"time_logs"}
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown include: {', '.join(sorted(unknown))}")
+    return "time_logs" in fields
+
+def _project(tasks: List[Task], with_time_logs: bool) -> list:
+    schema = task_schema.Task if with_time_logs else task_schema.TaskSummary
+    return [schema.model_validate(task) for task in tasks]
+
+@router.get("/", response_model=List[Union[task_schema.Task, task_schema.TaskSummary]])
+async def read_tasks(
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
+    skip: int = 0,
+    limit: int = 100,
+    include: Optional[str] = None,
+    filters: TaskFilters = Depends(),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve tasks (offset pagination; see /tasks/page for cursors).
+    Returns log summaries; pass include=time_logs for the full log rows.
+    Supports If-None-Match (weak ETag over the caller's visible tasks).
+    """
+    with_time_logs = _parse_include(include)
+    # Watermark of exactly the rows this caller can see; time-log writes bump updated_at
+    watermark = filters.apply(visible_tasks(select(func.count(Task.id), func.max(Task.updated_at)), current_user))
+    count, last_updated = (await db.execute(watermark)).one()
+    etag = weak_etag(
+        "tasks", current_user.id, current_user.role, str(request.url.query),
+        count, last_updated, *await table_versions(db, "users"),
+    )
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
+    profile = loading.TASK_DETAIL if with_time_logs else loading.TASK_SUMMARY
+    query = profile.apply(select(Task)).offset(skip).limit(limit)
+    query = filters.apply(visible_tasks(query, current_user))
+
+    result = await db.execute(query)
+    return _project(result.scalars().all(), with_time_logs)
+
+def _after_due_date(due_date, last_id: int):
+    """Rows after (due_date, id) in due_date-ascending, nulls-last order."""
+    if due_date is None:
+        return and_(Task.due_date.is_(None), Task.id > last_id)
+    due_date = parse_datetime(due_date)
+    return or_(
+        Task.due_date > due_date,
+        and_(Task.due_date == due_date, Task.id > last_id),
+        Task.due_date.is_(None),
+    )
+
+def _keyset(sort: str, cursor: Optional[str]):
+    """
+    Segments to read, in order, for a sort kind: (condition, ORDER BY clauses) pairs,
+    each an index range scan (ix_tasks_updated_at_id, ix_tasks_due_date_id).
+    """
+    if sort == "updated_at":
+        order_by = [Task.updated_at.desc(), Task.id.desc()]
+        if cursor is None:
+            return [(None, order_by)]
+        updated_at, last_id = decode_cursor(cursor, sort)
+        updated_at = parse_datetime(updated_at)
+        return [(or_(
+            Task.updated_at < updated_at,
+            and_(Task.updated_at == updated_at, Task.id < last_id),
+        ), order_by)]
+
+    # due_date ascending, then the tasks without one; a cursor with a null
+    # due_date is already in that second segment
+    dated = [Task.due_date.asc(), Task.id.asc()]
+    undated = (Task.due_date.is_(None), [Task.id.asc()])
+    if cursor is None:
+        return [(Task.due_date.isnot(None), dated), undated]
+    due_date, last_id = decode_cursor(cursor, sort)
+    if due_date is None:
+        return [(and_(Task.due_date.is_(None), Task.id > last_id), [Task.id.asc()])]
+    due_date = parse_datetime(due_date)
+    return [(or_(
+        Task.due_date > due_date,
+        and_(Task.due_date == due_date, Task.id > last_id),
+    ), dated), undated]
+
+@router.get("/page", response_model=task_schema.TaskPage)
+async def read_tasks_page(
+    db: AsyncSession = Depends(get_read_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    sort: str = Query("updated_at", pattern="^(updated_at|due_date)$"),
+    include: Optional[str] = None,
+    filters: TaskFilters = Depends(),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Retrieve tasks with keyset pagination.
+    Pass `next_cursor` from the previous page as `cursor`; it is null on the last page.
+    """
+    with_time_logs = _parse_include(include)
+    try:
+        segments = _keyset(sort, cursor)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    profile = loading.TASK_DETAIL if with_time_logs else loading.TASK_SUMMARY
+    tasks: List[Task] = []
+    # One query per segment, the next only when the page is not full yet
+    for condition, order_by in segments:
+        query = filters.apply(visible_tasks(select(Task), current_user))
+        if condition is not None:
+            query = query.where(condition)
+        query = profile.apply(query).order_by(*order_by).limit(limit + 1 - len(tasks))
+        result = await db.execute(query)
+        tasks.extend(result.scalars().all())
+        if len(tasks) > limit:
+            break
+
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        last = tasks[-1]
+        next_cursor = encode_cursor(sort, [getattr(last, sort), last.id])
+    return {"items": _project(tasks, with_time_logs), "next_cursor": next_cursor}
+
+# Board column order: most urgent first, then soonest due (undated last)
+PRIORITY_ORDER = [TaskPriority.URGENT, TaskPriority.HIGH, TaskPriority.MEDIUM, TaskPriority.LOW]
+priority_rank = case({p: rank for rank, p in enumerate(PRIORITY_ORDER)}, value=Task.priority)
+BOARD_ORDER = [priority_rank, Task.due_date.is_(None), Task.due_date.asc(), Task.id.asc()]
+
+def _board_cursor(task: Task) -> str:
+    return encode_cursor("board", [PRIORITY_ORDER.index(task.priority), task.due_date, task.id])
+
+def _board_column(status: TaskStatus, count: int, tasks: List[Task], limit: int) -> dict:
+    next_cursor = None
+    if len(tasks) > limit:
+        tasks = tasks[:limit]
+        next_cursor = _board_cursor(tasks[-1])
+    return {"status": status, "count": count, "items": _project(tasks, False), "next_cursor": next_cursor}
+
+@router.get("/board", response_model=task_schema.Board)
+async def read_board(
+    db: AsyncSession = Depends(get_read_db),
+    per_column: int = Query(20, ge=1, le=100),
+    filters: TaskFilters = Depends(),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Kanban board: per status column, the total count and the first `per_column`
+    tasks, from one windowed query. Load more of a column with /tasks/board/{column}.
+    """
+    ranked = filters.apply(visible_tasks(select(
+        Task,
+        func.row_number().over(partition_by=Task.status, order_by=BOARD_ORDER).label("position"),
+        func.count().over(partition_by=Task.status).label("column_count"),
+    ), current_user)).subquery()
+    board_task = aliased(Task, ranked)
+    query = loading.TASK_SUMMARY.apply(
+        select(board_task, ranked.c.column_count)
+        .where(ranked.c.position <= per_column + 1)
+        .order_by(ranked.c.status, ranked.c.position),
+        entity=board_task,
+    )
     result = await db.execute(query)
-    tasks = result.scalars().all()
-    return tasks
+
+    statuses = filters.status or list(TaskStatus)
+    tasks = {status: [] for status in statuses}
+    counts = dict.fromkeys(statuses, 0)
+    for task, count in result:
+        tasks[task.status].append(task)
+        counts[task.status] = count
+    return {"columns": [_board_column(status, counts[status], tasks[status], per_column) for status in statuses]}
+
+@router.get("/board/{column}", response_model=task_schema.BoardColumn)
+async def read_board_column(
+    column: TaskStatus,
+    db: AsyncSession = Depends(get_read_db),
+    cursor: Optional[str] = None,
+    limit: int = Query(20, ge=1, le=100),
+    filters: TaskFilters = Depends(),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    One board column, continuing from its `next_cursor`.
+    """
+    scope = filters.apply(visible_tasks(select(Task).where(Task.status == column), current_user))
+    query = scope
+    if cursor is not None:
+        try:
+            rank, due_date, last_id = decode_cursor(cursor, "board")
+            after_cursor = or_(
+                priority_rank > rank,
+                and_(priority_rank == rank, _after_due_date(due_date, last_id)),
+            )
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(after_cursor)
+    query = loading.TASK_SUMMARY.apply(query).order_by(*BOARD_ORDER).limit(limit + 1)
+    tasks = list((await db.execute(query)).scalars().all())
+
+    count = (await db.execute(scope.with_only_columns(func.count(Task.id)))).scalar()
+    return _board_column(column, count, tasks, limit)
+
+@router.get("/{id}/time-logs", response_model=time_log_schema.TimeLogPage)
+async def read_task_time_logs(
+    *,
+    db: AsyncSession = Depends(get_read_db),
+    id: int,
+    cursor: Optional[str] = None,
+    limit: int = Query(50, ge=1, le=500),
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Time logs of a task, newest first, with keyset pagination.
+    """
+    result = await db.execute(visible_tasks(select(Task.id).where(Task.id == id), current_user))
+    if result.scalar() is None:
+        raise HTTPException(status_code=404, detail="Task not found")
+
+    query = select(TimeLog).where(TimeLog.task_id == id)
+    if cursor is not None:
+        try:
+            start_time, last_id = decode_cursor(cursor, "time_logs")
+            start_time = parse_datetime(start_time)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        query = query.where(or_(
+            TimeLog.start_time < start_time,
+            and_(TimeLog.start_time == start_time, TimeLog.id < last_id),
+        ))
+    query = query.order_by(TimeLog.start_time.desc(), TimeLog.id.desc()).limit(limit + 1)
+
+    result = await db.execute(query)
+    logs = list(result.scalars().all())
+    next_cursor = None
+    if len(logs) > limit:
+        logs = logs[:limit]
+        next_cursor = encode_cursor("time_logs", [logs[-1].start_time, logs[-1].id])
+    return {"items": logs, "next_cursor": next_cursor}
 
 @router.post("/", response_model=List[task_schema.Task])
 async def create_task(
@@ -48,41 +338,43 @@ async def create_task(
     current_user: User = Depends(deps.get_current_active_manager), # Manager/Admin only
 ) -> Any:
     """
-    Create new task(s).
+    Create new task(s), one per assignee.
+    Set-based: one query for the assignees and one multi-row INSERT ... RETURNING,
+    however many assignees there are.
     """
-    created_tasks = []
-    
-    # If assigned_to_ids is provided, create a task for each
-    target_ids = task_in.assigned_to_ids if task_in.assigned_to_ids else []
-    if task_in.assigned_to_id:
-        target_ids.append(task_in.assigned_to_id)
-        
-    # Deduplicate
-    target_ids = list(set(target_ids))
-    
-    if not target_ids:
-         # Create unassigned task? Or just raise error? Let's assume at least one assignee for now
-         # OR create one unassigned task
-        task_data = task_in.model_dump(exclude={"assigned_to_ids", "assigned_to_id"})
-        task = Task(**task_data, created_by_id=current_user.id)
-        db.add(task)
-        created_tasks.append(task)
-    else:
-        task_base_data = task_in.model_dump(exclude={"assigned_to_ids", "assigned_to_id"})
-        for uid in target_ids:
-            task = Task(
-                **task_base_data,
-                assigned_to_id=uid,
-                created_by_id=current_user.id
-            )
-            db.add(task)
-            created_tasks.append(task)
+    # Deduplicate, keeping request order
+    target_ids = list(dict.fromkeys(
+        task_in.assigned_to_ids + ([task_in.assigned_to_id] if task_in.assigned_to_id else [])
+    ))
+
+    assignees = {}
+    if target_ids:
+        result = await db.execute(select(User.id, User.full_name, User.venture_id).where(User.id.in_(target_ids)))
+        assignees = {row.id: row for row in result}
+        missing = [uid for uid in target_ids if uid not in assignees]
+        if missing:
+            raise HTTPException(status_code=404, detail=f"Assignee(s) not found: {', '.join(map(str, missing))}")
 
+    now = datetime.utcnow()
+    task_data = task_in.model_dump(exclude={"assigned_to_ids", "assigned_to_id"})
+    task_data.update(created_by_id=current_user.id, created_at=now, updated_at=now)
+    task_data["completed_at"] = now if task_in.status == TaskStatus.COMPLETED else None
+    # No assignee: a single unassigned task
+    rows = [
+        {**task_data, "assigned_to_id": uid, "venture_id": assignees[uid].venture_id} for uid in target_ids
+    ] or [{**task_data, "assigned_to_id": None, "venture_id": None}]
+
+    # executemany + RETURNING is sent as batched multi-row INSERTs (insertmanyvalues).
+    # Each returned row carries its assignee, so RETURNING order does not matter.
+    result = await db.execute(insert(Task).returning(*Task.__table__.c), rows)
+    created = sorted((dict(row._mapping) for row in result), key=lambda task: task["id"])
     await db.commit()
-    for t in created_tasks:
-        await db.refresh(t)
-        
-    return created_tasks
+
+    for task in created:
+        assignee = assignees.get(task["assigned_to_id"])
+        task["assignee"] = {"id": assignee.id, "full_name": assignee.full_name} if assignee else None
+        task["time_logs"] = []
+    return created
 
 @router.put("/{id}", response_model=task_schema.Task)
 async def update_task(
@@ -112,38 +404,148 @@ async def update_task(
     update_data = task_in.model_dump(exclude_unset=True)
     for field, value in update_data.items():
         setattr(task, field, value)
+    if "status" in update_data:
+        # Stays stamped while the task stays completed
+        task.completed_at = (task.completed_at or datetime.utcnow()) if task.status == TaskStatus.COMPLETED else None
         
     db.add(task)
+    if "assigned_to_id" in update_data:
+        await db.flush()
+        await sync_task_ventures(db, task_ids=[task.id])
     await db.commit()
-    await db.refresh(task)
-    return task
+    return (await _load_tasks(db, [task.id]))[0]
 
-@router.post("/{id}/timer/start", response_model=task_schema.Task)
-async def start_timer(
+@router.post("/bulk", response_model=List[task_schema.Task])
+async def bulk_update_tasks(
     *,
     db: AsyncSession = Depends(get_db),
-    id: int,
+    bulk_in: task_schema.TaskBulkUpdate,
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Start timer for a task.
+    Update many tasks at once, all or nothing.
+    Same rules as PUT /tasks/{id}, checked in one query; one UPDATE per distinct patch.
     """
-    result = await db.execute(select(Task).where(Task.id == id))
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
+    if bulk_in.items and (bulk_in.ids or bulk_in.patch is not None):
+        raise HTTPException(status_code=400, detail="Send either ids with a patch or items, not both")
+    if bulk_in.items:
+        patches = [(item.id, item.model_dump(exclude_unset=True, exclude={"id"})) for item in bulk_in.items]
+    elif bulk_in.patch is not None:
+        patch = bulk_in.patch.model_dump(exclude_unset=True)
+        patches = [(task_id, patch) for task_id in bulk_in.ids]
+    else:
+        raise HTTPException(status_code=400, detail="Nothing to update")
+
+    ids = [task_id for task_id, _ in patches]
+    if len(set(ids)) != len(ids):
+        raise HTTPException(status_code=400, detail="Duplicate task id")
+    if len(ids) > settings.TASK_BULK_UPDATE_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {settings.TASK_BULK_UPDATE_MAX} tasks per request")
+
+    result = await db.execute(select(Task.id, Task.assigned_to_id).where(Task.id.in_(ids)))
+    assignee_of = {row.id: row.assigned_to_id for row in result}
+    missing = [task_id for task_id in ids if task_id not in assignee_of]
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Task(s) not found: {', '.join(map(str, missing))}")
+    if current_user.role == UserRole.EMPLOYEE and any(a != current_user.id for a in assignee_of.values()):
+        raise HTTPException(status_code=403, detail="Not enough permissions")
+
+    # Group tasks sharing an identical patch
+    groups = defaultdict(list)
+    for task_id, patch in patches:
+        if patch:
+            groups[tuple(sorted(patch.items()))].append(task_id)
+    reassigned = []
+    now = datetime.utcnow()
+    for key, task_ids in groups.items():
+        patch = dict(key)
+        values = dict(patch)
+        if "status" in patch:
+            values["completed_at"] = func.coalesce(Task.completed_at, now) if patch["status"] == TaskStatus.COMPLETED else None
+        await db.execute(
+            update(Task).where(Task.id.in_(task_ids)).values(**values)
+            .execution_options(synchronize_session=False)
+        )
+        if "assigned_to_id" in patch:
+            reassigned += task_ids
+    if reassigned:
+        await sync_task_ventures(db, task_ids=reassigned)
+    await db.commit()
+    return await _load_tasks(db, ids)
 
+def _timer_conditions(id: int, current_user: User) -> list:
+    # Employees may only track time on their own tasks
+    conditions = [Task.id == id]
+    if current_user.role == UserRole.EMPLOYEE:
+        conditions.append(Task.assigned_to_id == current_user.id)
+    return conditions
+
+async def _timer_conflict(db: AsyncSession, id: int, current_user: User, running: bool) -> HTTPException:
+    """Why a timer compare-and-set matched no row; only queried on that failure path."""
+    result = await db.execute(select(Task.assigned_to_id).where(Task.id == id))
+    task = result.first()
+    if task is None:
+        return HTTPException(status_code=404, detail="Task not found")
     if current_user.role == UserRole.EMPLOYEE and task.assigned_to_id != current_user.id:
-        raise HTTPException(status_code=403, detail="Not permitted to track time for this task")
+        return HTTPException(status_code=403, detail="Not permitted to track time for this task")
+    return HTTPException(status_code=400, detail="Timer is already running" if running else "Timer is not running")
 
-    if task.active_timer_start:
-        raise HTTPException(status_code=400, detail="Timer is already running")
+async def _stop_timers(db: AsyncSession, conditions: list, user_id: int, end_time: datetime) -> List[int]:
+    """
+    Stop every running timer matching `conditions` with one conditional
+    UPDATE ... RETURNING and log the time to `user_id`. Returns the stopped task ids.
+    A concurrent stop of the same timer matches no row, so time is logged once.
+    """
+    result = await db.execute(
+        update(Task)
+        .where(Task.active_timer_start.isnot(None), *conditions)
+        # SET reads pre-update values: the old start lands in last_timer_started_at
+        .values(active_timer_start=None, active_timer_user_id=None, last_timer_started_at=Task.active_timer_start)
+        .returning(Task.id, Task.last_timer_started_at)
+        .execution_options(synchronize_session=False)
+    )
+    stopped = result.all()
+    await record_time_logs(db, [{
+        "task_id": task.id,
+        "user_id": user_id,
+        "start_time": task.last_timer_started_at,
+        "end_time": end_time,
+        "duration_minutes": int((end_time - task.last_timer_started_at).total_seconds() / 60),
+    } for task in stopped])
+    return [task.id for task in stopped]
 
-    task.active_timer_start = datetime.utcnow()
-    db.add(task)
+@router.post("/{id}/timer/start", response_model=task_schema.Task)
+async def start_timer(
+    *,
+    db: AsyncSession = Depends(get_db),
+    id: int,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Start timer for a task (compare-and-set: only if none is running).
+    With TIMER_SINGLE_ACTIVE_PER_USER, the user's other running timer is stopped first.
+    """
+    now = datetime.utcnow()
+    if settings.TIMER_SINGLE_ACTIVE_PER_USER:
+        if (await db.connection()).dialect.name != "sqlite":
+            # Serialize this user's starts; on SQLite the UPDATE below already holds the write lock
+            await db.execute(select(User.id).where(User.id == current_user.id).with_for_update())
+        await _stop_timers(db, [Task.active_timer_user_id == current_user.id, Task.id != id], current_user.id, now)
+
+    result = await db.execute(
+        update(Task)
+        .where(Task.active_timer_start.is_(None), *_timer_conditions(id, current_user))
+        .values(active_timer_start=now, active_timer_user_id=current_user.id)
+        .returning(Task.id)
+        .execution_options(synchronize_session=False)
+    )
+    if result.first() is None:
+        conflict = await _timer_conflict(db, id, current_user, running=True)
+        # Keep the previous timer running if this one cannot start
+        await db.rollback()
+        raise conflict
     await db.commit()
-    await db.refresh(task)
-    return task
+    return (await _load_tasks(db, [id]))[0]
 
 @router.post("/{id}/timer/stop", response_model=task_schema.Task)
 async def stop_timer(
@@ -153,36 +555,9 @@ async def stop_timer(
     current_user: User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
-    Stop timer and log time.
+    Stop timer and log time (compare-and-set: only the first concurrent stop logs).
     """
-    result = await db.execute(select(Task).where(Task.id == id))
-    task = result.scalars().first()
-    if not task:
-        raise HTTPException(status_code=404, detail="Task not found")
-
-    if not task.active_timer_start:
-        raise HTTPException(status_code=400, detail="Timer is not running")
-
-    end_time = datetime.utcnow()
-    start_time = task.active_timer_start
-    
-    # Calculate duration
-    duration = end_time - start_time
-    minutes = int(duration.total_seconds() / 60)
-    
-    # Create TimeLog
-    time_log = TimeLog(
-        task_id=task.id,
-        user_id=current_user.id,
-        start_time=start_time,
-        end_time=end_time,
-        duration_minutes=minutes
-    )
-    db.add(time_log)
-    
-    task.active_timer_start = None
-    db.add(task)
-    
+    if not await _stop_timers(db, _timer_conditions(id, current_user), current_user.id, datetime.utcnow()):
+        raise await _timer_conflict(db, id, current_user, running=False)
     await db.commit()
-    await db.refresh(task)
-    return task
+    return (await _load_tasks(db, [id]))[0]
@@ -0,0 +1,114 @@
+from typing import Any, Dict, List, Tuple
+from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy import select, text
+
+from app.api.v1 import deps
+from app.core.config import settings
+from app.crud.time_log import record_time_logs
+from app.database import get_db
+from app.models.task import Task
+from app.models.time_log import TimeLog
+from app.models.user import User, UserRole
+from app.schemas import time_log as time_log_schema
+
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
+
+def _overlaps(intervals: List[Tuple[Any, Any, str]]) -> List[str]:
+    """Ids of intervals (start, end, id) overlapping another one; touching ends are fine."""
+    clashing = set()
+    ordered = sorted(intervals, key=lambda interval: interval[:2])
+    latest_end, latest_id = None, None
+    for start, end, entry_id in ordered:
+        if latest_end is not None and start < latest_end:
+            clashing.update((entry_id, latest_id))
+        if latest_end is None or end > latest_end:
+            latest_end, latest_id = end, entry_id
+    return sorted(i for i in clashing if i is not None)
+
+async def _serialize_user_writes(db: AsyncSession, user_id: int) -> None:
+    """
+    Hold a per-user lock until commit, so a concurrent batch cannot pass the
+    overlap check between this one's read and insert.
+    """
+    if (await db.connection()).dialect.name != "sqlite":
+        await db.execute(select(User.id).where(User.id == user_id).with_for_update())
+    else:
+        # No row locks: take the database write lock now, before the read, rather than
+        # upgrading a read transaction later (SQLITE_BUSY under WAL). A no-op text
+        # UPDATE is not tracked as a write, so caches and table versions are untouched
+        await db.execute(text("UPDATE users SET id = id WHERE id = :id"), {"id": user_id})
+
+@router.post("/batch", response_model=time_log_schema.TimeLogBatchResult)
+async def ingest_time_logs(
+    *,
+    db: AsyncSession = Depends(get_db),
+    batch_in: time_log_schema.TimeLogBatch,
+    current_user: User = Depends(deps.get_current_active_user),
+) -> Any:
+    """
+    Sync time logged offline, all or nothing.
+    Entries already synced (same entry_id) are returned as duplicates and not
+    re-inserted; the rest must not overlap each other or the user's existing logs.
+    """
+    entries = batch_in.entries
+    if len(entries) > settings.TIME_LOG_BATCH_MAX:
+        raise HTTPException(status_code=400, detail=f"At most {settings.TIME_LOG_BATCH_MAX} entries per batch")
+    entry_ids = [e.entry_id for e in entries]
+    if len(set(entry_ids)) != len(entry_ids):
+        raise HTTPException(status_code=400, detail="Duplicate entry_id in batch")
+    invalid = [e.entry_id for e in entries if e.end_time <= e.start_time]
+    if invalid:
+        raise HTTPException(status_code=400, detail=f"end_time must be after start_time: {', '.join(invalid)}")
+
+    # Idempotency: what an earlier sync already stored
+    result = await db.execute(select(TimeLog).where(
+        TimeLog.user_id == current_user.id, TimeLog.client_entry_id.in_(entry_ids)
+    ))
+    duplicates = list(result.scalars().all())
+    synced = {log.client_entry_id for log in duplicates}
+    entries = [e for e in entries if e.entry_id not in synced]
+    if not entries:
+        return {"created": [], "duplicates": duplicates}
+
+    # Permissions for every task in one query, same rule as the timers
+    task_ids = {e.task_id for e in entries}
+    result = await db.execute(select(Task.id, Task.assigned_to_id).where(Task.id.in_(task_ids)))
+    assignee_of: Dict[int, Any] = {row.id: row.assigned_to_id for row in result}
+    missing = sorted(task_ids - assignee_of.keys())
+    if missing:
+        raise HTTPException(status_code=404, detail=f"Task(s) not found: {', '.join(map(str, missing))}")
+    if current_user.role == UserRole.EMPLOYEE and any(assignee_of[t] != current_user.id for t in task_ids):
+        raise HTTPException(status_code=403, detail="Not permitted to track time for this task")
+
+    # Overlaps, within the batch and against the user's logs in the batch's time span
+    await _serialize_user_writes(db, current_user.id)
+    span_start = min(e.start_time for e in entries)
+    span_end = max(e.end_time for e in entries)
+    result = await db.execute(select(TimeLog.start_time, TimeLog.end_time).where(
+        TimeLog.user_id == current_user.id, TimeLog.start_time < span_end, TimeLog.end_time > span_start
+    ))
+    existing = [(row.start_time, row.end_time, None) for row in result]
+    clashing = _overlaps(existing + [(e.start_time, e.end_time, e.entry_id) for e in entries])
+    if clashing:
+        raise HTTPException(status_code=409, detail=f"Overlapping time entries: {', '.join(clashing)}")
+
+    try:
+        # Bulk insert; task totals move in the same transaction
+        created = await record_time_logs(db, [{
+            "task_id": e.task_id,
+            "user_id": current_user.id,
+            "start_time": e.start_time,
+            "end_time": e.end_time,
+            "duration_minutes": int((e.end_time - e.start_time).total_seconds() / 60),
+            "client_entry_id": e.entry_id,
+        } for e in entries])
+        await db.commit()
+    except IntegrityError:
+        # The same entries are being synced by a concurrent request; a retry is a no-op
+        await db.rollback()
+        raise HTTPException(status_code=409, detail="Entries are being synced concurrently, retry")
+    order = {entry_id: i for i, entry_id in enumerate(entry_ids)}
+    created.sort(key=lambda log: order[log.client_entry_id])
+    return {"created": created, "duplicates": duplicates}
@@ -1,20 +1,28 @@
-from typing import Any, List
-from fastapi import APIRouter, Body, Depends, HTTPException, status
+import codecs
+import csv
+import json
+from typing import Any, AsyncIterator, Dict, List, Optional, Set, Tuple
+from fastapi import APIRouter, Body, Depends, File, HTTPException, UploadFile, status
 from fastapi.encoders import jsonable_encoder
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select
+from sqlalchemy import insert, select
 
 from app.api.v1 import deps
 from app.core import security
-from app.database import get_db
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.crud.task import sync_task_ventures
+from app.database import get_db, get_read_db
 from app.models.user import User, UserRole
 from app.schemas import user as user_schema
 
-router = APIRouter()
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
 @router.get("/", response_model=List[user_schema.User])
 async def read_users(
-    db: AsyncSession = Depends(get_db),
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: User = Depends(deps.get_current_active_manager),
@@ -62,6 +70,9 @@ async def create_user(
                 detail="Managers can only create users in their own venture",
             )
     
+    # Hash before touching the database: no connection is held while bcrypt runs
+    hashed_password = await security.get_password_hash_async(user_in.password)
+
     # Check if user exists
     result = await db.execute(select(User).where(User.emp_id == user_in.emp_id))
     existing_user = result.scalars().first()
@@ -73,7 +84,7 @@ async def create_user(
     
     user = User(
         emp_id=user_in.emp_id,
-        hashed_password=security.get_password_hash(user_in.password),
+        hashed_password=hashed_password,
         full_name=user_in.full_name,
         role=user_in.role,
         venture_id=user_in.venture_id,
@@ -84,6 +95,172 @@ async def create_user(
     await db.refresh(user)
     return user
 
+_IMPORT_CHUNK_SIZE = 64 * 1024
+
+async def _read_import_rows(
+    upload: UploadFile, fmt: str
+) -> AsyncIterator[Tuple[int, Any]]:
+    """
+    Yield (row number, record) pairs from a CSV or JSONL upload, reading it in
+    chunks. A record that cannot be parsed is yielded as the error message.
+    CSV fields must not contain embedded newlines.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8-sig")()
+    buffer = ""
+    header: Optional[List[str]] = None
+    row_number = 0
+    while True:
+        chunk = await upload.read(_IMPORT_CHUNK_SIZE)
+        buffer += decoder.decode(chunk, final=not chunk)
+        *lines, buffer = buffer.split("\n")
+        if not chunk:
+            lines.append(buffer)
+        for line in lines:
+            line = line.rstrip("\r")
+            if not line.strip():
+                continue
+            if fmt == "csv":
+                values = next(csv.reader([line]))
+                if header is None:
+                    header = [name.strip() for name in values]
+                    continue
+                row_number += 1
+                # Empty cells fall back to schema defaults
+                yield row_number, {k: v for k, v in zip(header, values) if v != ""}
+            else:
+                row_number += 1
+                try:
+                    yield row_number, json.loads(line)
+                except ValueError as e:
+                    yield row_number, f"Invalid JSON: {e}"
+        if not chunk:
+            break
+
+def _import_permission_error(
+    user_in: user_schema.UserCreate, current_user: User
+) -> Optional[str]:
+    # Same rules as create_user
+    if current_user.role == UserRole.MANAGER:
+        if user_in.role == UserRole.ADMIN:
+            return "Managers cannot create Admins"
+        if user_in.venture_id != current_user.venture_id:
+            return "Managers can only create users in their own venture"
+    return None
+
+async def _import_batch(
+    db: AsyncSession,
+    batch: List[Tuple[int, Any]],
+    current_user: User,
+    seen_emp_ids: Set[str],
+) -> List[user_schema.UserImportRow]:
+    report: Dict[int, user_schema.UserImportRow] = {}
+    candidates: List[Tuple[int, user_schema.UserCreate]] = []
+
+    for row_number, record in batch:
+        if isinstance(record, str):
+            report[row_number] = user_schema.UserImportRow(row=row_number, status="error", error=record)
+            continue
+        emp_id = record.get("emp_id") if isinstance(record, dict) else None
+        try:
+            user_in = user_schema.UserCreate.model_validate(record)
+        except ValidationError as e:
+            errors = "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors())
+            report[row_number] = user_schema.UserImportRow(row=row_number, emp_id=emp_id, status="error", error=errors)
+            continue
+        error = _import_permission_error(user_in, current_user)
+        if error is None and user_in.emp_id in seen_emp_ids:
+            error = "Duplicate Employee ID in upload"
+        if error:
+            report[row_number] = user_schema.UserImportRow(row=row_number, emp_id=user_in.emp_id, status="error", error=error)
+            continue
+        seen_emp_ids.add(user_in.emp_id)
+        candidates.append((row_number, user_in))
+
+    # One set-based existence check for the whole batch
+    if candidates:
+        result = await db.execute(
+            select(User.emp_id).where(User.emp_id.in_([u.emp_id for _, u in candidates]))
+        )
+        existing = set(result.scalars().all())
+        for row_number, user_in in candidates:
+            if user_in.emp_id in existing:
+                report[row_number] = user_schema.UserImportRow(
+                    row=row_number, emp_id=user_in.emp_id, status="error",
+                    error="The user with this Employee ID already exists in the system.",
+                )
+        candidates = [(n, u) for n, u in candidates if u.emp_id not in existing]
+        # End the read transaction: the connection goes back to the pool while the
+        # batch hashes; a row inserted meanwhile surfaces as the IntegrityError below
+        await db.commit()
+
+    if candidates:
+        hashes = await security.get_password_hashes([u.password for _, u in candidates])
+        values = [
+            {
+                "emp_id": user_in.emp_id,
+                "hashed_password": hashed_password,
+                "full_name": user_in.full_name,
+                "role": user_in.role,
+                "venture_id": user_in.venture_id,
+                "is_active": user_in.is_active,
+            }
+            for (_, user_in), hashed_password in zip(candidates, hashes)
+        ]
+        try:
+            result = await db.execute(
+                insert(User).values(values).returning(User.id, User.emp_id)
+            )
+            ids = {emp_id: user_id for user_id, emp_id in result.all()}
+            await db.commit()
+        except IntegrityError:
+            # Lost a race with a concurrent insert; report the batch rather than guess
+            await db.rollback()
+            for row_number, user_in in candidates:
+                report[row_number] = user_schema.UserImportRow(
+                    row=row_number, emp_id=user_in.emp_id, status="error",
+                    error="Conflicting Employee ID, batch was not imported",
+                )
+        else:
+            for row_number, user_in in candidates:
+                report[row_number] = user_schema.UserImportRow(
+                    row=row_number, emp_id=user_in.emp_id, status="created", id=ids[user_in.emp_id]
+                )
+
+    return [report[row_number] for row_number, _ in batch]
+
+@router.post("/import", response_model=user_schema.UserImportReport)
+async def import_users(
+    *,
+    db: AsyncSession = Depends(get_db),
+    file: UploadFile = File(...),
+    format: Optional[str] = None,
+    current_user: User = Depends(deps.get_current_active_manager),
+) -> Any:
+    """
+    Bulk create users from a CSV (with header row) or JSONL upload.
+    Rows are processed in batches; each row is reported as created or error.
+    """
+    fmt = (format or "").lower()
+    if not fmt:
+        filename = (file.filename or "").lower()
+        fmt = "jsonl" if filename.endswith((".jsonl", ".ndjson")) or file.content_type == "application/x-ndjson" else "csv"
+    if fmt not in ("csv", "jsonl"):
+        raise HTTPException(status_code=400, detail="Unsupported format, use csv or jsonl")
+
+    rows: List[user_schema.UserImportRow] = []
+    seen_emp_ids: Set[str] = set()
+    batch: List[Tuple[int, Any]] = []
+    async for row in _read_import_rows(file, fmt):
+        batch.append(row)
+        if len(batch) >= settings.USER_IMPORT_BATCH_SIZE:
+            rows.extend(await _import_batch(db, batch, current_user, seen_emp_ids))
+            batch = []
+    if batch:
+        rows.extend(await _import_batch(db, batch, current_user, seen_emp_ids))
+
+    created = sum(1 for r in rows if r.status == "created")
+    return user_schema.UserImportReport(created=created, failed=len(rows) - created, rows=rows)
+
 @router.put("/{user_id}", response_model=user_schema.User)
 async def update_user(
     *,
@@ -125,7 +302,7 @@ async def update_user(
     
     update_data = user_in.model_dump(exclude_unset=True)
     if "password" in update_data and update_data["password"]:
-        hashed_password = security.get_password_hash(update_data["password"])
+        hashed_password = await security.get_password_hash_async(update_data["password"])
         del update_data["password"]
         update_data["hashed_password"] = hashed_password
         
@@ -133,7 +310,13 @@ async def update_user(
         setattr(user, field, value)
 
     db.add(user)
+    if "venture_id" in update_data:
+        # Their tasks move with them
+        await db.flush()
+        await sync_task_ventures(db, assignee_ids=[user.id])
     await db.commit()
+    # Drop cached principals so role/active changes apply on the next request
+    principal_cache.invalidate(user.id)
     await db.refresh(user)
     return user
 
@@ -1,25 +1,34 @@
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
 from app.api.v1 import deps
-from app.database import get_db
+from app.core.etag import not_modified, table_versions, weak_etag
+from app.database import get_db, get_read_db
 from app.models.venture import Venture
 from app.schemas import venture as venture_schema
 
-router = APIRouter()
+router = APIRouter(route_class=deps.ReleaseSessionRoute)
 
 @router.get("/", response_model=List[venture_schema.Venture])
 async def read_ventures(
-    db: AsyncSession = Depends(get_db),
+    request: Request,
+    response: Response,
+    db: AsyncSession = Depends(get_read_db),
     skip: int = 0,
     limit: int = 100,
     current_user: deps.User = Depends(deps.get_current_active_user),
 ) -> Any:
     """
     Retrieve ventures.
+    Supports If-None-Match.
     """
+    etag = weak_etag("ventures", str(request.url.query), *await table_versions(db, "ventures"))
+    cached = not_modified(request, response, etag)
+    if cached is not None:
+        return cached
+
     result = await db.execute(select(Venture).offset(skip).limit(limit))
     ventures = result.scalars().all()
     return ventures
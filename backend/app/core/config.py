@@ -14,6 +14,60 @@ class Settings(BaseSettings):
     POSTGRES_PASSWORD: str = "password"
     POSTGRES_DB: str = "agency_cms"
     DATABASE_URL: str | None = None
+    # Optional read-only replica used by list/read endpoints (get_read_db)
+    READ_DATABASE_URL: str | None = None
+    # After a user's own write, their reads stay on the primary for this long
+    READ_YOUR_WRITES_SECONDS: float = 5
+    # Log every SQL statement (development only, slows everything down)
+    SQL_ECHO: bool = False
+    # Debug mode adds per-request SQL timing headers to responses
+    DEBUG: bool = False
+
+    # Connection pool (ignored for in-memory SQLite)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+
+    # SQLite production mode: WAL + pragmas, one serialized writer connection and
+    # a separate reader pool on the same file (used by get_read_db)
+    SQLITE_PRODUCTION_MODE: bool = False
+    SQLITE_BUSY_TIMEOUT_MS: int = 5000
+    SQLITE_CACHE_SIZE_KB: int = 64000
+    SQLITE_MMAP_SIZE: int = 268435456
+
+    # Authenticated principal cache (0 disables)
+    PRINCIPAL_CACHE_TTL_SECONDS: float = 30
+    PRINCIPAL_CACHE_MAX_SIZE: int = 1024
+
+    # Dashboard and time-series results per visibility scope, dropped on task/time-log commits (0 disables)
+    DASHBOARD_CACHE_TTL_SECONDS: float = 15
+    DASHBOARD_CACHE_MAX_SIZE: int = 1024
+
+    # GET /analytics/timeseries: most buckets one request may ask for
+    ANALYTICS_MAX_BUCKETS: int = 400
+
+    # Streaming exports (GET /exports/*): rows fetched per server-side cursor round trip
+    EXPORT_BATCH_SIZE: int = 1000
+
+    # Password hashing executor: concurrent hashes and how many may wait behind them
+    PASSWORD_HASH_WORKERS: int = 4
+    PASSWORD_HASH_MAX_QUEUE: int = 32
+    # Worker processes for bulk hashing (None = PASSWORD_HASH_WORKERS); counted in the same in-flight budget
+    PASSWORD_HASH_PROCESSES: int | None = None
+
+    # Bulk user import: rows validated, hashed and inserted per batch
+    USER_IMPORT_BATCH_SIZE: int = 500
+
+    # Bulk task update: most tasks one request may change
+    TASK_BULK_UPDATE_MAX: int = 1000
+
+    # Offline time-log sync: most entries per POST /time-logs/batch
+    TIME_LOG_BATCH_MAX: int = 1000
+
+    # One running timer per user: starting another stops (and logs) the previous one
+    TIMER_SINGLE_ACTIVE_PER_USER: bool = False
 
     model_config = SettingsConfigDict(case_sensitive=True, env_file=".env")
 
@@ -0,0 +1,40 @@
+import hashlib
+from typing import Any, Optional, Tuple
+
+from fastapi import Request, Response
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.table_version import TableVersion
+
+
+async def table_versions(db: AsyncSession, *tables: str) -> Tuple[int, ...]:
+    """Change counters of `tables`, in argument order (0 for never-written tables)."""
+    result = await db.execute(
+        select(TableVersion.table_name, TableVersion.version).where(TableVersion.table_name.in_(tables))
+    )
+    versions = dict(result.all())
+    return tuple(versions.get(table, 0) for table in tables)
+
+
+def weak_etag(*parts: Any) -> str:
+    """Weak validator over the watermarks and scope a response depends on."""
+    return 'W/"%s"' % hashlib.sha1(repr(parts).encode()).hexdigest()[:24]
+
+
+def not_modified(request: Request, response: Response, etag: str) -> Optional[Response]:
+    """
+    Tag `response` with `etag`; return a 304 to send instead when the client's
+    If-None-Match already holds it (weak comparison).
+    """
+    # Per-user content: browsers may keep it but must revalidate
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    response.headers.update(headers)
+    header = request.headers.get("if-none-match")
+    if header is None:
+        return None
+    opaque = etag[2:]
+    candidates = [tag.strip() for tag in header.split(",")]
+    if "*" in candidates or any(tag.removeprefix("W/") == opaque for tag in candidates):
+        return Response(status_code=304, headers=headers)
+    return None
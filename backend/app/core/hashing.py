@@ -0,0 +1,116 @@
+import asyncio
+import time
+from concurrent.futures import Future, ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional
+
+from app.core.config import settings
+
+
+class HashingSaturatedError(Exception):
+    pass
+
+
+def _apply(fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+    return [fn(item) for item in items]
+
+
+class PasswordHashExecutor:
+    """
+    Runs password hashing/verification on a dedicated thread pool so the event
+    loop keeps serving other requests. At most `workers` hashes run at once and
+    `max_queue` more may wait; beyond that callers are rejected immediately.
+    Bulk hashing (`map`) uses at most `processes` worker processes (default
+    `workers`), and its chunks count towards `in_flight` so logins shed load
+    while an import keeps the cores busy.
+    """
+
+    def __init__(self, workers: int, max_queue: int, processes: Optional[int] = None):
+        self.workers = workers
+        self.max_queue = max_queue
+        self.processes = processes or workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._process_pool: Optional[ProcessPoolExecutor] = None
+        self.in_flight = 0
+        self.completed = 0
+        self.bulk_completed = 0
+        self.rejected = 0
+        self.queue_wait_total = 0.0
+        self.queue_wait_max = 0.0
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.workers, thread_name_prefix="password-hash"
+            )
+        return self._executor
+
+    def _get_process_pool(self) -> ProcessPoolExecutor:
+        if self._process_pool is None:
+            self._process_pool = ProcessPoolExecutor(max_workers=self.processes)
+        return self._process_pool
+
+    async def map(self, fn: Callable[[Any], Any], items: List[Any]) -> List[Any]:
+        """
+        Apply `fn` to every item across the process pool (bulk hashing).
+        `fn` must be a picklable module-level function.
+        """
+        if not items:
+            return []
+        pool = self._get_process_pool()
+        chunk_size = -(-len(items) // self.processes)
+        chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+        loop = asyncio.get_running_loop()
+        futures = [pool.submit(_apply, fn, chunk) for chunk in chunks]
+        for future in futures:
+            self._track(loop, future)
+        results = await asyncio.gather(*(asyncio.wrap_future(future) for future in futures))
+        self.bulk_completed += len(items)
+        return [value for chunk in results for value in chunk]
+
+    def _track(self, loop: asyncio.AbstractEventLoop, future: Future) -> None:
+        # Released when the job is done (or cancelled before it started), not when its
+        # awaiter goes away: a disconnected client's hash still occupies a worker
+        self.in_flight += 1
+        future.add_done_callback(lambda _: loop.call_soon_threadsafe(self._release))
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+
+    async def run(self, fn: Callable[..., Any], *args: Any) -> Any:
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HashingSaturatedError("Password hashing queue is full")
+
+        submitted_at = time.perf_counter()
+
+        def job():
+            return time.perf_counter() - submitted_at, fn(*args)
+
+        future = self._get_executor().submit(job)
+        self._track(asyncio.get_running_loop(), future)
+        waited, result = await asyncio.wrap_future(future)
+
+        self.completed += 1
+        self.queue_wait_total += waited
+        self.queue_wait_max = max(self.queue_wait_max, waited)
+        return result
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "workers": self.workers,
+            "max_queue": self.max_queue,
+            "processes": self.processes,
+            "in_flight": self.in_flight,
+            "completed": self.completed,
+            "bulk_completed": self.bulk_completed,
+            "rejected": self.rejected,
+            "queue_wait_avg_ms": round(self.queue_wait_total / self.completed * 1000, 3) if self.completed else 0,
+            "queue_wait_max_ms": round(self.queue_wait_max * 1000, 3),
+        }
+
+
+password_hasher = PasswordHashExecutor(
+    workers=settings.PASSWORD_HASH_WORKERS,
+    max_queue=settings.PASSWORD_HASH_MAX_QUEUE,
+    processes=settings.PASSWORD_HASH_PROCESSES,
+)
@@ -0,0 +1,27 @@
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+
+def encode_cursor(kind: str, values: List[Any]) -> str:
+    """Opaque keyset cursor: the sort kind plus the last row's sort values."""
+    payload = [kind] + [v.isoformat() if isinstance(v, datetime) else v for v in values]
+    raw = json.dumps(payload, separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, kind: str) -> List[Any]:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors or another sort kind."""
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(raw)
+    except (ValueError, TypeError):
+        raise ValueError("Malformed cursor")
+    if not isinstance(payload, list) or not payload or payload[0] != kind:
+        raise ValueError("Cursor does not match the requested sort")
+    return payload[1:]
+
+
+def parse_datetime(value: Any) -> Any:
+    return datetime.fromisoformat(value) if isinstance(value, str) else value
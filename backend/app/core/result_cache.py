@@ -0,0 +1,101 @@
+import asyncio
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, Tuple
+
+from app.core.config import settings
+
+
+class ResultCache:
+    """
+    In-process TTL cache for computed results, keyed by scope.
+    Concurrent misses for the same key share one in-flight computation, and
+    `invalidate` drops everything, including results still being computed
+    from data read before the invalidating write.
+    """
+
+    def __init__(self, max_size: int, ttl: float):
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._in_flight: Dict[Hashable, asyncio.Future] = {}
+        self._generation = 0
+        self.hits = 0
+        self.misses = 0
+        self.shared = 0
+        self.invalidations = 0
+
+    async def get_or_compute(self, key: Hashable, compute: Callable[[], Awaitable[Any]]) -> Any:
+        entry = self._entries.get(key)
+        if entry is not None and entry[0] > time.monotonic():
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            self.shared += 1
+            try:
+                # shield: one waiter's cancellation must not cancel the others
+                return await asyncio.shield(in_flight)
+            except asyncio.CancelledError:
+                if not in_flight.cancelled():
+                    raise
+                # The request computing it was cancelled, not this one: compute here
+
+        self.misses += 1
+        generation = self._generation
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        try:
+            value = await compute()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved: waiters re-raise it, nobody else needs to
+            raise
+        finally:
+            if self._in_flight.get(key) is future:
+                del self._in_flight[key]
+        future.set_result(value)
+        if generation == self._generation and self.ttl > 0 and self.max_size > 0:
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+        return value
+
+    def invalidate(self) -> None:
+        self._entries.clear()
+        # Computations started before this point still answer their waiters, but
+        # are neither cached nor joined by later requests
+        self._in_flight.clear()
+        self._generation += 1
+        self.invalidations += 1
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "ttl_seconds": self.ttl,
+            "in_flight": len(self._in_flight),
+            "hits": self.hits,
+            "misses": self.misses,
+            "shared": self.shared,
+            "invalidations": self.invalidations,
+        }
+
+
+dashboard_cache = ResultCache(
+    max_size=settings.DASHBOARD_CACHE_MAX_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
+timeseries_cache = ResultCache(
+    max_size=settings.DASHBOARD_CACHE_MAX_SIZE,
+    ttl=settings.DASHBOARD_CACHE_TTL_SECONDS,
+)
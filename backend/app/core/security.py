@@ -1,8 +1,9 @@
 from datetime import datetime, timedelta
-from typing import Any, Union
+from typing import Any, List, Union
 from jose import jwt
 from passlib.context import CryptContext
 from app.core.config import settings
+from app.core.hashing import password_hasher
 
 pwd_context = CryptContext(schemes=["pbkdf2_sha256", "bcrypt"], deprecated="auto")
 
@@ -12,6 +13,17 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
 def get_password_hash(password: str) -> str:
     return pwd_context.hash(password)
 
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    # Raises HashingSaturatedError when the hashing queue is full
+    return await password_hasher.run(verify_password, plain_password, hashed_password)
+
+async def get_password_hash_async(password: str) -> str:
+    return await password_hasher.run(get_password_hash, password)
+
+async def get_password_hashes(passwords: List[str]) -> List[str]:
+    # Bulk variant for imports: spreads the work over worker processes
+    return await password_hasher.map(get_password_hash, passwords)
+
 def create_access_token(subject: Union[str, Any], expires_delta: timedelta = None) -> str:
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
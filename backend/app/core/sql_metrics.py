@@ -0,0 +1,149 @@
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+
+class RequestQueryStats:
+    """SQL statements executed while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_time = 0.0
+        self.slowest_time = 0.0
+        self.slowest_statement: Optional[str] = None
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_time += elapsed
+        if elapsed > self.slowest_time:
+            self.slowest_time = elapsed
+            self.slowest_statement = statement
+
+    def headers(self) -> Dict[str, str]:
+        headers = {
+            "X-DB-Query-Count": str(self.count),
+            "X-DB-Time-Ms": f"{self.total_time * 1000:.2f}",
+            "X-DB-Slowest-Ms": f"{self.slowest_time * 1000:.2f}",
+        }
+        if self.slowest_statement:
+            headers["X-DB-Slowest-Statement"] = " ".join(self.slowest_statement.split())[:200]
+        return headers
+
+
+class SQLMetrics:
+    """
+    Aggregates RequestQueryStats per route, plus statements run outside a request.
+    """
+
+    def __init__(self):
+        self.routes: Dict[str, Dict[str, Any]] = {}
+        self.background = RequestQueryStats()
+
+    def record_request(self, route: str, stats: RequestQueryStats) -> None:
+        entry = self.routes.setdefault(route, {
+            "requests": 0,
+            "queries": 0,
+            "db_time_ms": 0.0,
+            "max_queries": 0,
+            "max_db_time_ms": 0.0,
+            "slowest_statement_ms": 0.0,
+            "slowest_statement": None,
+        })
+        db_time_ms = stats.total_time * 1000
+        entry["requests"] += 1
+        entry["queries"] += stats.count
+        entry["db_time_ms"] += db_time_ms
+        entry["max_queries"] = max(entry["max_queries"], stats.count)
+        entry["max_db_time_ms"] = max(entry["max_db_time_ms"], db_time_ms)
+        if stats.slowest_time * 1000 > entry["slowest_statement_ms"]:
+            entry["slowest_statement_ms"] = stats.slowest_time * 1000
+            entry["slowest_statement"] = stats.slowest_statement
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "routes": {
+                route: {
+                    **entry,
+                    "avg_queries": round(entry["queries"] / entry["requests"], 2),
+                    "avg_db_time_ms": round(entry["db_time_ms"] / entry["requests"], 3),
+                }
+                for route, entry in self.routes.items()
+            },
+            "background": {
+                "queries": self.background.count,
+                "db_time_ms": round(self.background.total_time * 1000, 3),
+            },
+        }
+
+    def reset(self) -> None:
+        self.routes.clear()
+        self.background = RequestQueryStats()
+
+
+current_query_stats: ContextVar[Optional[RequestQueryStats]] = ContextVar(
+    "current_query_stats", default=None
+)
+sql_metrics = SQLMetrics()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_start_time", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    elapsed = time.perf_counter() - conn.info["query_start_time"].pop()
+    stats = current_query_stats.get()
+    (stats if stats is not None else sql_metrics.background).record(statement, elapsed)
+
+
+def _handle_error(exception_context):
+    # after_cursor_execute does not fire for failed statements
+    conn = exception_context.connection
+    if conn is not None and conn.info.get("query_start_time"):
+        conn.info["query_start_time"].pop()
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach timing hooks to a (sync) engine; pass `async_engine.sync_engine`."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+class PoolMetrics:
+    """Connection checkout wait times, fed by InstrumentedQueuePool."""
+
+    def __init__(self):
+        self.checkouts = 0
+        self.timeouts = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def record_wait(self, elapsed: float, timed_out: bool = False) -> None:
+        if timed_out:
+            self.timeouts += 1
+            return
+        self.checkouts += 1
+        self.wait_total += elapsed
+        self.wait_max = max(self.wait_max, elapsed)
+
+    def stats(self, pool) -> Dict[str, Any]:
+        gauges: Dict[str, Any] = {"pool": type(pool).__name__}
+        # Only queue pools track size/overflow
+        for name in ("size", "checkedin", "checkedout", "overflow"):
+            if hasattr(pool, name):
+                gauges[name] = getattr(pool, name)()
+        return {
+            **gauges,
+            "checkouts": self.checkouts,
+            "timeouts": self.timeouts,
+            "wait_avg_ms": round(self.wait_total / self.checkouts * 1000, 3) if self.checkouts else 0,
+            "wait_max_ms": round(self.wait_max * 1000, 3),
+        }
+
+
+pool_metrics = PoolMetrics()
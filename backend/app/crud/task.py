@@ -0,0 +1,27 @@
+from typing import Iterable, Optional
+
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.models.task import Task
+from app.models.user import User
+
+
+async def sync_task_ventures(
+    db: AsyncSession,
+    *,
+    task_ids: Optional[Iterable[int]] = None,
+    assignee_ids: Optional[Iterable[int]] = None,
+) -> None:
+    """
+    Copy the assignee's venture onto Task.venture_id in one UPDATE, for the given
+    tasks or every task of the given assignees (all tasks when neither is passed).
+    Call after changing an assignment or a user's venture, in the same transaction.
+    """
+    venture_id = select(User.venture_id).where(User.id == Task.assigned_to_id).scalar_subquery()
+    stmt = update(Task).values(venture_id=venture_id).execution_options(synchronize_session=False)
+    if task_ids is not None:
+        stmt = stmt.where(Task.id.in_(list(task_ids)))
+    if assignee_ids is not None:
+        stmt = stmt.where(Task.assigned_to_id.in_(list(assignee_ids)))
+    await db.execute(stmt)
@@ -0,0 +1,175 @@
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from sqlalchemy import bindparam, case, delete, func, insert, select, union_all, update
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.database import mark_changed
+from app.models.task import Task
+from app.models.time_log import TimeLog, TimeLogDaily
+from app.models.user import User
+
+
+async def record_time_logs(db: AsyncSession, logs: List[Dict[str, Any]]) -> List[TimeLog]:
+    """
+    Insert time logs, bump the denormalized counters of their tasks and add them
+    to the time_log_daily rollup, all in the caller's transaction.
+    Every time-log write goes through here.
+    Returns the new logs, in no particular order: asking for input order makes
+    SQLite fall back to one INSERT per row.
+    """
+    if not logs:
+        return []
+    result = await db.execute(insert(TimeLog).returning(TimeLog), logs)
+    created = list(result.scalars().all())
+
+    per_task: Dict[int, Dict[str, Any]] = defaultdict(lambda: {"minutes": 0, "count": 0, "last": None})
+    for log in logs:
+        totals = per_task[log["task_id"]]
+        totals["minutes"] += log["duration_minutes"]
+        totals["count"] += 1
+        if totals["last"] is None or log["end_time"] > totals["last"]:
+            totals["last"] = log["end_time"]
+
+    tasks = Task.__table__
+    stmt = (
+        update(tasks)
+        .where(tasks.c.id == bindparam("b_task_id"))
+        .values(
+            total_logged_minutes=tasks.c.total_logged_minutes + bindparam("b_minutes"),
+            time_log_count=tasks.c.time_log_count + bindparam("b_count"),
+            last_logged_at=case(
+                (tasks.c.last_logged_at.is_(None), bindparam("b_last")),
+                (tasks.c.last_logged_at < bindparam("b_last"), bindparam("b_last")),
+                else_=tasks.c.last_logged_at,
+            ),
+        )
+    )
+    # Core executemany on the session's connection: one statement, one row per task
+    mark_changed(db, Task.__tablename__)
+    connection = await db.connection()
+    await connection.execute(stmt, [
+        {"b_task_id": task_id, "b_minutes": t["minutes"], "b_count": t["count"], "b_last": t["last"]}
+        for task_id, t in per_task.items()
+    ])
+    await _add_to_daily(db, logs)
+    return created
+
+
+async def _add_to_daily(db: AsyncSession, logs: List[Dict[str, Any]]) -> None:
+    per_day: Dict[tuple, Dict[str, int]] = defaultdict(lambda: {"minutes": 0, "count": 0})
+    for log in logs:
+        totals = per_day[(log["start_time"].date(), log["user_id"], log["task_id"])]
+        totals["minutes"] += log["duration_minutes"]
+        totals["count"] += 1
+
+    dialect = (await db.connection()).dialect.name
+    daily = TimeLogDaily.__table__
+    stmt = (postgresql if dialect == "postgresql" else sqlite).insert(daily).values(
+        day=bindparam("b_day"),
+        user_id=bindparam("b_user_id"),
+        task_id=bindparam("b_task_id"),
+        venture_id=select(User.venture_id).where(User.id == bindparam("b_user_id")).scalar_subquery(),
+        minutes=bindparam("b_minutes"),
+        log_count=bindparam("b_count"),
+    )
+    stmt = stmt.on_conflict_do_update(
+        index_elements=[daily.c.day, daily.c.user_id, daily.c.task_id],
+        set_={
+            "minutes": daily.c.minutes + stmt.excluded.minutes,
+            "log_count": daily.c.log_count + stmt.excluded.log_count,
+        },
+    )
+    mark_changed(db, TimeLogDaily.__tablename__)
+    connection = await db.connection()
+    await connection.execute(stmt, [
+        {"b_day": day, "b_user_id": user_id, "b_task_id": task_id, "b_minutes": t["minutes"], "b_count": t["count"]}
+        for (day, user_id, task_id), t in per_day.items()
+    ])
+
+
+def _log_totals():
+    minutes = select(func.coalesce(func.sum(TimeLog.duration_minutes), 0)).where(TimeLog.task_id == Task.id).scalar_subquery()
+    count = select(func.count(TimeLog.id)).where(TimeLog.task_id == Task.id).scalar_subquery()
+    last = select(func.max(TimeLog.end_time)).where(TimeLog.task_id == Task.id).scalar_subquery()
+    return minutes, count, last
+
+
+async def recompute_task_totals(db: AsyncSession, task_ids: Optional[Iterable[int]] = None) -> int:
+    """Rebuild the counters from time_logs (backfill/repair). Returns rows updated."""
+    minutes, count, last = _log_totals()
+    stmt = update(Task).values(
+        total_logged_minutes=minutes,
+        time_log_count=count,
+        last_logged_at=last,
+        updated_at=Task.updated_at,  # a repair is not an edit
+    ).execution_options(synchronize_session=False)
+    if task_ids is not None:
+        stmt = stmt.where(Task.id.in_(list(task_ids)))
+    result = await db.execute(stmt)
+    return result.rowcount
+
+
+async def find_inconsistent_task_totals(db: AsyncSession) -> List[int]:
+    """Ids of tasks whose counters disagree with their time_logs."""
+    minutes, count, last = _log_totals()
+    result = await db.execute(
+        select(Task.id).where(
+            (Task.total_logged_minutes != minutes)
+            | (Task.time_log_count != count)
+            | (func.coalesce(Task.last_logged_at, datetime.min) != func.coalesce(last, datetime.min))
+        )
+    )
+    return list(result.scalars().all())
+
+
+def _daily_from_logs():
+    day = func.date(TimeLog.start_time)
+    return (
+        select(
+            day.label("day"),
+            TimeLog.user_id,
+            TimeLog.task_id,
+            func.sum(TimeLog.duration_minutes).label("minutes"),
+            func.count(TimeLog.id).label("log_count"),
+        )
+        .group_by(day, TimeLog.user_id, TimeLog.task_id)
+    )
+
+
+async def rebuild_time_log_daily(db: AsyncSession) -> int:
+    """
+    Recompute time_log_daily from time_logs (backfill/repair). Venture ids are
+    re-derived from the users' current ventures. Returns rows written.
+    """
+    logs = _daily_from_logs().subquery()
+    await db.execute(delete(TimeLogDaily))
+    result = await db.execute(
+        insert(TimeLogDaily).from_select(
+            ["day", "user_id", "task_id", "venture_id", "minutes", "log_count"],
+            select(logs.c.day, logs.c.user_id, logs.c.task_id, User.venture_id, logs.c.minutes, logs.c.log_count)
+            .join(User, User.id == logs.c.user_id),
+        )
+    )
+    return result.rowcount
+
+
+async def find_inconsistent_time_log_daily(db: AsyncSession) -> int:
+    """Number of (day, user, task) keys where time_log_daily disagrees with time_logs."""
+    expected = _daily_from_logs()
+    stored = select(
+        TimeLogDaily.day, TimeLogDaily.user_id, TimeLogDaily.task_id,
+        TimeLogDaily.minutes, TimeLogDaily.log_count,
+    )
+    # Rows on one side only; a key with wrong totals shows up on both
+    missing = expected.except_(stored).subquery()
+    extra = stored.except_(expected).subquery()
+    differing = union_all(
+        select(missing.c.day, missing.c.user_id, missing.c.task_id),
+        select(extra.c.day, extra.c.user_id, extra.c.task_id),
+    ).subquery()
+    keys = select(differing.c.day, differing.c.user_id, differing.c.task_id).distinct().subquery()
+    result = await db.execute(select(func.count()).select_from(keys))
+    return result.scalar_one()
@@ -1,15 +1,243 @@
+import time
+from contextvars import ContextVar
+from itertools import chain
+from typing import Callable, Dict, List, Optional, Set
+
+from sqlalchemy import event, exc, text
 from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.orm import Session, sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool
 from app.core.config import settings
+from app.core.sql_metrics import instrument_engine, pool_metrics
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    # Records how long callers wait for a connection (see /metrics)
+    def _do_get(self):
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()
+        except exc.TimeoutError:
+            pool_metrics.record_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        pool_metrics.record_wait(time.perf_counter() - started)
+        return connection
+
+
+def engine_options(url: str, single_writer: bool = False) -> dict:
+    options = {"echo": settings.SQL_ECHO, "future": True}
+    if ":memory:" not in url:
+        options.update(
+            poolclass=InstrumentedQueuePool,
+            # A one-connection pool queues write transactions FIFO
+            pool_size=1 if single_writer else settings.DB_POOL_SIZE,
+            max_overflow=0 if single_writer else settings.DB_MAX_OVERFLOW,
+            pool_timeout=settings.DB_POOL_TIMEOUT,
+            pool_recycle=settings.DB_POOL_RECYCLE,
+            pool_pre_ping=settings.DB_POOL_PRE_PING,
+        )
+    return options
+
+
+def is_sqlite_file(url: str) -> bool:
+    return url.startswith("sqlite") and ":memory:" not in url
+
+
+def configure_sqlite(sync_engine, read_only: bool = False) -> None:
+    """Apply the production-mode pragmas to every new connection of `sync_engine`."""
+    pragmas = [
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        f"PRAGMA busy_timeout={settings.SQLITE_BUSY_TIMEOUT_MS}",
+        f"PRAGMA cache_size=-{settings.SQLITE_CACHE_SIZE_KB}",
+        f"PRAGMA mmap_size={settings.SQLITE_MMAP_SIZE}",
+    ]
+    if read_only:
+        pragmas.append("PRAGMA query_only=ON")
+
+    @event.listens_for(sync_engine, "connect")
+    def _apply_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for pragma in pragmas:
+            cursor.execute(pragma)
+        cursor.close()
+
+
+DATABASE_URL = settings.get_database_url()
+SQLITE_PRODUCTION = settings.SQLITE_PRODUCTION_MODE and is_sqlite_file(DATABASE_URL)
+
+engine = create_async_engine(DATABASE_URL, **engine_options(DATABASE_URL, single_writer=SQLITE_PRODUCTION))
+instrument_engine(engine.sync_engine)
+
+read_engine = None
+if settings.READ_DATABASE_URL:
+    read_engine = create_async_engine(settings.READ_DATABASE_URL, **engine_options(settings.READ_DATABASE_URL))
+    instrument_engine(read_engine.sync_engine)
+elif SQLITE_PRODUCTION:
+    # WAL readers never wait on the writer, so reads get their own pool on the same file
+    read_engine = create_async_engine(DATABASE_URL, **engine_options(DATABASE_URL))
+    instrument_engine(read_engine.sync_engine)
+
+if SQLITE_PRODUCTION:
+    configure_sqlite(engine.sync_engine)
+    if read_engine is not None and is_sqlite_file(str(read_engine.url)):
+        configure_sqlite(read_engine.sync_engine, read_only=True)
+
+# Set by deps.get_current_user; used to route a user's reads after their own writes
+current_user_id: ContextVar[Optional[int]] = ContextVar("current_user_id", default=None)
+
+
+class ReadYourWrites:
+    """Users whose reads are pinned to the primary until their last write is `window` seconds old."""
+
+    def __init__(self, window: float):
+        self.window = window
+        self._pinned_until: Dict[int, float] = {}
+
+    def pin(self, user_id: Optional[int]) -> None:
+        if user_id is None:
+            return
+        now = time.monotonic()
+        if len(self._pinned_until) > 10000:
+            self._pinned_until = {k: v for k, v in self._pinned_until.items() if v > now}
+        self._pinned_until[user_id] = now + self.window
+
+    def is_pinned(self, user_id: Optional[int]) -> bool:
+        return self._pinned_until.get(user_id, 0) > time.monotonic()
+
+
+# A reader pool on the primary's own file sees every commit, so nothing to pin
+read_your_writes = ReadYourWrites(
+    0 if SQLITE_PRODUCTION and not settings.READ_DATABASE_URL else settings.READ_YOUR_WRITES_SECONDS
+)
+
+
+class PrimarySession(Session):
+    pass
+
+
+def mark_changed(session, *tables: str) -> None:
+    """Record tables written outside the ORM (Core on the session's connection)."""
+    if isinstance(session, AsyncSession):
+        session = session.sync_session
+    session.info["has_writes"] = True
+    session.info.setdefault("changed_tables", set()).update(tables)
+
+
+# Called after each commit with the tables it wrote (e.g. to drop in-process caches)
+commit_hooks: List[Callable[[Set[str]], None]] = []
+
+# Tables whose change counter some ETag reads (core.etag.table_versions). Only these
+# are bumped: a counter row is locked until commit, so bumping hot tables (tasks,
+# time logs) would serialize every write behind it. Those use max(updated_at) instead.
+VERSIONED_TABLES = frozenset({"announcement_acks", "announcements", "holidays", "users", "ventures"})
+
+# Upsert, so a counter missing its seed row cannot fail a commit on a duplicate key
+_BUMP_TABLE_VERSION = text(
+    "INSERT INTO table_versions (table_name, version) VALUES (:name, 1) "
+    "ON CONFLICT (table_name) DO UPDATE SET version = table_versions.version + 1"
+)
+
+
+@event.listens_for(PrimarySession, "after_flush")
+def _flag_flush(session, flush_context):
+    mark_changed(session, *{
+        obj.__table__.name for obj in chain(session.new, session.dirty, session.deleted)
+    })
+
+
+@event.listens_for(PrimarySession, "do_orm_execute")
+def _flag_dml(orm_execute_state):
+    if orm_execute_state.is_insert or orm_execute_state.is_update or orm_execute_state.is_delete:
+        mark_changed(orm_execute_state.session, orm_execute_state.statement.table.name)
+
+
+@event.listens_for(PrimarySession, "before_commit")
+def _bump_table_versions(session):
+    # Flush first so the bump sees everything this transaction wrote
+    session.flush()
+    tables = session.info.pop("changed_tables", None)
+    if not tables:
+        return
+    session.info["committed_tables"] = tables
+    versioned = tables & VERSIONED_TABLES
+    if not versioned:
+        return
+    connection = session.connection()
+    # Sorted, so concurrent transactions lock the counter rows in the same order
+    for name in sorted(versioned):
+        connection.execute(_BUMP_TABLE_VERSION, {"name": name})
+
+
+@event.listens_for(PrimarySession, "after_commit")
+def _pin_writer(session):
+    if session.info.pop("has_writes", False):
+        read_your_writes.pin(current_user_id.get())
+    tables = session.info.pop("committed_tables", None)
+    if tables:
+        for hook in commit_hooks:
+            hook(tables)
+
+
+@event.listens_for(PrimarySession, "after_rollback")
+def _clear_writes(session):
+    session.info.pop("has_writes", None)
+    session.info.pop("changed_tables", None)
+    session.info.pop("committed_tables", None)
+
+
+class ReadRoutingSession(Session):
+    """
+    Session behind get_read_db. The bind is picked on first use, after the
+    endpoint's auth dependency ran: the replica, unless none is configured,
+    the current user wrote recently, or the session itself is flushing.
+    """
+
+    def get_bind(self, mapper=None, clause=None, **kw):
+        if (
+            read_engine is None
+            or self._flushing
+            or read_your_writes.is_pinned(current_user_id.get())
+        ):
+            return engine.sync_engine
+        return read_engine.sync_engine
 
-engine = create_async_engine(settings.get_database_url(), echo=True, future=True)
 
 AsyncSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine, class_=AsyncSession, sync_session_class=PrimarySession, expire_on_commit=False
+)
+
+ReadSessionLocal = sessionmaker(
+    class_=AsyncSession, sync_session_class=ReadRoutingSession, expire_on_commit=False
 )
 
 Base = declarative_base()
 
+# Sessions opened by get_db for the current request, closed once the endpoint returns
+request_sessions: ContextVar[Optional[List[AsyncSession]]] = ContextVar(
+    "request_sessions", default=None
+)
+
 async def get_db():
+    # AsyncSession only checks out a connection on its first query
     async with AsyncSessionLocal() as session:
+        sessions = request_sessions.get()
+        if sessions is not None:
+            sessions.append(session)
         yield session
+
+async def get_read_db():
+    # For read-only endpoints; see ReadRoutingSession
+    async with ReadSessionLocal() as session:
+        sessions = request_sessions.get()
+        if sessions is not None:
+            sessions.append(session)
+        yield session
+
+async def release_request_sessions() -> None:
+    """
+    Return the request's connections to the pool before the response is serialized.
+    Loaded objects stay readable; anything not loaded raises as usual.
+    """
+    for session in request_sessions.get() or []:
+        await session.close()
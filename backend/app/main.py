@@ -1,6 +1,9 @@
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import JSONResponse
 from app.core.config import settings
+from app.core.hashing import HashingSaturatedError
+from app.core.sql_metrics import RequestQueryStats, current_query_stats, sql_metrics
 from app.api.v1.api import api_router
 
 app = FastAPI(
@@ -18,6 +21,54 @@ app.add_middleware(
 
 app.include_router(api_router, prefix=settings.API_V1_STR)
 
+def _route_template(request: Request) -> str:
+    # Aggregate by path template ("/tasks/{id}") rather than by concrete URL
+    route = request.scope.get("route")
+    if route is None:
+        return "<unmatched>"
+    # An included router's route.path is relative to its prefix: put back the
+    # literal part of the URL before the part the route itself matched
+    path = request.scope["path"]
+    for i, char in enumerate(path):
+        if char == "/" and route.path_regex.match(path[i:]):
+            return path[:i] + route.path
+    return route.path
+
+@app.middleware("http")
+async def sql_metrics_middleware(request: Request, call_next):
+    # Collect the SQL executed by this request (see app.core.sql_metrics)
+    stats = RequestQueryStats()
+    token = current_query_stats.set(stats)
+    try:
+        response = await call_next(request)
+    finally:
+        current_query_stats.reset(token)
+
+    # Record once the body is sent: streaming responses (exports) query while it is.
+    # The debug headers go out first, so they only count the queries before the body
+    body = response.body_iterator
+
+    async def recorded_body():
+        try:
+            async for chunk in body:
+                yield chunk
+        finally:
+            sql_metrics.record_request(f"{request.method} {_route_template(request)}", stats)
+
+    response.body_iterator = recorded_body()
+    if settings.DEBUG:
+        response.headers.update(stats.headers())
+    return response
+
+@app.exception_handler(HashingSaturatedError)
+async def hashing_saturated_handler(request: Request, exc: HashingSaturatedError):
+    # Shed load fast instead of queueing behind a burst of logins
+    return JSONResponse(
+        status_code=503,
+        content={"detail": "Authentication service is busy, please retry"},
+        headers={"Retry-After": "1"},
+    )
+
 @app.get("/")
 def root():
     return {"message": "Agency Operations CMS API"}
@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Boolean, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.search import SearchIndex
 from datetime import datetime
 
 class Announcement(Base):
@@ -10,11 +11,11 @@ class Announcement(Base):
     title = Column(String, nullable=False)
     content = Column(String, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
-    is_active = Column(Boolean, default=True)
+    is_active = Column(Boolean, default=True, index=True)
 
     # Optional: Target specific venture? Default is global or all
     
-    acks = relationship("AnnouncementAck", back_populates="announcement")
+    acks = relationship("AnnouncementAck", back_populates="announcement", lazy="raise_on_sql")
 
 class AnnouncementAck(Base):
     __tablename__ = "announcement_acks"
@@ -24,5 +25,13 @@ class AnnouncementAck(Base):
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
     acknowledged_at = Column(DateTime, default=datetime.utcnow)
 
-    announcement = relationship("Announcement", back_populates="acks")
-    user = relationship("User", back_populates="announcement_acks")
+    announcement = relationship("Announcement", back_populates="acks", lazy="raise_on_sql")
+    user = relationship("User", back_populates="announcement_acks", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # One ack per user per announcement; also serves the ack lookups
+        Index("ux_announcement_acks_announcement_id_user_id", "announcement_id", "user_id", unique=True),
+    )
+
+# Full-text search over title/content (GET /search)
+announcement_search = SearchIndex(Announcement.__table__, "title", "content")
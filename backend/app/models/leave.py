@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum as PyEnum, Date
+from sqlalchemy import Column, Integer, String, ForeignKey, DateTime, Enum as PyEnum, Date, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 import enum
@@ -24,7 +24,7 @@ class Leave(Base):
     start_date = Column(Date, nullable=False)
     end_date = Column(Date, nullable=False)
     reason = Column(String, nullable=True)
-    status = Column(PyEnum(LeaveStatus), default=LeaveStatus.PENDING, nullable=False)
+    status = Column(PyEnum(LeaveStatus), default=LeaveStatus.PENDING, nullable=False, index=True)
     
     applied_at = Column(DateTime, default=datetime.utcnow)
     reviewed_at = Column(DateTime, nullable=True)
@@ -33,6 +33,10 @@ class Leave(Base):
     # user = relationship("User", foreign_keys=[user_id], back_populates="leaves")
     # reviewer = relationship("User", foreign_keys=[reviewed_by_id])
 
+    __table_args__ = (
+        Index("ix_leaves_user_id_status", "user_id", "status"),
+    )
+
 class Holiday(Base):
     __tablename__ = "holidays"
     
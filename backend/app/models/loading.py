@@ -0,0 +1,87 @@
+from typing import Any, Callable, FrozenSet, List, Optional, Tuple
+
+from sqlalchemy.orm import selectinload
+
+from app.models.announcement import Announcement, AnnouncementAck
+from app.models.task import Task
+
+
+class UnrequestedLoadError(AssertionError):
+    pass
+
+
+class LoadProfile:
+    """
+    Named set of relationships a query may load.
+    Relationships are lazy="raise_on_sql" on the models, so each query declares
+    what it needs by applying a profile instead of inheriting mapper-wide eager loads.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        *paths: Tuple[Any, ...],
+        extra_options: Optional[Callable[[], List[Any]]] = None,
+    ):
+        self.name = name
+        self.paths = paths
+        self.extra_options = extra_options
+        self._relationships: Optional[FrozenSet[Any]] = None
+
+    def options(self, entity=None) -> list:
+        # `entity`: an aliased(Model) the query selects instead of the model itself
+        options = []
+        for path in self.paths:
+            loader = selectinload(path[0] if entity is None else getattr(entity, path[0].key))
+            for attr in path[1:]:
+                loader = loader.selectinload(attr)
+            options.append(loader)
+        if self.extra_options is not None:
+            options.extend(self.extra_options())
+        return options
+
+    def apply(self, stmt, entity=None):
+        return stmt.options(*self.options(entity)).execution_options(load_profile=self)
+
+    @property
+    def relationships(self) -> FrozenSet[Any]:
+        # Resolved on first use: `.property` needs every mapper configured
+        if self._relationships is None:
+            self._relationships = frozenset(
+                attr.property for path in self.paths for attr in path
+            )
+        return self._relationships
+
+    def allows(self, relationship) -> bool:
+        return relationship in self.relationships
+
+    def __repr__(self) -> str:
+        return f"LoadProfile({self.name!r})"
+
+
+# Profiles, one per response shape
+PRINCIPAL = LoadProfile("principal")
+TASK_SUMMARY = LoadProfile("task_summary", (Task.assignee,))
+TASK_DETAIL = LoadProfile("task_detail", (Task.assignee,), (Task.time_logs,))
+ANNOUNCEMENT_WITH_ACKS = LoadProfile(
+    "announcement_with_acks", (Announcement.acks, AnnouncementAck.user)
+)
+ACK_WITH_USER = LoadProfile("ack_with_user", (AnnouncementAck.user,))
+
+
+def guard_unrequested_loads(orm_execute_state) -> None:
+    """
+    `do_orm_execute` hook (used by the test suite) that fails any relationship
+    load not declared by the profile of the query that triggered it.
+    """
+    if not orm_execute_state.is_relationship_load:
+        return
+    path = orm_execute_state.loader_strategy_path
+    if path is None or len(path) < 2:
+        return
+    relationship = path.natural_path[-1]
+    profile = orm_execute_state.execution_options.get("load_profile")
+    if profile is None or not profile.allows(relationship):
+        raise UnrequestedLoadError(
+            f"Query loaded {relationship} which profile {profile!r} did not request"
+        )
@@ -0,0 +1,87 @@
+import re
+from typing import Any, List, Tuple
+
+from sqlalchemy import DDL, column, event, func, literal_column, table
+
+# Every SearchIndex, so alembic/env.py can leave their DDL out of autogenerate
+search_indexes: List["SearchIndex"] = []
+
+
+class SearchIndex:
+    """
+    Full-text index over a table's `title` and `body` columns, kept in sync by
+    the database itself so ORM and Core writes are both covered:
+    SQLite gets an external-content FTS5 table maintained by triggers,
+    Postgres a generated tsvector column with a GIN index.
+    The DDL runs with the table's CREATE (create_all); see the migration for existing databases.
+    """
+
+    def __init__(self, target, title: str, body: str):
+        self.table = target
+        self.title = title
+        self.body = body
+        self.fts = f"{target.name}_fts"
+        search_indexes.append(self)
+        for statement in self.sqlite_ddl():
+            event.listen(target, "after_create", DDL(statement).execute_if(dialect="sqlite"))
+        # Dropping the content table leaves the FTS table (and stale rowids) behind
+        event.listen(target, "before_drop", DDL(f"DROP TABLE IF EXISTS {self.fts}").execute_if(dialect="sqlite"))
+        for statement in self.postgresql_ddl():
+            event.listen(target, "after_create", DDL(statement).execute_if(dialect="postgresql"))
+
+    def owns(self, obj, name: str, type_: str) -> bool:
+        """True for a reflected object this index's DDL created (FTS5 and its shadow tables, tsvector column, GIN index)."""
+        if type_ == "table":
+            return name == self.fts or name.startswith(f"{self.fts}_")
+        if type_ == "column":
+            return obj.table.name == self.table.name and name == "search_vector"
+        if type_ == "index":
+            return name == f"ix_{self.table.name}_search_vector"
+        return False
+
+    def sqlite_ddl(self) -> List[str]:
+        t, fts, cols = self.table.name, self.fts, f"{self.title}, {self.body}"
+        new = f"new.id, new.{self.title}, new.{self.body}"
+        old = f"'delete', old.id, old.{self.title}, old.{self.body}"
+        return [
+            f"CREATE VIRTUAL TABLE IF NOT EXISTS {fts} USING fts5({cols}, content='{t}', content_rowid='id', tokenize='porter unicode61')",
+            f"CREATE TRIGGER {fts}_ai AFTER INSERT ON {t} BEGIN INSERT INTO {fts}(rowid, {cols}) VALUES ({new}); END",
+            f"CREATE TRIGGER {fts}_ad AFTER DELETE ON {t} BEGIN INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ({old}); END",
+            # Only text edits re-index; timer and status updates leave the index alone
+            f"CREATE TRIGGER {fts}_au AFTER UPDATE OF {cols} ON {t} BEGIN "
+            f"INSERT INTO {fts}({fts}, rowid, {cols}) VALUES ({old}); "
+            f"INSERT INTO {fts}(rowid, {cols}) VALUES ({new}); END",
+        ]
+
+    def postgresql_ddl(self) -> List[str]:
+        t = self.table.name
+        return [
+            f"ALTER TABLE {t} ADD COLUMN search_vector tsvector GENERATED ALWAYS AS ("
+            f"setweight(to_tsvector('english', coalesce({self.title}, '')), 'A') || "
+            f"setweight(to_tsvector('english', coalesce({self.body}, '')), 'B')) STORED",
+            f"CREATE INDEX ix_{t}_search_vector ON {t} USING GIN (search_vector)",
+        ]
+
+    def match(self, stmt, dialect: str, query: str) -> Tuple[Any, Any]:
+        """
+        Restrict `stmt` (selecting from the table) to rows matching `query`.
+        Returns the statement and a score expression; lower scores rank first.
+        """
+        if dialect == "sqlite":
+            fts = table(self.fts, column("rowid"))
+            stmt = stmt.join(fts, fts.c.rowid == self.table.c.id).where(
+                literal_column(self.fts).op("MATCH")(fts5_query(query))
+            )
+            # bm25 is already "lower is better"; titles weigh 10x the body
+            return stmt, func.bm25(literal_column(self.fts), 10.0, 1.0)
+        vector = literal_column(f"{self.table.name}.search_vector")
+        tsquery = func.websearch_to_tsquery("english", query)
+        return stmt.where(vector.op("@@")(tsquery)), -func.ts_rank(vector, tsquery)
+
+
+def fts5_query(query: str) -> str:
+    """User text as an FTS5 query: every word required, the last one as a prefix."""
+    terms = [f'"{word}"' for word in re.findall(r"\w+", query)]
+    if terms:
+        terms[-1] += "*"
+    return " ".join(terms)
@@ -0,0 +1,19 @@
+from sqlalchemy import Column, Integer, String, event, insert
+from app.database import Base, VERSIONED_TABLES
+
+class TableVersion(Base):
+    """
+    Change counter per table in database.VERSIONED_TABLES, bumped once per
+    committing transaction that wrote to it (see database.PrimarySession).
+    Cheap watermark for ETags.
+    """
+    __tablename__ = "table_versions"
+
+    table_name = Column(String, primary_key=True)
+    version = Column(Integer, default=0, nullable=False)
+
+
+@event.listens_for(TableVersion.__table__, "after_create")
+def _seed_table_versions(target, connection, **kw):
+    # create_all databases start with every counter seeded, like the migration
+    connection.execute(insert(target), [{"table_name": name, "version": 1} for name in sorted(VERSIONED_TABLES)])
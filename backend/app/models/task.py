@@ -1,6 +1,7 @@
-from sqlalchemy import Column, Integer, String, Enum as PyEnum, ForeignKey, DateTime, Integer
+from sqlalchemy import Column, Integer, String, Enum as PyEnum, ForeignKey, DateTime, Integer, Index, text
 from sqlalchemy.orm import relationship
 from app.database import Base
+from app.models.search import SearchIndex
 import enum
 from datetime import datetime
 
@@ -22,19 +23,59 @@ class Task(Base):
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(String, nullable=True)
-    status = Column(PyEnum(TaskStatus), default=TaskStatus.ASSIGNED, nullable=False)
+    status = Column(PyEnum(TaskStatus), default=TaskStatus.ASSIGNED, nullable=False, index=True)
     priority = Column(PyEnum(TaskPriority), default=TaskPriority.MEDIUM, nullable=False)
     due_date = Column(DateTime, nullable=True)
     progress = Column(Integer, default=0) # 0 to 100
     
     created_at = Column(DateTime, default=datetime.utcnow)
+    # When the task last became COMPLETED; NULL whenever it is not completed
+    completed_at = Column(DateTime, nullable=True)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     assigned_to_id = Column(Integer, ForeignKey("users.id"), nullable=True) # Can be null if assigned to a role (future scope)
-    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    created_by_id = Column(Integer, ForeignKey("users.id"), nullable=False, index=True)
+    # Assignee's venture, denormalized for venture-scoped reads (app.crud.task.sync_task_ventures)
+    venture_id = Column(Integer, ForeignKey("ventures.id"), nullable=True)
 
-    assignee = relationship("User", back_populates="assigned_tasks", foreign_keys=[assigned_to_id], lazy="selectin")
-    time_logs = relationship("TimeLog", back_populates="task", cascade="all, delete-orphan", lazy="selectin")
+    assignee = relationship("User", back_populates="assigned_tasks", foreign_keys=[assigned_to_id], lazy="raise_on_sql")
+    time_logs = relationship("TimeLog", back_populates="task", cascade="all, delete-orphan", lazy="raise_on_sql")
 
     active_timer_start = Column(DateTime, nullable=True) # If set, timer is running
-    creator = relationship("User", foreign_keys=[created_by_id], back_populates="tasks_created", lazy="selectin")
+    active_timer_user_id = Column(Integer, ForeignKey("users.id"), nullable=True) # Who started it
+    # Start of the last stopped timer: the stop UPDATE moves active_timer_start here
+    # so RETURNING can hand back the old value (see tasks.stop_timer)
+    last_timer_started_at = Column(DateTime, nullable=True)
+
+    # Time log summaries, maintained by app.crud.time_log.record_time_logs
+    total_logged_minutes = Column(Integer, default=0, server_default="0", nullable=False)
+    time_log_count = Column(Integer, default=0, server_default="0", nullable=False)
+    last_logged_at = Column(DateTime, nullable=True)
+    creator = relationship("User", foreign_keys=[created_by_id], back_populates="tasks_created", lazy="raise_on_sql")
+
+    __table_args__ = (
+        # Employee task list: assignee, optionally narrowed by status
+        Index("ix_tasks_assigned_to_id_status", "assigned_to_id", "status"),
+        # Manager task list and analytics: the venture, optionally narrowed by status
+        Index("ix_tasks_venture_id_status", "venture_id", "status"),
+        # Completions over time (GET /analytics/timeseries)
+        Index("ix_tasks_completed_at", "completed_at"),
+        # Keyset pagination orders (see GET /tasks/page)
+        Index("ix_tasks_updated_at_id", "updated_at", "id"),
+        Index("ix_tasks_due_date_id", "due_date", "id"),
+        # Only running timers are indexed
+        Index(
+            "ix_tasks_active_timer_start", "active_timer_start",
+            sqlite_where=text("active_timer_start IS NOT NULL"),
+            postgresql_where=text("active_timer_start IS NOT NULL"),
+        ),
+        # A user's running timers (TIMER_SINGLE_ACTIVE_PER_USER)
+        Index(
+            "ix_tasks_active_timer_user_id", "active_timer_user_id",
+            sqlite_where=text("active_timer_start IS NOT NULL"),
+            postgresql_where=text("active_timer_start IS NOT NULL"),
+        ),
+    )
+
+# Full-text search over title/description (GET /search)
+task_search = SearchIndex(Task.__table__, "title", "description")
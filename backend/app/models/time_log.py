@@ -1,5 +1,5 @@
 from datetime import datetime
-from sqlalchemy import Column, Integer, DateTime, ForeignKey
+from sqlalchemy import Column, Date, Integer, String, DateTime, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from app.database import Base
 
@@ -7,11 +7,43 @@ class TimeLog(Base):
     __tablename__ = "time_logs"
 
     id = Column(Integer, primary_key=True, index=True)
-    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False)
+    task_id = Column(Integer, ForeignKey("tasks.id"), nullable=False, index=True)
     user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
-    start_time = Column(DateTime, nullable=False)
+    start_time = Column(DateTime, nullable=False, index=True)
     end_time = Column(DateTime, nullable=False)
     duration_minutes = Column(Integer, nullable=False)
+    # Id the client gave the entry (POST /time-logs/batch); makes re-sent batches idempotent
+    client_entry_id = Column(String, nullable=True)
 
-    task = relationship("Task", back_populates="time_logs")
-    user = relationship("User", back_populates="time_logs")
+    task = relationship("Task", back_populates="time_logs", lazy="raise_on_sql")
+    user = relationship("User", back_populates="time_logs", lazy="raise_on_sql")
+
+    __table_args__ = (
+        Index("ux_time_logs_user_id_client_entry_id", "user_id", "client_entry_id", unique=True),
+        # A user's logs by time (overlap checks, per-user reports)
+        Index("ix_time_logs_user_id_start_time", "user_id", "start_time"),
+    )
+
+
+class TimeLogDaily(Base):
+    """
+    Logged minutes per (day, user, task), maintained by crud.time_log.record_time_logs
+    in the same transaction as the logs. Analytics read this instead of time_logs.
+    venture_id is the user's venture when the time was logged; it is not part of
+    the key because it is nullable and NULLs never conflict on upsert.
+    """
+    __tablename__ = "time_log_daily"
+
+    day = Column(Date, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id"), primary_key=True)
+    task_id = Column(Integer, ForeignKey("tasks.id"), primary_key=True)
+    venture_id = Column(Integer, ForeignKey("ventures.id"), nullable=True)
+    minutes = Column(Integer, nullable=False, server_default="0")
+    log_count = Column(Integer, nullable=False, server_default="0")
+
+    __table_args__ = (
+        Index("ix_time_log_daily_task_id_day", "task_id", "day"),
+        Index("ix_time_log_daily_venture_id_day", "venture_id", "day"),
+        # Clustered on (day, user_id, task_id): date-range reads are sequential
+        {"sqlite_with_rowid": False},
+    )
@@ -20,9 +20,9 @@ class User(Base):
     
     venture_id = Column(Integer, ForeignKey("ventures.id"), nullable=True) # Nullable for Super Admins
     
-    venture = relationship("Venture", back_populates="employees")
-    assigned_tasks = relationship("Task", back_populates="assignee", foreign_keys="[Task.assigned_to_id]")
-    time_logs = relationship("TimeLog", back_populates="user")
-    tasks_created = relationship("Task", foreign_keys="[Task.created_by_id]", back_populates="creator", lazy="selectin")
-    announcement_acks = relationship("AnnouncementAck", back_populates="user")
+    venture = relationship("Venture", back_populates="employees", lazy="raise_on_sql")
+    assigned_tasks = relationship("Task", back_populates="assignee", foreign_keys="[Task.assigned_to_id]", lazy="raise_on_sql")
+    time_logs = relationship("TimeLog", back_populates="user", lazy="raise_on_sql")
+    tasks_created = relationship("Task", foreign_keys="[Task.created_by_id]", back_populates="creator", lazy="raise_on_sql")
+    announcement_acks = relationship("AnnouncementAck", back_populates="user", lazy="raise_on_sql")
     # leaves = relationship("Leave", back_populates="user")
@@ -9,5 +9,5 @@ class Venture(Base):
     name = Column(String, unique=True, index=True, nullable=False)
     description = Column(String, nullable=True)
 
-    employees = relationship("User", back_populates="venture")
+    employees = relationship("User", back_populates="venture", lazy="raise_on_sql")
     # tasks = relationship("Task", back_populates="venture") # Optional: Link tasks to ventures directly or via users
@@ -0,0 +1,18 @@
+from datetime import date
+from typing import List, Literal, Optional, Union
+from pydantic import BaseModel
+
+Bucket = Literal["day", "week", "month"]
+Breakdown = Literal["venture", "user", "priority", "status"]
+
+class TimeSeries(BaseModel):
+    """
+    Columnar series: `buckets` holds each bucket's first day, and row i of
+    `hours`/`completions` is the series for `keys[i]` (one bucket per column).
+    """
+    bucket: Bucket
+    breakdown: Optional[Breakdown] = None
+    buckets: List[date]
+    keys: List[Optional[Union[int, str]]]
+    hours: List[List[float]]
+    completions: List[List[int]]
@@ -1,4 +1,5 @@
 from typing import Optional
+import datetime as dt
 from datetime import date, datetime
 from pydantic import BaseModel, ConfigDict
 from app.models.leave import LeaveType, LeaveStatus
@@ -32,12 +33,13 @@ class Leave(LeaveInDBBase):
 
 class HolidayBase(BaseModel):
     name: Optional[str] = None
-    date: Optional[date] = None
+    # `dt.date`: a field named `date` shadows the class inside the body
+    date: Optional[dt.date] = None
     venture_id: Optional[int] = None
 
 class HolidayCreate(HolidayBase):
     name: str
-    date: date
+    date: dt.date
 
 class Holiday(HolidayBase):
     id: int
@@ -0,0 +1,13 @@
+from typing import List, Literal, Optional
+from pydantic import BaseModel
+
+class SearchHit(BaseModel):
+    type: Literal["task", "announcement"]
+    id: int
+    title: str
+    score: float
+
+class SearchPage(BaseModel):
+    items: List[SearchHit]
+    # Best-effort: resumes after the last hit's (score, type, id), see GET /search/
+    next_cursor: Optional[str] = None
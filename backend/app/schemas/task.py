@@ -1,4 +1,4 @@
-from typing import Optional, List
+from typing import Optional, List, Union
 from datetime import datetime
 from pydantic import BaseModel, ConfigDict
 from app.models.task import TaskStatus, TaskPriority
@@ -20,6 +20,15 @@ class TaskCreate(TaskBase):
 class TaskUpdate(TaskBase):
     pass
 
+class TaskBulkItem(TaskUpdate):
+    id: int
+
+class TaskBulkUpdate(BaseModel):
+    # Either the same `patch` for every task in `ids`, or one patch per task in `items`
+    ids: List[int] = []
+    patch: Optional[TaskUpdate] = None
+    items: List[TaskBulkItem] = []
+
 class TaskInDBBase(TaskBase):
     id: int
     created_at: datetime
@@ -36,7 +45,27 @@ from app.schemas.time_log import TimeLog
 
 # ...
 
-class Task(TaskInDBBase):
+class TaskSummary(TaskInDBBase):
+    # List projection: log totals instead of the log rows
     assignee: Optional[TaskAssignee] = None
-    time_logs: List[TimeLog] = []
     active_timer_start: Optional[datetime] = None
+    active_timer_user_id: Optional[int] = None
+    total_logged_minutes: int = 0
+    time_log_count: int = 0
+    last_logged_at: Optional[datetime] = None
+
+class Task(TaskSummary):
+    time_logs: List[TimeLog] = []
+
+class BoardColumn(BaseModel):
+    status: TaskStatus
+    count: int
+    items: List[TaskSummary]
+    next_cursor: Optional[str] = None
+
+class Board(BaseModel):
+    columns: List[BoardColumn]
+
+class TaskPage(BaseModel):
+    items: List[Union[Task, TaskSummary]]
+    next_cursor: Optional[str] = None
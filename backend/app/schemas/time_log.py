@@ -1,6 +1,6 @@
-from typing import Optional
-from datetime import datetime
-from pydantic import BaseModel
+from typing import List, Optional
+from datetime import datetime, timezone
+from pydantic import BaseModel, Field, field_validator
 
 class TimeLogBase(BaseModel):
     task_id: int
@@ -14,6 +14,34 @@ class TimeLogCreate(TimeLogBase):
 
 class TimeLog(TimeLogBase):
     id: int
+    client_entry_id: Optional[str] = None
 
     class Config:
         from_attributes = True
+
+class TimeLogPage(BaseModel):
+    items: List[TimeLog]
+    next_cursor: Optional[str] = None
+
+class TimeLogEntry(BaseModel):
+    # Client-generated (e.g. a UUID); re-sending an entry is a no-op
+    entry_id: str = Field(..., min_length=1, max_length=64)
+    task_id: int
+    start_time: datetime
+    end_time: datetime
+
+    @field_validator("start_time", "end_time")
+    @classmethod
+    def to_naive_utc(cls, value: datetime) -> datetime:
+        # Stored times are naive UTC (datetime.utcnow()); clients may send any offset
+        if value.tzinfo is not None:
+            value = value.astimezone(timezone.utc).replace(tzinfo=None)
+        return value
+
+class TimeLogBatch(BaseModel):
+    entries: List[TimeLogEntry]
+
+class TimeLogBatchResult(BaseModel):
+    created: List[TimeLog]
+    # Entries synced by an earlier request, as stored then
+    duplicates: List[TimeLog]
@@ -1,4 +1,4 @@
-from typing import Optional
+from typing import List, Optional
 from pydantic import BaseModel, ConfigDict
 from app.models.user import UserRole
 
@@ -31,3 +31,16 @@ class User(UserInDBBase):
 
 class UserInDB(UserInDBBase):
     hashed_password: str
+
+# Bulk import report
+class UserImportRow(BaseModel):
+    row: int
+    emp_id: Optional[str] = None
+    status: str # "created" or "error"
+    id: Optional[int] = None
+    error: Optional[str] = None
+
+class UserImportReport(BaseModel):
+    created: int
+    failed: int
+    rows: List[UserImportRow]
@@ -0,0 +1,109 @@
+"""
+Scoped vs unscoped analytics: cold-cache p95 of the dashboard and time series
+for an admin (everything), a manager (one venture of 50) and an employee, plus
+the query plans of the scoped statements. Exits 1 if a scoped caller is slower
+than the admin or any of their statements scans a whole table.
+
+    python benchmarks/analytics_scoping.py [--logs 1000000] [--tasks 50000] [--requests 20]
+"""
+import argparse
+import asyncio
+import os
+import re
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.getcwd())
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from analytics_timeseries import seed
+from app.core.result_cache import dashboard_cache, timeseries_cache
+from app.core.security import create_access_token
+from app.database import get_db, get_read_db
+from app.main import app
+
+CALLERS = {"admin": 2, "manager": 1, "employee": 3}
+TODAY = datetime.utcnow().date()
+URLS = [
+    "/api/v1/analytics/dashboard",
+    f"/api/v1/analytics/timeseries?bucket=week&start={TODAY - timedelta(days=180)}",
+    f"/api/v1/analytics/timeseries?bucket=month&start={TODAY - timedelta(days=364)}&breakdown=venture",
+]
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logs", type=int, default=1000000)
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--requests", type=int, default=20)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    started = time.perf_counter()
+    rollup_rows = await seed(engine, args.logs, args.tasks)
+    print({"seeded_logs": args.logs, "rollup_rows": rollup_rows, "s": round(time.perf_counter() - started, 1)})
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+
+    p95 = {}
+    scans = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for url in URLS:
+            for caller, user_id in CALLERS.items():
+                headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+                timings = []
+                for _ in range(args.requests):
+                    dashboard_cache.clear()
+                    timeseries_cache.clear()
+                    statements.clear()
+                    t0 = time.perf_counter()
+                    response = await client.get(url, headers=headers)
+                    timings.append(time.perf_counter() - t0)
+                    assert response.status_code == 200, response.text
+                p95[url, caller] = round(statistics.quantiles(timings, n=20)[-1] * 1000, 1)
+                print({"url": url, "caller": caller, "cold_p95_ms": p95[url, caller]})
+                if caller == "admin":
+                    continue
+                # The last request's analytics statements (not the principal lookup)
+                analytics = [(s, p) for s, p in statements if s.startswith("SELECT") and "FROM users" not in s]
+                async with engine.connect() as conn:
+                    for statement, parameters in analytics:
+                        plan = await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", tuple(parameters or ()))
+                        for row in plan:
+                            if re.match(r"SCAN (?!anon_\d)\w+$", row[-1]):
+                                scans.append((caller, url, row[-1]))
+
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+    slower = [(url, caller, p95[url, caller], p95[url, "admin"]) for url, caller in p95 if p95[url, caller] > p95[url, "admin"]]
+    if slower or scans:
+        print({"slower_than_unscoped": slower, "full_scans": scans})
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,153 @@
+"""
+p95 latency of GET /analytics/timeseries over a year of time logs (1M rows by
+default), for an admin, a manager and an employee. "cold" clears the result
+cache before every request (as after any time-log write), "warm" does not.
+Exits 1 when a cold p95 is over the budget.
+
+    python benchmarks/analytics_timeseries.py [--logs 1000000] [--tasks 50000] [--budget-ms 1000]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.getcwd())
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.result_cache import timeseries_cache
+from app.core.security import create_access_token
+from app.crud.time_log import rebuild_time_log_daily
+from app.database import Base, get_db, get_read_db
+from app.main import app
+from app.models.user import User, UserRole
+from app.models.venture import Venture
+from app.models.task import Task, TaskPriority, TaskStatus
+from app.models.time_log import TimeLog
+
+DAYS = 365
+
+
+async def seed(engine, logs: int, tasks: int, ventures: int = 50, users_per_venture: int = 20):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    rng = random.Random(0)
+    now = datetime.utcnow().replace(microsecond=0)
+    async with AsyncSession(engine) as db:
+        await db.execute(insert(Venture), [{"id": v, "name": f"Venture {v}"} for v in range(1, ventures + 1)])
+        users = [
+            {"id": 1, "emp_id": "MGR", "hashed_password": "x", "full_name": "Manager", "role": UserRole.MANAGER, "venture_id": 1},
+            {"id": 2, "emp_id": "ADMIN", "hashed_password": "x", "full_name": "Admin", "role": UserRole.ADMIN, "venture_id": None},
+        ]
+        users += [
+            {"id": 2 + (v - 1) * users_per_venture + i, "emp_id": f"E{v}-{i}", "hashed_password": "x",
+             "full_name": f"Employee {v}-{i}", "role": UserRole.EMPLOYEE, "venture_id": v}
+            for v in range(1, ventures + 1) for i in range(1, users_per_venture + 1)
+        ]
+        await db.execute(insert(User), users)
+        employees = users[2:]
+
+        task_rows = []
+        for i in range(tasks):
+            assignee = rng.choice(employees)
+            status = rng.choice(list(TaskStatus))
+            created = now - timedelta(days=rng.randrange(DAYS))
+            task_rows.append({
+                "id": i + 1, "title": f"Task {i}", "status": status, "priority": rng.choice(list(TaskPriority)),
+                "created_by_id": 2, "assigned_to_id": assignee["id"], "venture_id": assignee["venture_id"],
+                "created_at": created, "updated_at": created,
+                "completed_at": created + timedelta(days=rng.randrange(14)) if status == TaskStatus.COMPLETED else None,
+            })
+        for start in range(0, len(task_rows), 5000):
+            await db.execute(insert(Task), task_rows[start:start + 5000])
+
+        # Work sessions: a few logs on one task in one day
+        batch = []
+        while logs > 0:
+            task = task_rows[rng.randrange(tasks)]
+            start_time = now - timedelta(days=rng.randrange(DAYS), hours=rng.randrange(8))
+            for _ in range(min(logs, rng.randrange(1, 6))):
+                minutes = rng.randrange(5, 60)
+                batch.append({
+                    "task_id": task["id"], "user_id": task["assigned_to_id"], "start_time": start_time,
+                    "end_time": start_time + timedelta(minutes=minutes), "duration_minutes": minutes,
+                })
+                start_time += timedelta(minutes=minutes + rng.randrange(30))
+                logs -= 1
+            if len(batch) >= 50000:
+                await db.execute(insert(TimeLog.__table__), batch)
+                batch = []
+        if batch:
+            await db.execute(insert(TimeLog.__table__), batch)
+        rollup_rows = await rebuild_time_log_daily(db)
+        await db.commit()
+    return rollup_rows
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--logs", type=int, default=1000000)
+    parser.add_argument("--tasks", type=int, default=50000)
+    parser.add_argument("--requests", type=int, default=40)
+    parser.add_argument("--budget-ms", type=float, default=1000)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    started = time.perf_counter()
+    rollup_rows = await seed(engine, args.logs, args.tasks)
+    print({"seeded_logs": args.logs, "rollup_rows": rollup_rows, "s": round(time.perf_counter() - started, 1)})
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    callers = {"admin": 2, "manager": 1, "employee": 3}
+    today = datetime.utcnow().date()
+    queries = [
+        {"bucket": "day", "start": str(today - timedelta(days=29))},
+        {"bucket": "week", "start": str(today - timedelta(days=180)), "breakdown": "priority"},
+        {"bucket": "month", "start": str(today - timedelta(days=DAYS)), "breakdown": "venture"},
+        {"bucket": "week", "start": str(today - timedelta(days=89)), "breakdown": "user"},
+    ]
+
+    over_budget = []
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for caller, user_id in callers.items():
+            headers = {"Authorization": f"Bearer {create_access_token(user_id)}"}
+            for params in queries:
+                p95 = {}
+                for mode in ("cold", "warm"):
+                    timings = []
+                    for _ in range(args.requests):
+                        if mode == "cold":
+                            timeseries_cache.clear()
+                        t0 = time.perf_counter()
+                        response = await client.get("/api/v1/analytics/timeseries", headers=headers, params=params)
+                        timings.append(time.perf_counter() - t0)
+                        assert response.status_code == 200, response.text
+                    p95[mode] = round(statistics.quantiles(timings, n=20)[-1] * 1000, 1)
+                print({"caller": caller, **params, "cold_p95_ms": p95["cold"], "warm_p95_ms": p95["warm"]})
+                if p95["cold"] > args.budget_ms:
+                    over_budget.append((caller, params, p95["cold"]))
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+    if over_budget:
+        print({"over_budget_ms": args.budget_ms, "cases": over_budget})
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
@@ -0,0 +1,135 @@
+"""
+Compare today's SQLite setup with SQLITE_PRODUCTION_MODE under concurrent
+timer stops (read-then-write transactions) and task list reads.
+
+    python benchmarks/sqlite_mode.py [--writers 20] [--readers 20] [--ops 50]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.getcwd())
+
+from sqlalchemy import select, update
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+
+from app.database import Base, configure_sqlite, engine_options
+from app.models.user import User, UserRole
+from app.models.venture import Venture
+from app.models.task import Task
+from app.models.time_log import TimeLog
+from app.models.announcement import Announcement, AnnouncementAck
+from app.models.leave import Leave, Holiday
+
+
+def build_engines(url: str, production: bool):
+    if not production:
+        # Baseline: one default engine for reads and writes, no pragmas
+        engine = create_async_engine(url)
+        return engine, engine
+    writer = create_async_engine(url, **engine_options(url, single_writer=True))
+    reader = create_async_engine(url, **engine_options(url))
+    configure_sqlite(writer.sync_engine)
+    configure_sqlite(reader.sync_engine, read_only=True)
+    return writer, reader
+
+
+async def seed(engine, tasks: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add(Venture(id=1, name="Bench"))
+        db.add(User(id=1, emp_id="BENCH", hashed_password="x", full_name="Bench", role=UserRole.MANAGER, venture_id=1))
+        start = datetime.utcnow() - timedelta(hours=1)
+        db.add_all(
+            Task(id=i, title=f"Task {i}", created_by_id=1, assigned_to_id=1, active_timer_start=start)
+            for i in range(1, tasks + 1)
+        )
+        await db.commit()
+
+
+async def stop_timer(writer, task_id: int):
+    async with AsyncSession(writer) as db:
+        task = (await db.execute(select(Task).where(Task.id == task_id))).scalars().first()
+        now = datetime.utcnow()
+        db.add(TimeLog(task_id=task.id, user_id=1, start_time=task.active_timer_start or now, end_time=now, duration_minutes=1))
+        await db.execute(update(Task).where(Task.id == task_id).values(active_timer_start=now))
+        await db.commit()
+
+
+async def list_tasks(reader):
+    async with AsyncSession(reader) as db:
+        (await db.execute(select(Task).limit(100))).scalars().all()
+
+
+async def run(production: bool, writers: int, readers: int, ops: int, tasks: int):
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    url = f"sqlite+aiosqlite:///{path}"
+    writer, reader = build_engines(url, production)
+    await seed(writer, tasks)
+
+    errors = 0
+    write_times, read_times = [], []
+
+    async def write_loop(n: int):
+        nonlocal errors
+        for i in range(ops):
+            started = time.perf_counter()
+            try:
+                await stop_timer(writer, (n * ops + i) % tasks + 1)
+                write_times.append(time.perf_counter() - started)
+            except OperationalError:
+                errors += 1
+
+    async def read_loop():
+        nonlocal errors
+        for _ in range(ops):
+            started = time.perf_counter()
+            try:
+                await list_tasks(reader)
+                read_times.append(time.perf_counter() - started)
+            except OperationalError:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(write_loop(n) for n in range(writers)), *(read_loop() for _ in range(readers)))
+    elapsed = time.perf_counter() - started
+
+    await writer.dispose()
+    if reader is not writer:
+        await reader.dispose()
+
+    def p95(values):
+        return statistics.quantiles(values, n=20)[-1] * 1000 if len(values) > 1 else 0
+
+    return {
+        "mode": "production" if production else "default",
+        "elapsed_s": round(elapsed, 2),
+        "writes_per_s": round(len(write_times) / elapsed, 1),
+        "reads_per_s": round(len(read_times) / elapsed, 1),
+        "write_p95_ms": round(p95(write_times), 1),
+        "read_p95_ms": round(p95(read_times), 1),
+        "locked_errors": errors,
+    }
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--writers", type=int, default=20)
+    parser.add_argument("--readers", type=int, default=20)
+    parser.add_argument("--ops", type=int, default=50)
+    parser.add_argument("--tasks", type=int, default=500)
+    args = parser.parse_args()
+
+    for production in (False, True):
+        print(await run(production, args.writers, args.readers, args.ops, args.tasks))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
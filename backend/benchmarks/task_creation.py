@@ -0,0 +1,101 @@
+"""
+Round trips and latency of POST /tasks/ as the number of assignees grows,
+against the per-row ORM pattern it replaced (add + commit + refresh per task).
+
+    python benchmarks/task_creation.py [--assignees 1 10 200 2000]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import tempfile
+import time
+
+sys.path.append(os.getcwd())
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import delete, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.security import create_access_token
+from app.database import Base, get_db, get_read_db
+from app.main import app
+from app.models.user import User, UserRole
+from app.models.venture import Venture
+from app.models.task import Task
+
+
+async def seed(engine, users: int):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    async with AsyncSession(engine) as db:
+        db.add(Venture(id=1, name="Bench"))
+        db.add(User(id=1, emp_id="MGR", hashed_password="x", full_name="Manager", role=UserRole.MANAGER, venture_id=1))
+        db.add_all(
+            User(id=i, emp_id=f"EMP{i}", hashed_password="x", full_name=f"Employee {i}", role=UserRole.EMPLOYEE, venture_id=1)
+            for i in range(2, users + 2)
+        )
+        await db.commit()
+
+
+async def per_row(sessions, assignee_ids):
+    # The pre-set-based implementation, kept here as the baseline
+    async with sessions() as db:
+        tasks = [Task(title="Bench", created_by_id=1, assigned_to_id=uid) for uid in assignee_ids]
+        db.add_all(tasks)
+        await db.commit()
+        for task in tasks:
+            await db.refresh(task)
+            await db.refresh(task, ["assignee", "creator", "time_logs"])
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--assignees", type=int, nargs="+", default=[1, 10, 200, 2000])
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    await seed(engine, max(args.assignees))
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    statements = 0
+
+    def count(*_):
+        nonlocal statements
+        statements += 1
+
+    event.listen(engine.sync_engine, "before_cursor_execute", count)
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for n in args.assignees:
+            assignee_ids = list(range(2, n + 2))
+            for name in ("per_row", "set_based"):
+                statements = 0
+                started = time.perf_counter()
+                if name == "per_row":
+                    await per_row(sessions, assignee_ids)
+                else:
+                    response = await client.post("/api/v1/tasks/", headers=headers, json={
+                        "title": "Bench", "assigned_to_ids": assignee_ids
+                    })
+                    assert response.status_code == 200, response.text
+                elapsed = time.perf_counter() - started
+                print({"assignees": n, "mode": name, "round_trips": statements, "ms": round(elapsed * 1000, 1)})
+                async with engine.begin() as conn:
+                    await conn.execute(delete(Task))
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
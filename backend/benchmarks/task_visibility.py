@@ -0,0 +1,103 @@
+"""
+Latency of the manager's venture-scoped task reads on a large table.
+
+    python benchmarks/task_visibility.py [--tasks 100000] [--ventures 50] [--requests 50]
+"""
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+sys.path.append(os.getcwd())
+
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.security import create_access_token
+from app.database import Base, get_db, get_read_db
+from app.main import app
+from app.models.user import User, UserRole
+from app.models.venture import Venture
+from app.models.task import Task, TaskStatus
+
+
+async def seed(engine, tasks: int, ventures: int, users_per_venture: int = 20):
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    rng = random.Random(0)
+    async with AsyncSession(engine) as db:
+        await db.execute(insert(Venture), [{"id": v, "name": f"Venture {v}"} for v in range(1, ventures + 1)])
+        users = [
+            {"id": 1, "emp_id": "MGR", "hashed_password": "x", "full_name": "Manager", "role": UserRole.MANAGER, "venture_id": 1},
+            {"id": 2, "emp_id": "ADMIN", "hashed_password": "x", "full_name": "Admin", "role": UserRole.ADMIN, "venture_id": None},
+        ]
+        users += [
+            {"id": 1 + v * users_per_venture + i, "emp_id": f"E{v}-{i}", "hashed_password": "x",
+             "full_name": f"Employee {v}-{i}", "role": UserRole.EMPLOYEE, "venture_id": v}
+            for v in range(1, ventures + 1) for i in range(users_per_venture)
+        ]
+        await db.execute(insert(User), users)
+        employees = users[2:]
+        now = datetime.utcnow()
+        rows = []
+        for i in range(tasks):
+            assignee = rng.choice(employees)
+            stamp = now - timedelta(minutes=i)
+            rows.append({
+                "title": f"Task {i}", "status": rng.choice(list(TaskStatus)), "created_by_id": 2,
+                "assigned_to_id": assignee["id"], "venture_id": assignee["venture_id"],
+                "created_at": stamp, "updated_at": stamp,
+            })
+        for start in range(0, len(rows), 5000):
+            await db.execute(insert(Task), rows[start:start + 5000])
+        await db.commit()
+
+
+async def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--tasks", type=int, default=100000)
+    parser.add_argument("--ventures", type=int, default=50)
+    parser.add_argument("--requests", type=int, default=50)
+    args = parser.parse_args()
+
+    path = os.path.join(tempfile.mkdtemp(), "bench.db")
+    engine = create_async_engine(f"sqlite+aiosqlite:///{path}")
+    started = time.perf_counter()
+    await seed(engine, args.tasks, args.ventures)
+    print({"seeded_tasks": args.tasks, "s": round(time.perf_counter() - started, 1)})
+    sessions = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    headers = {"Authorization": f"Bearer {create_access_token(1)}"}
+
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://bench") as client:
+        for url in ("/api/v1/tasks/?limit=50", "/api/v1/tasks/page?limit=50", "/api/v1/tasks/page?limit=50&status=REVIEW", "/api/v1/analytics/dashboard"):
+            timings = []
+            for _ in range(args.requests):
+                t0 = time.perf_counter()
+                response = await client.get(url, headers=headers)
+                timings.append(time.perf_counter() - t0)
+                assert response.status_code == 200, response.text
+            print({
+                "url": url,
+                "p50_ms": round(statistics.median(timings) * 1000, 1),
+                "p95_ms": round(statistics.quantiles(timings, n=20)[-1] * 1000, 1),
+            })
+
+    app.dependency_overrides.clear()
+    await engine.dispose()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,36 @@
+import argparse
+import asyncio
+import logging
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from app.crud.time_log import find_inconsistent_time_log_daily, rebuild_time_log_daily
+from app.database import AsyncSessionLocal
+# Models related through User, so its mapper can configure
+from app.models.venture import Venture  # noqa: F401
+from app.models.announcement import AnnouncementAck  # noqa: F401
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def rebuild(check_only: bool):
+    async with AsyncSessionLocal() as db:
+        drift = await find_inconsistent_time_log_daily(db)
+        if drift:
+            logger.warning("time_log_daily disagrees with time_logs on %d day(s)", drift)
+        else:
+            logger.info("time_log_daily is consistent")
+        if check_only:
+            return 1 if drift else 0
+        written = await rebuild_time_log_daily(db)
+        await db.commit()
+        logger.info("Rebuilt time_log_daily: %d row(s)", written)
+        return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Recompute the time_log_daily rollup from time_logs")
+    parser.add_argument("--check", action="store_true", help="only report drift (exit 1 if any)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(rebuild(args.check)))
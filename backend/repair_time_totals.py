@@ -0,0 +1,36 @@
+import argparse
+import asyncio
+import logging
+import sys
+import os
+
+sys.path.append(os.getcwd())
+
+from app.crud.time_log import find_inconsistent_task_totals, recompute_task_totals
+from app.database import AsyncSessionLocal
+# Models related through User, so its mapper can configure
+from app.models.venture import Venture  # noqa: F401
+from app.models.announcement import AnnouncementAck  # noqa: F401
+
+logging.basicConfig(level=logging.INFO)
+logger = logging.getLogger(__name__)
+
+async def repair(check_only: bool):
+    async with AsyncSessionLocal() as db:
+        task_ids = await find_inconsistent_task_totals(db)
+        if not task_ids:
+            logger.info("Task time totals are consistent")
+            return 0
+        logger.warning("%d task(s) have stale time totals: %s", len(task_ids), task_ids[:20])
+        if check_only:
+            return 1
+        updated = await recompute_task_totals(db, task_ids)
+        await db.commit()
+        logger.info("Recomputed time totals for %d task(s)", updated)
+        return 0
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Backfill/repair Task.total_logged_minutes, time_log_count and last_logged_at")
+    parser.add_argument("--check", action="store_true", help="only report inconsistent tasks (exit 1 if any)")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(repair(args.check)))
@@ -10,7 +10,12 @@ from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
 from sqlalchemy.orm import sessionmaker
 
 from app.main import app
-from app.database import get_db, Base
+from app.database import get_db, get_read_db, Base, PrimarySession
+from app.core.principal_cache import principal_cache
+from app.core.result_cache import dashboard_cache, timeseries_cache
+from app.core.sql_metrics import instrument_engine
+from app.crud.time_log import find_inconsistent_task_totals, find_inconsistent_time_log_daily
+from app.models.loading import guard_unrequested_loads
 from app.core.security import get_password_hash
 from app.models.user import User, UserRole
 from app.models.venture import Venture
@@ -18,6 +23,7 @@ from app.models.task import Task
 from app.models.announcement import Announcement, AnnouncementAck
 from app.models.leave import Leave, Holiday
 
+from sqlalchemy import event
 from sqlalchemy.orm import configure_mappers
 configure_mappers()
 
@@ -28,8 +34,11 @@ engine = create_async_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
 )
 
+instrument_engine(engine.sync_engine)
+
+# Same session class as get_db, so write hooks (table versions) run in tests
 TestingSessionLocal = sessionmaker(
-    engine, class_=AsyncSession, expire_on_commit=False
+    engine, class_=AsyncSession, sync_session_class=PrimarySession, expire_on_commit=False
 )
 
 # event_loop fixture removed in favor of pytest.ini asyncio_mode=auto
@@ -40,9 +49,15 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
         await conn.run_sync(Base.metadata.create_all)
 
     async with TestingSessionLocal() as session:
+        # Fail any relationship load the query's loading profile did not ask for
+        event.listen(session.sync_session, "do_orm_execute", guard_unrequested_loads)
         yield session
         # Cleanup
         await session.rollback()
+        # Denormalized task time totals must match the committed time_logs
+        assert await find_inconsistent_task_totals(session) == []
+        # ...and so must the daily rollup
+        assert await find_inconsistent_time_log_daily(session) == 0
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
@@ -55,6 +70,11 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
         yield db_session
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    # Each test gets a fresh database, so ids (and tokens) are reused across tests
+    principal_cache.clear()
+    dashboard_cache.clear()
+    timeseries_cache.clear()
     transport = ASGITransport(app=app)
     async with AsyncClient(transport=transport, base_url="http://test") as c:
         yield c
@@ -98,3 +118,24 @@ async def create_test_data(db_session: AsyncSession):
     
     await db_session.commit()
     return {"venture": venture, "admin": admin, "manager": manager, "employee": employee}
+
+@pytest.fixture
+def sql_statements():
+    statements = []
+
+    def record(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine.sync_engine, "before_cursor_execute", record)
+
+@pytest.fixture
+def login(client: AsyncClient):
+    async def _login(emp_id: str, password: str = "password") -> dict:
+        response = await client.post(
+            "/api/v1/login/access-token",
+            data={"username": emp_id, "password": password}
+        )
+        return {"Authorization": f"Bearer {response.json()['access_token']}"}
+    return _login
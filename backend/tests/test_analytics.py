@@ -0,0 +1,171 @@
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select
+
+from app.core.result_cache import ResultCache, dashboard_cache
+from app.core.security import get_password_hash
+from app.models.user import User, UserRole
+from app.models.venture import Venture
+
+def entry(entry_id: str, task_id: int, start: datetime, minutes: int) -> dict:
+    end = start + timedelta(minutes=minutes)
+    return {"entry_id": entry_id, "task_id": task_id, "start_time": start.isoformat(), "end_time": end.isoformat()}
+
+@pytest.mark.asyncio
+async def test_dashboard_queries_and_cache(client: AsyncClient, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    tasks = [
+        (await client.post("/api/v1/tasks/", headers=manager, json={"title": f"T{i}", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+        for i in range(3)
+    ]
+    await client.put(f"/api/v1/tasks/{tasks[0]}", headers=manager, json={"status": "COMPLETED"})
+    recent = datetime.utcnow().replace(microsecond=0) - timedelta(days=1)
+    await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        entry("old", tasks[1], recent - timedelta(days=30), 60),
+        entry("new", tasks[1], recent, 30),
+    ]})
+
+    sql_statements.clear()
+    dashboard = (await client.get("/api/v1/analytics/dashboard", headers=employee)).json()
+    # One counter query, one time-log query
+    assert len([s for s, _ in sql_statements if "tasks" in s and s.startswith("SELECT")]) == 2
+    assert dashboard["total_tasks"] == 3
+    assert dashboard["tasks_completed"] == 1
+    assert dashboard["tasks_by_status"] == {"ASSIGNED": 2, "COMPLETED": 1}
+    assert dashboard["total_hours_logged"] == 1.5
+    assert dashboard["weekly_activity"] == [{"date": str(recent.date()), "hours": 0.5}]
+    assert dashboard["completion_rate"] == 33.33
+
+    # Served from the cache until a task or time-log write commits
+    sql_statements.clear()
+    assert (await client.get("/api/v1/analytics/dashboard", headers=employee)).json() == dashboard
+    assert not [s for s, _ in sql_statements if "tasks" in s]
+
+    await client.post(f"/api/v1/tasks/{tasks[2]}/timer/start", headers=employee)
+    started = (await client.get("/api/v1/analytics/dashboard", headers=employee)).json()
+    assert started["active_timers"] == 1
+    await client.post(f"/api/v1/tasks/{tasks[2]}/timer/stop", headers=employee)
+    assert (await client.get("/api/v1/analytics/dashboard", headers=employee)).json()["active_timers"] == 0
+
+    # Scopes never share results
+    assert (await client.get("/api/v1/analytics/dashboard", headers=manager)).json()["total_tasks"] == 3
+    await client.post("/api/v1/tasks/", headers=manager, json={"title": "Unassigned"})
+    assert (await client.get("/api/v1/analytics/dashboard", headers=manager)).json()["total_tasks"] == 4
+    assert (await client.get("/api/v1/analytics/dashboard", headers=employee)).json()["total_tasks"] == 3
+    assert dashboard_cache.stats()["invalidations"] >= 3
+
+@pytest.mark.asyncio
+async def test_result_cache_single_flight():
+    cache = ResultCache(max_size=8, ttl=60)
+    calls = 0
+    release = asyncio.Event()
+
+    async def compute():
+        nonlocal calls
+        calls += 1
+        await release.wait()
+        return calls
+
+    waiters = [asyncio.create_task(cache.get_or_compute("k", compute)) for _ in range(10)]
+    await asyncio.sleep(0)
+    release.set()
+    assert await asyncio.gather(*waiters) == [1] * 10
+    assert calls == 1
+    assert cache.stats()["shared"] == 9
+
+    # A result computed across an invalidation answers its callers but is not kept
+    release.clear()
+    pending = asyncio.create_task(cache.get_or_compute("j", compute))
+    await asyncio.sleep(0)
+    cache.invalidate()
+    release.set()
+    assert await pending == 2
+    assert await cache.get_or_compute("j", compute) == 3
+
+    # Failures reach every waiter and are not cached
+    async def fail():
+        await asyncio.sleep(0)
+        raise RuntimeError("boom")
+
+    results = await asyncio.gather(*(cache.get_or_compute("e", fail) for _ in range(3)), return_exceptions=True)
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert await cache.get_or_compute("e", compute) == 4
+
+@pytest.mark.asyncio
+async def test_timeseries(client: AsyncClient, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp = create_test_data["employee"]
+    tasks = [
+        (await client.post("/api/v1/tasks/", headers=manager, json={"title": f"T{i}", "priority": priority, "assigned_to_ids": [emp.id]})).json()[0]["id"]
+        for i, priority in enumerate(["HIGH", "LOW"])
+    ]
+    await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        entry("mon", tasks[0], datetime(2026, 5, 4, 9), 60),
+        entry("wed", tasks[1], datetime(2026, 5, 6, 9), 30),
+        entry("next", tasks[0], datetime(2026, 5, 12, 9), 90),
+    ]})
+    await client.post("/api/v1/tasks/bulk", headers=manager, json={"ids": tasks, "patch": {"status": "COMPLETED"}})
+    today = datetime.utcnow().date()
+
+    sql_statements.clear()
+    daily = (await client.get("/api/v1/analytics/timeseries?start=2026-05-04&end=2026-05-07", headers=employee)).json()
+    assert len([s for s, _ in sql_statements if s.startswith("SELECT") and "tasks" in s]) == 2
+    assert daily["buckets"] == ["2026-05-04", "2026-05-05", "2026-05-06", "2026-05-07"]
+    assert daily["keys"] == [None]
+    assert daily["hours"] == [[1.0, 0.0, 0.5, 0.0]]
+    assert daily["completions"] == [[0, 0, 0, 0]]
+
+    # Weeks start on Monday; the first and last buckets cover the partial range ends
+    weekly = (await client.get("/api/v1/analytics/timeseries?start=2026-05-06&end=2026-05-13&bucket=week&breakdown=priority", headers=employee)).json()
+    assert weekly["buckets"] == ["2026-05-04", "2026-05-11"]
+    assert weekly["keys"] == ["HIGH", "LOW"]
+    assert weekly["hours"] == [[0.0, 1.5], [0.5, 0.0]]
+
+    monthly = (await client.get(f"/api/v1/analytics/timeseries?start=2026-04-20&end={today}&bucket=month&breakdown=user", headers=manager)).json()
+    assert monthly["buckets"][:2] == ["2026-04-01", "2026-05-01"]
+    assert monthly["keys"] == [emp.id]
+    assert monthly["hours"][0][:2] == [0.0, 3.0]
+    assert monthly["completions"][0][-1] == 2
+    assert sum(monthly["completions"][0]) == 2
+
+    # Reopening clears the completion
+    await client.put(f"/api/v1/tasks/{tasks[1]}", headers=employee, json={"status": "REVIEW"})
+    by_status = (await client.get(f"/api/v1/analytics/timeseries?start={today}&breakdown=status", headers=manager)).json()
+    assert by_status["keys"] == ["COMPLETED"]
+    assert by_status["completions"] == [[1]]
+
+    assert (await client.get("/api/v1/analytics/timeseries?start=2026-05-07&end=2026-05-04", headers=manager)).status_code == 400
+    assert (await client.get("/api/v1/analytics/timeseries?start=2020-01-01&end=2026-01-01", headers=manager)).status_code == 400
+    assert (await client.get("/api/v1/analytics/timeseries?bucket=year", headers=manager)).status_code == 422
+
+@pytest.mark.asyncio
+async def test_analytics_scoping(client: AsyncClient, db_session, create_test_data, login):
+    db_session.add(Venture(id=2, name="Other Venture"))
+    db_session.add(User(emp_id="EMP002", full_name="Elsewhere", hashed_password=get_password_hash("password"), role=UserRole.EMPLOYEE, venture_id=2))
+    await db_session.commit()
+    admin = await login("ADMIN001")
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    elsewhere = await login("EMP002")
+    emp = create_test_data["employee"]
+    other_id = (await db_session.execute(select(User.id).where(User.emp_id == "EMP002"))).scalar_one()
+    inside = (await client.post("/api/v1/tasks/", headers=admin, json={"title": "Inside", "assigned_to_ids": [emp.id]})).json()[0]["id"]
+    outside = (await client.post("/api/v1/tasks/", headers=admin, json={"title": "Outside", "assigned_to_ids": [other_id]})).json()[0]["id"]
+    day = datetime.utcnow().replace(hour=0, minute=0, second=0, microsecond=0) - timedelta(days=1)
+    await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [entry("in", inside, day, 60)]})
+    await client.post("/api/v1/time-logs/batch", headers=elsewhere, json={"entries": [entry("out", outside, day, 120)]})
+
+    expected = {"admin": (admin, 2, 3.0), "manager": (manager, 1, 1.0), "employee": (employee, 1, 1.0), "elsewhere": (elsewhere, 1, 2.0)}
+    for name, (headers, tasks, hours) in expected.items():
+        dashboard = (await client.get("/api/v1/analytics/dashboard", headers=headers)).json()
+        assert (name, dashboard["total_tasks"], dashboard["total_hours_logged"]) == (name, tasks, hours)
+        series = (await client.get("/api/v1/analytics/timeseries", headers=headers, params={"breakdown": "venture"})).json()
+        assert (name, sum(sum(row) for row in series["hours"])) == (name, hours)
+    by_venture = (await client.get("/api/v1/analytics/timeseries", headers=admin, params={"breakdown": "venture"})).json()
+    assert by_venture["keys"] == [1, 2]
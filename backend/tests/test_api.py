@@ -71,8 +71,8 @@ async def test_create_task(client: AsyncClient, create_test_data):
         }
     )
     assert response.status_code == 200
-    assert response.json()["title"] == "New Task"
-    assert response.json()["status"] == "ASSIGNED"
+    assert response.json()[0]["title"] == "New Task"
+    assert response.json()[0]["status"] == "ASSIGNED"
 
 @pytest.mark.asyncio
 async def test_employee_task_view(client: AsyncClient, create_test_data):
@@ -125,3 +125,362 @@ async def test_announcements(client: AsyncClient, create_test_data):
     )
     assert ack_res.status_code == 200
     assert ack_res.json()["user_id"] is not None
+
+@pytest.mark.asyncio
+async def test_principal_cache(client: AsyncClient, create_test_data):
+    # Login as Admin
+    login_res = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "ADMIN001", "password": "password"}
+    )
+    headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+    emp_login = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "EMP001", "password": "password"}
+    )
+    emp_headers = {"Authorization": f"Bearer {emp_login.json()['access_token']}"}
+
+    me_res = await client.get("/api/v1/users/me", headers=emp_headers)
+    assert me_res.status_code == 200
+    assert (await client.get("/api/v1/users/me", headers=emp_headers)).status_code == 200
+
+    stats = (await client.get("/api/v1/metrics/", headers=headers)).json()["principal_cache"]
+    assert stats["hits"] >= 1
+    assert stats["misses"] >= 2
+
+    # Deactivation must apply immediately despite the cached principal
+    update_res = await client.put(
+        f"/api/v1/users/{me_res.json()['id']}",
+        headers=headers,
+        json={"is_active": False}
+    )
+    assert update_res.status_code == 200
+    response = await client.get("/api/v1/users/me", headers=emp_headers)
+    assert response.status_code == 400
+
+@pytest.mark.asyncio
+async def test_current_user_loads_no_tasks(client: AsyncClient, create_test_data, sql_statements):
+    login_res = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "MGR001", "password": "password"}
+    )
+    headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+    await client.post("/api/v1/tasks/", headers=headers, json={"title": "History"})
+
+    from app.core.principal_cache import principal_cache
+    principal_cache.clear()
+    sql_statements.clear()
+    response = await client.get("/api/v1/users/me", headers=headers)
+    assert response.status_code == 200
+    assert len(sql_statements) == 1
+    assert "tasks" not in sql_statements[0][0]
+
+@pytest.mark.asyncio
+async def test_unrequested_relationship_load_fails(db_session, create_test_data):
+    from sqlalchemy import select
+    from sqlalchemy.orm import selectinload
+    from app.models import loading
+    from app.models.task import Task
+
+    db_session.add(Task(title="Guarded", created_by_id=create_test_data["manager"].id))
+    await db_session.commit()
+
+    query = loading.TASK_DETAIL.apply(select(Task)).options(selectinload(Task.creator))
+    with pytest.raises(loading.UnrequestedLoadError):
+        await db_session.execute(query.execution_options(populate_existing=True))
+
+@pytest.mark.asyncio
+async def test_login_sheds_load_when_hashing_saturated(client: AsyncClient, create_test_data, monkeypatch):
+    from app.core.hashing import password_hasher
+    monkeypatch.setattr(password_hasher, "in_flight", password_hasher.workers + password_hasher.max_queue)
+
+    response = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "ADMIN001", "password": "password"}
+    )
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "1"
+
+@pytest.mark.asyncio
+async def test_hashing_counts_abandoned_jobs_until_done():
+    import asyncio
+    import threading
+    from app.core.hashing import HashingSaturatedError, PasswordHashExecutor
+
+    hasher = PasswordHashExecutor(workers=1, max_queue=1)
+    started, finish = threading.Event(), threading.Event()
+
+    def slow_hash():
+        started.set()
+        finish.wait(5)
+
+    running = asyncio.create_task(hasher.run(slow_hash))
+    queued = asyncio.create_task(hasher.run(slow_hash))
+    await asyncio.to_thread(started.wait, 5)
+    # The clients disconnect, but one job still runs and the other is still queued
+    running.cancel()
+    await asyncio.sleep(0)
+    assert hasher.in_flight == 2
+    with pytest.raises(HashingSaturatedError):
+        await hasher.run(slow_hash)
+
+    # A cancelled awaiter releases its slot only once the job itself is done
+    queued.cancel()
+    finish.set()
+    for _ in range(100):
+        if hasher.in_flight == 0:
+            break
+        await asyncio.sleep(0.01)
+    assert hasher.in_flight == 0
+    hasher._get_executor().shutdown()
+
+@pytest.mark.asyncio
+async def test_bulk_hashing_counts_towards_saturation():
+    import asyncio
+    import time
+    from app.core.hashing import HashingSaturatedError, PasswordHashExecutor
+
+    hasher = PasswordHashExecutor(workers=2, max_queue=0)
+    assert hasher.processes == 2
+    bulk = asyncio.create_task(hasher.map(time.sleep, [0.3] * 4))
+    await asyncio.sleep(0.05)
+    # One chunk per process, both in the budget logins are checked against
+    assert hasher.stats()["in_flight"] == 2
+    with pytest.raises(HashingSaturatedError):
+        await hasher.run(time.sleep, 0)
+
+    assert await bulk == [None] * 4
+    await asyncio.sleep(0.05)
+    assert hasher.stats()["in_flight"] == 0
+    assert hasher.stats()["bulk_completed"] == 4
+    hasher._get_process_pool().shutdown()
+
+@pytest.mark.asyncio
+async def test_import_users(client: AsyncClient, create_test_data):
+    login_res = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "MGR001", "password": "password"}
+    )
+    headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+    csv_body = (
+        "emp_id,password,full_name,role,venture_id\n"
+        "EMP100,secret,Bulk One,EMPLOYEE,1\n"
+        "EMP001,secret,Already There,EMPLOYEE,1\n"
+        "EMP101,secret,Sneaky Admin,ADMIN,1\n"
+        "EMP102,secret,Other Venture,EMPLOYEE,2\n"
+        "EMP100,secret,Duplicate,EMPLOYEE,1\n"
+        "EMP103,secret,Bulk Two,EMPLOYEE,1\n"
+    )
+    response = await client.post(
+        "/api/v1/users/import",
+        headers=headers,
+        files={"file": ("users.csv", csv_body, "text/csv")}
+    )
+    assert response.status_code == 200
+    report = response.json()
+    assert report["created"] == 2
+    assert [r["status"] for r in report["rows"]] == ["created", "error", "error", "error", "error", "created"]
+
+    login_res = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "EMP103", "password": "secret"}
+    )
+    assert login_res.status_code == 200
+
+    jsonl_body = '{"emp_id": "EMP200", "password": "x", "full_name": "J", "role": "EMPLOYEE", "venture_id": 1}\nnot json\n'
+    response = await client.post(
+        "/api/v1/users/import",
+        headers=headers,
+        files={"file": ("users.jsonl", jsonl_body, "application/x-ndjson")}
+    )
+    assert [r["status"] for r in response.json()["rows"]] == ["created", "error"]
+
+@pytest.mark.asyncio
+async def test_sql_metrics(client: AsyncClient, create_test_data, monkeypatch):
+    from app.core.config import settings
+    login_res = await client.post(
+        "/api/v1/login/access-token",
+        data={"username": "ADMIN001", "password": "password"}
+    )
+    headers = {"Authorization": f"Bearer {login_res.json()['access_token']}"}
+
+    response = await client.get("/api/v1/tasks/", headers=headers)
+    assert "X-DB-Query-Count" not in response.headers
+
+    monkeypatch.setattr(settings, "DEBUG", True)
+    response = await client.get("/api/v1/tasks/", headers=headers)
+    assert int(response.headers["X-DB-Query-Count"]) >= 1
+    assert float(response.headers["X-DB-Time-Ms"]) >= 0
+
+    metrics = (await client.get("/api/v1/metrics/", headers=headers)).json()
+    route = metrics["sql"]["routes"]["GET /api/v1/tasks/"]
+    assert route["requests"] >= 2
+    assert route["queries"] >= 1
+
+    # Keyed by the route's own template, and streamed bodies count their queries
+    await client.get("/api/v1/tasks/1/time-logs", headers=headers)
+    await client.get("/api/v1/exports/tasks", headers=headers)
+    routes = (await client.get("/api/v1/metrics/", headers=headers)).json()["sql"]["routes"]
+    assert routes["GET /api/v1/tasks/{id}/time-logs"]["requests"] == 1
+    # The principal is cached, so the export's only query runs while the body streams
+    assert routes["GET /api/v1/exports/tasks"]["queries"] == 1
+
+@pytest.mark.asyncio
+async def test_session_released_before_serialization(db_session):
+    from fastapi import APIRouter, Depends, FastAPI
+    from httpx import ASGITransport
+    from pydantic import BaseModel, ConfigDict
+    from sqlalchemy import text
+    from app.api.v1.deps import ReleaseSessionRoute
+    from app.database import request_sessions
+
+    async def probe_db():
+        request_sessions.get().append(db_session)
+        yield db_session
+
+    class Probe:
+        @property
+        def in_transaction(self):
+            return db_session.in_transaction()
+
+    class ProbeOut(BaseModel):
+        in_transaction: bool
+        model_config = ConfigDict(from_attributes=True)
+
+    router = APIRouter(route_class=ReleaseSessionRoute)
+
+    @router.get("/probe", response_model=ProbeOut)
+    async def probe(db=Depends(probe_db)):
+        await db.execute(text("SELECT 1"))
+        assert db.in_transaction()
+        return Probe()
+
+    probe_app = FastAPI()
+    probe_app.include_router(router)
+    async with AsyncClient(transport=ASGITransport(app=probe_app), base_url="http://test") as c:
+        response = await c.get("/probe")
+    assert response.json() == {"in_transaction": False}
+
+@pytest.mark.asyncio
+async def test_read_replica_routing(tmp_path, monkeypatch):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app import database
+
+    engines = {}
+    for name in ("primary", "replica"):
+        engines[name] = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / name}.db")
+        async with engines[name].begin() as conn:
+            await conn.execute(text("CREATE TABLE marker (name TEXT)"))
+            await conn.execute(text("INSERT INTO marker VALUES (:name)"), {"name": name})
+    monkeypatch.setattr(database, "engine", engines["primary"])
+    monkeypatch.setattr(database, "read_engine", engines["replica"])
+    monkeypatch.setattr(database, "read_your_writes", database.ReadYourWrites(window=60))
+
+    async def read_marker():
+        async with database.ReadSessionLocal() as session:
+            return (await session.execute(text("SELECT name FROM marker"))).scalar()
+
+    token = database.current_user_id.set(7)
+    try:
+        assert await read_marker() == "replica"
+        database.read_your_writes.pin(7)
+        assert await read_marker() == "primary"
+        database.current_user_id.set(8)
+        assert await read_marker() == "replica"
+    finally:
+        database.current_user_id.reset(token)
+        for e in engines.values():
+            await e.dispose()
+
+@pytest.mark.asyncio
+async def test_sqlite_production_pragmas(tmp_path):
+    from sqlalchemy import text
+    from sqlalchemy.ext.asyncio import create_async_engine
+    from app.database import configure_sqlite, engine_options
+
+    url = f"sqlite+aiosqlite:///{tmp_path / 'prod.db'}"
+    writer = create_async_engine(url, **engine_options(url, single_writer=True))
+    configure_sqlite(writer.sync_engine)
+    try:
+        async with writer.connect() as conn:
+            assert (await conn.execute(text("PRAGMA journal_mode"))).scalar() == "wal"
+            assert (await conn.execute(text("PRAGMA synchronous"))).scalar() == 1 # NORMAL
+            assert (await conn.execute(text("PRAGMA busy_timeout"))).scalar() > 0
+        assert writer.pool.size() == 1
+    finally:
+        await writer.dispose()
+
+@pytest.mark.asyncio
+async def test_hashing_holds_no_writer_connection(tmp_path, monkeypatch):
+    import asyncio
+    from httpx import ASGITransport
+    from sqlalchemy import insert
+    from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+    from sqlalchemy.orm import sessionmaker
+    from app.core import security
+    from app.core.config import settings
+    from app.core.principal_cache import principal_cache
+    from app.database import Base, PrimarySession, configure_sqlite, engine_options, get_db, get_read_db
+    from app.main import app
+    from app.models.user import User, UserRole
+    from app.models.venture import Venture
+
+    # SQLite production mode: one writer connection, and a short wait for it
+    monkeypatch.setattr(settings, "DB_POOL_TIMEOUT", 1)
+    url = f"sqlite+aiosqlite:///{tmp_path / 'writer.db'}"
+    writer = create_async_engine(url, **engine_options(url, single_writer=True))
+    configure_sqlite(writer.sync_engine)
+    async with writer.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = sessionmaker(writer, class_=AsyncSession, sync_session_class=PrimarySession, expire_on_commit=False)
+    async with sessions() as db:
+        await db.execute(insert(Venture), [{"id": 1, "name": "Writers"}])
+        await db.execute(insert(User), [{
+            "id": 1, "emp_id": "ADMIN", "hashed_password": security.get_password_hash("password"),
+            "full_name": "Admin", "role": UserRole.ADMIN, "venture_id": 1,
+        }])
+        await db.commit()
+
+    # Hashing parks until released, however long bcrypt would take
+    release, hashing = asyncio.Event(), []
+    async def slow(result):
+        hashing.append(result)
+        await release.wait()
+        return result
+    monkeypatch.setattr(security, "verify_password_async", lambda *args: slow(True))
+    monkeypatch.setattr(security, "get_password_hashes", lambda passwords: slow(["x"] * len(passwords)))
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    principal_cache.clear()
+    try:
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            headers = {"Authorization": f"Bearer {security.create_access_token(1)}"}
+            login = asyncio.create_task(client.post("/api/v1/login/access-token", data={"username": "ADMIN", "password": "password"}))
+            imported = asyncio.create_task(client.post("/api/v1/users/import", headers=headers, files={
+                "file": ("users.csv", "emp_id,password,full_name,role,venture_id\nEMP1,secret,One,EMPLOYEE,1\n", "text/csv"),
+            }))
+            for _ in range(300):
+                if len(hashing) == 2:
+                    break
+                await asyncio.sleep(0.01)
+            assert len(hashing) == 2, "a request waited for the connection another held while hashing"
+
+            # Both are mid-hash; a write still gets the only connection
+            venture = await client.post("/api/v1/ventures/", headers=headers, json={"name": "Meanwhile"})
+            assert venture.status_code == 200
+
+            release.set()
+            assert (await login).status_code == 200
+            assert (await imported).json()["created"] == 1
+    finally:
+        release.set()
+        app.dependency_overrides.clear()
+        await writer.dispose()
@@ -0,0 +1,83 @@
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.core.etag import table_versions
+
+async def revalidate(client: AsyncClient, url: str, headers: dict):
+    """(first response, status of an immediate conditional re-fetch)"""
+    first = await client.get(url, headers=headers)
+    assert first.status_code == 200
+    again = await client.get(url, headers={**headers, "If-None-Match": first.headers["ETag"]})
+    return first, again
+
+@pytest.mark.asyncio
+async def test_task_list_etag(client: AsyncClient, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    task = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Mine", "assigned_to_ids": [emp_id]})).json()[0]
+
+    sql_statements.clear()
+    first, again = await revalidate(client, "/api/v1/tasks/", employee)
+    assert first.headers["ETag"].startswith('W/"')
+    assert again.status_code == 304
+    assert again.content == b""
+    assert again.headers["ETag"] == first.headers["ETag"]
+    # The 304 never selected task rows: one task-row SELECT, from the first request
+    assert len([s for s, _ in sql_statements if "tasks.title" in s]) == 1
+
+    # Tasks the employee cannot see do not invalidate their tag
+    await client.post("/api/v1/tasks/", headers=manager, json={"title": "Unassigned"})
+    unchanged = await client.get("/api/v1/tasks/", headers={**employee, "If-None-Match": first.headers["ETag"]})
+    assert unchanged.status_code == 304
+
+    # ...their own do, and so do other query parameters
+    await client.put(f"/api/v1/tasks/{task['id']}", headers=manager, json={"progress": 40})
+    changed = await client.get("/api/v1/tasks/", headers={**employee, "If-None-Match": first.headers["ETag"]})
+    assert changed.status_code == 200
+    assert changed.json()[0]["progress"] == 40
+    filtered = await client.get("/api/v1/tasks/?status=REVIEW", headers={**employee, "If-None-Match": changed.headers["ETag"]})
+    assert filtered.status_code == 200
+
+@pytest.mark.asyncio
+async def test_table_version_etags(client: AsyncClient, create_test_data, login):
+    admin = await login("ADMIN001")
+    created = await client.post("/api/v1/announcements/", headers=admin, json={"title": "Hi", "content": "Hello"})
+
+    first, again = await revalidate(client, "/api/v1/announcements/", admin)
+    assert again.status_code == 304
+    await client.post(f"/api/v1/announcements/{created.json()['id']}/acknowledge", headers=admin)
+    acked = await client.get("/api/v1/announcements/", headers={**admin, "If-None-Match": first.headers["ETag"]})
+    assert acked.status_code == 200
+    assert len(acked.json()[0]["acks"]) == 1
+
+    first, again = await revalidate(client, "/api/v1/ventures/", admin)
+    assert again.status_code == 304
+    await client.post("/api/v1/ventures/", headers=admin, json={"name": "Second"})
+    assert (await client.get("/api/v1/ventures/", headers={**admin, "If-None-Match": first.headers["ETag"]})).status_code == 200
+
+    first, again = await revalidate(client, "/api/v1/leaves/holidays", admin)
+    assert again.status_code == 304
+    holiday = await client.post("/api/v1/leaves/holidays", headers=admin, json={"name": "New Year", "date": "2027-01-01"})
+    assert holiday.json()["date"] == "2027-01-01"
+    assert (await client.get("/api/v1/leaves/holidays", headers={**admin, "If-None-Match": first.headers["ETag"]})).status_code == 200
+
+@pytest.mark.asyncio
+async def test_table_versions_bumped_only_where_read(client: AsyncClient, db_session, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    emp_id = create_test_data["employee"].id
+
+    # Task and time-log writes never touch (and lock) a counter row
+    sql_statements.clear()
+    task = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Hot", "assigned_to_ids": [emp_id]})).json()[0]
+    await client.put(f"/api/v1/tasks/{task['id']}", headers=manager, json={"progress": 10})
+    assert not [s for s, _ in sql_statements if "table_versions" in s]
+
+    # A counter without a seed row is created by the first write, not a failed commit
+    await db_session.execute(text("DELETE FROM table_versions WHERE table_name = 'ventures'"))
+    await db_session.commit()
+    admin = await login("ADMIN001")
+    for name in ("Second", "Third"):
+        assert (await client.post("/api/v1/ventures/", headers=admin, json={"name": name})).status_code == 200
+    assert await table_versions(db_session, "ventures") == (2,)
@@ -0,0 +1,140 @@
+import asyncio
+import csv
+import io
+import json
+import tracemalloc
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import text
+
+from app.crud.time_log import rebuild_time_log_daily, recompute_task_totals
+from app.main import app
+
+def entry(entry_id: str, task_id: int, day: str, start: str, end: str) -> dict:
+    return {"entry_id": entry_id, "task_id": task_id, "start_time": f"{day}T{start}", "end_time": f"{day}T{end}"}
+
+@pytest.mark.asyncio
+async def test_exports(client: AsyncClient, create_test_data, login):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    mine = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Timesheet, \"quoted\"", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+    other = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Not mine"})).json()[0]["id"]
+    await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        entry("a", mine, "2026-05-04", "09:00:00", "10:00:00"),
+        entry("b", mine, "2026-05-05", "09:00:00", "09:30:00"),
+    ]})
+
+    response = await client.get("/api/v1/exports/time-logs", headers=employee)
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    assert response.headers["content-disposition"] == 'attachment; filename="time-logs.csv"'
+    rows = list(csv.DictReader(io.StringIO(response.text)))
+    assert [(r["task_title"], r["emp_id"], r["start_time"], r["duration_minutes"]) for r in rows] == [
+        ('Timesheet, "quoted"', "EMP001", "2026-05-04T09:00:00", "60"),
+        ('Timesheet, "quoted"', "EMP001", "2026-05-05T09:00:00", "30"),
+    ]
+
+    # Date range is inclusive of both days; filters combine
+    jsonl = await client.get("/api/v1/exports/time-logs", headers=manager, params={
+        "format": "jsonl", "start": "2026-05-05", "end": "2026-05-05", "venture_id": 1, "user_id": emp_id,
+    })
+    assert jsonl.headers["content-type"] == "application/x-ndjson"
+    lines = [json.loads(line) for line in jsonl.text.splitlines()]
+    assert [(line["task_id"], line["duration_minutes"], line["venture_id"]) for line in lines] == [(mine, 30, 1)]
+    empty = await client.get("/api/v1/exports/time-logs", headers=manager, params={"venture_id": 2})
+    assert empty.text.splitlines() == [empty.text.splitlines()[0]]
+
+    # Same visibility as the task list
+    tasks = [json.loads(line) for line in (await client.get("/api/v1/exports/tasks", headers=employee, params={"format": "jsonl"})).text.splitlines()]
+    assert [(t["id"], t["status"], t["total_logged_minutes"]) for t in tasks] == [(mine, "ASSIGNED", 90)]
+    all_tasks = list(csv.DictReader(io.StringIO((await client.get("/api/v1/exports/tasks", headers=manager)).text)))
+    assert [int(t["id"]) for t in all_tasks] == [mine, other]
+    assert [int(t["id"]) for t in csv.DictReader(io.StringIO((await client.get(
+        "/api/v1/exports/tasks", headers=manager, params={"user_id": emp_id})).text))] == [mine]
+
+    assert (await client.get("/api/v1/exports/tasks", headers=manager, params={"format": "xml"})).status_code == 422
+    assert (await client.get("/api/v1/exports/tasks", headers=manager, params={"start": "2026-05-05", "end": "2026-05-04"})).status_code == 400
+
+    # Text that a spreadsheet would run as a formula is escaped in CSV only
+    formula = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "=HYPERLINK(\"http://x\")", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+    exported = list(csv.DictReader(io.StringIO((await client.get("/api/v1/exports/tasks", headers=employee)).text)))
+    assert [t["title"] for t in exported if int(t["id"]) == formula] == ['\'=HYPERLINK("http://x")']
+    exported = (await client.get("/api/v1/exports/tasks", headers=employee, params={"format": "jsonl"})).text.splitlines()
+    assert [json.loads(t)["title"] for t in exported if json.loads(t)["id"] == formula] == ['=HYPERLINK("http://x")']
+
+async def stream_export(client: AsyncClient, db_session, create_test_data, login, rows: int, window=None) -> dict:
+    """
+    Export `rows` time logs as CSV, counting what arrives per chunk. With `window`
+    (first, last chunk), allocations between those chunks are traced too.
+    """
+    manager = await login("MGR001")
+    emp_id = create_test_data["employee"].id
+    task = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Long", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+    await db_session.execute(text(
+        "INSERT INTO time_logs (task_id, user_id, start_time, end_time, duration_minutes) "
+        "WITH RECURSIVE n(i) AS (SELECT 0 UNION ALL SELECT i + 1 FROM n WHERE i < :rows - 1) "
+        "SELECT :task, :user, datetime('2020-01-01', '+' || (i * 2) || ' minutes'), "
+        "datetime('2020-01-01', '+' || (i * 2 + 1) || ' minutes'), 1 FROM n"
+    ), {"rows": rows, "task": task, "user": emp_id})
+    await recompute_task_totals(db_session, [task])
+    await rebuild_time_log_daily(db_session)
+    await db_session.commit()
+
+    # Drive the app directly: httpx's ASGI transport buffers whole response bodies
+    received = {"bytes": 0, "lines": 0, "chunks": 0}
+    requested = asyncio.Event()
+
+    async def receive():
+        # The request once, then no disconnect until the response is done
+        if requested.is_set():
+            await asyncio.Event().wait()
+        requested.set()
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message):
+        if message["type"] == "http.response.body":
+            body = message.get("body", b"")
+            received["bytes"] += len(body)
+            received["lines"] += body.count(b"\n")
+            received["chunks"] += 1
+            if window and received["chunks"] == window[0]:
+                tracemalloc.start()
+            elif window and received["chunks"] == window[1]:
+                received["retained"], received["peak"] = tracemalloc.get_traced_memory()
+                tracemalloc.stop()
+
+    scope = {
+        "type": "http", "asgi": {"version": "3.0"}, "http_version": "1.1", "method": "GET", "scheme": "http",
+        "path": "/api/v1/exports/time-logs", "raw_path": b"/api/v1/exports/time-logs", "root_path": "",
+        "query_string": b"format=csv", "server": ("test", 80), "client": ("test", 1),
+        "headers": [(k.lower().encode(), v.encode()) for k, v in manager.items()],
+    }
+    try:
+        await app(scope, receive, send)
+    finally:
+        tracemalloc.stop()
+    return received
+
+@pytest.mark.asyncio
+async def test_export_streams_in_batches(client: AsyncClient, db_session, create_test_data, login):
+    received = await stream_export(client, db_session, create_test_data, login, rows=5000)
+    assert received["lines"] == 5000 + 1
+    # One chunk per EXPORT_BATCH_SIZE rows, not one body
+    assert received["chunks"] > 5000 // 1000
+
+@pytest.mark.slow
+@pytest.mark.asyncio
+async def test_export_memory_stays_flat(client: AsyncClient, db_session, create_test_data, login):
+    rows = 1_000_000
+    # Allocations are traced over a window of 300k rows (tracing all of it is slow):
+    # anything kept per row would pile up there
+    received = await stream_export(client, db_session, create_test_data, login, rows, window=(100, 400))
+
+    assert received["lines"] == rows + 1
+    assert received["chunks"] > rows // 1000
+    # The export is ~80 MB; 300k rows of it alone would be ~24 MB
+    assert received["bytes"] > 64 * 1024 * 1024
+    assert received["peak"] < 8 * 1024 * 1024, received
+    assert received["retained"] < 2 * 1024 * 1024, received
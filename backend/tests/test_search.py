@@ -0,0 +1,50 @@
+import pytest
+from httpx import AsyncClient
+
+@pytest.mark.asyncio
+async def test_search(client: AsyncClient, create_test_data, login):
+    manager = await login("MGR001")
+    admin = await login("ADMIN001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+
+    mine = (await client.post("/api/v1/tasks/", headers=manager, json={
+        "title": "Invoice reconciliation", "description": "Match March invoices", "assigned_to_ids": [emp_id]
+    })).json()[0]
+    await client.post("/api/v1/tasks/", headers=manager, json={"title": "Payroll", "description": "Check invoice totals"})
+    await client.post("/api/v1/tasks/", headers=admin, json={"title": "Invoices for admin only"})
+    await client.post("/api/v1/announcements/", headers=admin, json={"title": "Invoicing policy", "content": "New invoice template"})
+
+    # The employee sees only their task, plus announcements
+    hits = (await client.get("/api/v1/search/", headers=employee, params={"q": "invoice"})).json()["items"]
+    assert sorted((h["type"], h["title"]) for h in hits) == [("announcement", "Invoicing policy"), ("task", "Invoice reconciliation")]
+    assert [h["score"] for h in hits] == sorted(h["score"] for h in hits)
+
+    # Manager: the tasks they created, never the admin's; titles outrank bodies
+    manager_hits = (await client.get("/api/v1/search/", headers=manager, params={"q": "invoice", "type": "task"})).json()["items"]
+    assert [h["title"] for h in manager_hits] == ["Invoice reconciliation", "Payroll"]
+
+    # Kept in sync on update
+    await client.put(f"/api/v1/tasks/{mine['id']}", headers=manager, json={"title": "Vendor audit"})
+    assert (await client.get("/api/v1/search/", headers=employee, params={"q": "vendor"})).json()["items"][0]["id"] == mine["id"]
+    assert (await client.get("/api/v1/search/", headers=employee, params={"q": "reconciliation"})).json()["items"] == []
+
+    # Keyset pages walk the hits best match first. Not a snapshot: a write between
+    # pages shifts every score, but the cursor stays usable and paging still ends
+    scores, cursor = [], None
+    while True:
+        params = {"q": "invoice", "limit": 1, **({"cursor": cursor} if cursor else {})}
+        page = (await client.get("/api/v1/search/", headers=admin, params=params))
+        assert page.status_code == 200
+        scores += [h["score"] for h in page.json()["items"]]
+        if len(scores) == 2:
+            await client.post("/api/v1/tasks/", headers=admin, json={"title": "Invoice backlog"})
+        cursor = page.json()["next_cursor"]
+        if cursor is None:
+            break
+    assert scores[:2] == sorted(scores[:2])
+    assert 3 <= len(scores) <= 5
+
+    # Punctuation cannot break the FTS query syntax
+    assert (await client.get("/api/v1/search/", headers=admin, params={"q": 'invoice" OR *'})).status_code == 200
+    assert (await client.get("/api/v1/search/", headers=admin, params={"q": '"*'})).status_code == 400
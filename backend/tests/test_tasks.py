@@ -0,0 +1,249 @@
+import pytest
+from httpx import AsyncClient
+
+from app.core.pagination import encode_cursor
+
+@pytest.mark.asyncio
+async def test_task_keyset_pagination(client: AsyncClient, create_test_data, login):
+    headers = await login("ADMIN001")
+    emp_id = create_test_data["employee"].id
+    for i in range(7):
+        await client.post("/api/v1/tasks/", headers=headers, json={
+            "title": f"Task {i}",
+            "assigned_to_ids": [emp_id],
+            "priority": "HIGH" if i % 2 else "LOW",
+            "due_date": f"2026-02-0{i + 1}T00:00:00" if i < 5 else None,
+        })
+
+    orders = {}
+    for sort in ("updated_at", "due_date"):
+        seen, cursor = [], None
+        while True:
+            params = {"limit": 3, "sort": sort}
+            if cursor:
+                params["cursor"] = cursor
+            page = (await client.get("/api/v1/tasks/page", headers=headers, params=params)).json()
+            seen.extend(t["id"] for t in page["items"])
+            cursor = page["next_cursor"]
+            if not cursor:
+                break
+        assert sorted(seen) == sorted(set(seen))
+        assert len(seen) == 7
+        orders[sort] = seen
+    # Dated tasks first, then the undated ones: the second page spans both segments
+    assert orders["due_date"] == sorted(orders["due_date"])
+
+    due = (await client.get("/api/v1/tasks/page", headers=headers, params={"sort": "due_date"})).json()["items"]
+    assert [t["title"] for t in due][:5] == [f"Task {i}" for i in range(5)]
+
+    high = (await client.get("/api/v1/tasks/page", headers=headers, params={"priority": "HIGH"})).json()
+    assert len(high["items"]) == 3
+
+    bad = await client.get("/api/v1/tasks/page", headers=headers, params={"cursor": "garbage"})
+    assert bad.status_code == 400
+
+@pytest.mark.asyncio
+async def test_task_list_projection(client: AsyncClient, db_session, create_test_data, login):
+    from datetime import datetime, timedelta
+    from app.crud.time_log import record_time_logs
+
+    headers = await login("ADMIN001")
+    emp_id = create_test_data["employee"].id
+    task = (await client.post("/api/v1/tasks/", headers=headers, json={
+        "title": "Logged", "assigned_to_ids": [emp_id]
+    })).json()[0]
+    start = datetime(2026, 3, 1, 9, 0)
+    await record_time_logs(db_session, [
+        {"task_id": task["id"], "user_id": emp_id, "start_time": start + timedelta(hours=i),
+         "end_time": start + timedelta(hours=i, minutes=30), "duration_minutes": 30}
+        for i in range(5)
+    ])
+    await db_session.commit()
+
+    summary = (await client.get("/api/v1/tasks/", headers=headers)).json()[0]
+    assert "time_logs" not in summary
+    assert summary["total_logged_minutes"] == 150
+    assert summary["time_log_count"] == 5
+    assert summary["last_logged_at"] == "2026-03-01T13:30:00"
+
+    full = (await client.get("/api/v1/tasks/", headers=headers, params={"include": "time_logs"})).json()[0]
+    assert len(full["time_logs"]) == 5
+
+    page = (await client.get(f"/api/v1/tasks/{task['id']}/time-logs", headers=headers, params={"limit": 3})).json()
+    assert len(page["items"]) == 3
+    rest = (await client.get(
+        f"/api/v1/tasks/{task['id']}/time-logs", headers=headers,
+        params={"limit": 3, "cursor": page["next_cursor"]}
+    )).json()
+    assert len(rest["items"]) == 2
+    assert rest["next_cursor"] is None
+    bad = await client.get(f"/api/v1/tasks/{task['id']}/time-logs", headers=headers, params={"cursor": encode_cursor("time_logs", ["nope", 1])})
+    assert bad.status_code == 400
+
+@pytest.mark.asyncio
+async def test_task_time_totals(client: AsyncClient, db_session, create_test_data, login):
+    from sqlalchemy import update
+    from app.crud.time_log import find_inconsistent_task_totals, recompute_task_totals
+    from app.models.task import Task
+
+    headers = await login("EMP001")
+    task_id = (await client.post("/api/v1/tasks/", headers=await login("MGR001"), json={
+        "title": "Timed", "assigned_to_ids": [create_test_data["employee"].id]
+    })).json()[0]["id"]
+    assert (await client.post(f"/api/v1/tasks/{task_id}/timer/start", headers=headers)).status_code == 200
+    stopped = (await client.post(f"/api/v1/tasks/{task_id}/timer/stop", headers=headers)).json()
+    assert stopped["time_log_count"] == 1
+    assert stopped["last_logged_at"] == stopped["time_logs"][0]["end_time"]
+
+    # Drift the counters, then repair them from time_logs
+    await db_session.execute(update(Task).where(Task.id == task_id).values(time_log_count=7, total_logged_minutes=99))
+    await db_session.commit()
+    assert await find_inconsistent_task_totals(db_session) == [task_id]
+    assert await recompute_task_totals(db_session) >= 1
+    await db_session.commit()
+    assert await find_inconsistent_task_totals(db_session) == []
+    refreshed = (await client.get("/api/v1/tasks/", headers=headers)).json()[0]
+    assert refreshed["time_log_count"] == 1
+    assert refreshed["total_logged_minutes"] == 0
+
+@pytest.mark.asyncio
+async def test_bulk_task_creation(client: AsyncClient, db_session, create_test_data, login, sql_statements):
+    from app.models.user import User, UserRole
+
+    headers = await login("MGR001")
+    db_session.add_all(
+        User(emp_id=f"BULK{i:04d}", full_name=f"Bulk {i}", hashed_password="x", role=UserRole.EMPLOYEE, venture_id=1)
+        for i in range(1500)
+    )
+    await db_session.commit()
+    user_ids = [u["id"] for u in (await client.get("/api/v1/users/", headers=headers, params={"limit": 2000})).json()
+                if u["emp_id"].startswith("BULK")]
+
+    sql_statements.clear()
+    response = await client.post("/api/v1/tasks/", headers=headers, json={
+        "title": "Everyone", "assigned_to_ids": user_ids + user_ids[:10]
+    })
+    assert response.status_code == 200
+    tasks = response.json()
+    assert [t["assigned_to_id"] for t in tasks] == user_ids
+    assert tasks[0]["assignee"]["full_name"] == "Bulk 0"
+    assert tasks[0]["time_logs"] == []
+    # Principal lookup + assignees + two insertmanyvalues pages, never per row
+    inserts = [s for s, _ in sql_statements if s.startswith("INSERT INTO tasks")]
+    assert len(inserts) == 2
+    assert len(sql_statements) <= 6
+
+    missing = await client.post("/api/v1/tasks/", headers=headers, json={"title": "Ghost", "assigned_to_ids": [999999]})
+    assert missing.status_code == 404
+
+@pytest.mark.asyncio
+async def test_bulk_task_update(client: AsyncClient, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    mine = [
+        (await client.post("/api/v1/tasks/", headers=manager, json={"title": f"Card {i}", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+        for i in range(4)
+    ]
+    other = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Unassigned"})).json()[0]["id"]
+
+    sql_statements.clear()
+    moved = await client.post("/api/v1/tasks/bulk", headers=manager, json={
+        "ids": mine, "patch": {"status": "IN_PROGRESS"}
+    })
+    assert moved.status_code == 200
+    assert {t["status"] for t in moved.json()} == {"IN_PROGRESS"}
+    assert len([s for s, _ in sql_statements if s.startswith("UPDATE tasks")]) == 1
+
+    sql_statements.clear()
+    items = [{"id": mine[0], "progress": 50}, {"id": mine[1], "progress": 50}, {"id": mine[2], "status": "REVIEW"}]
+    per_item = (await client.post("/api/v1/tasks/bulk", headers=employee, json={"items": items})).json()
+    assert [(t["progress"], t["status"]) for t in per_item[:3]] == [(50, "IN_PROGRESS"), (50, "IN_PROGRESS"), (0, "REVIEW")]
+    assert len([s for s, _ in sql_statements if s.startswith("UPDATE tasks")]) == 2
+
+    # All or nothing: one foreign task rejects the whole batch
+    forbidden = await client.post("/api/v1/tasks/bulk", headers=employee, json={
+        "ids": [mine[0], other], "patch": {"status": "COMPLETED"}
+    })
+    assert forbidden.status_code == 403
+    missing = await client.post("/api/v1/tasks/bulk", headers=manager, json={"ids": [mine[0], 999], "patch": {"progress": 1}})
+    assert missing.status_code == 404
+    dup = await client.post("/api/v1/tasks/bulk", headers=manager, json={"items": [{"id": mine[0]}, {"id": mine[0]}]})
+    assert dup.status_code == 400
+    unchanged = (await client.get("/api/v1/tasks/", headers=employee, params={"status": "COMPLETED"})).json()
+    assert unchanged == []
+
+@pytest.mark.asyncio
+async def test_manager_sees_venture_tasks(client: AsyncClient, db_session, create_test_data, login):
+    from app.models.user import User, UserRole
+    from app.models.venture import Venture
+
+    db_session.add(Venture(id=2, name="Other Venture"))
+    db_session.add(User(emp_id="EMP002", full_name="Elsewhere", hashed_password="x", role=UserRole.EMPLOYEE, venture_id=2))
+    await db_session.commit()
+    admin = await login("ADMIN001")
+    manager = await login("MGR001")
+    users = (await client.get("/api/v1/users/", headers=admin)).json()
+    emp_id = create_test_data["employee"].id
+    other_id = next(u["id"] for u in users if u["emp_id"] == "EMP002")
+
+    # Created by the admin, assigned inside and outside the manager's venture
+    inside = (await client.post("/api/v1/tasks/", headers=admin, json={"title": "Inside", "assigned_to_ids": [emp_id]})).json()[0]
+    outside = (await client.post("/api/v1/tasks/", headers=admin, json={"title": "Outside", "assigned_to_ids": [other_id]})).json()[0]
+    await client.post("/api/v1/tasks/", headers=manager, json={"title": "Own, unassigned"})
+
+    async def visible():
+        return {t["title"] for t in (await client.get("/api/v1/tasks/", headers=manager)).json()}
+
+    assert await visible() == {"Inside", "Own, unassigned"}
+    dashboard = (await client.get("/api/v1/analytics/dashboard", headers=manager)).json()
+    assert dashboard["total_tasks"] == 2
+
+    # Reassignment and venture moves carry the task along
+    await client.put(f"/api/v1/tasks/{outside['id']}", headers=admin, json={"assigned_to_id": emp_id})
+    assert await visible() == {"Inside", "Outside", "Own, unassigned"}
+    await client.post("/api/v1/tasks/bulk", headers=admin, json={"ids": [inside["id"], outside["id"]], "patch": {"assigned_to_id": other_id}})
+    assert await visible() == {"Own, unassigned"}
+    await client.put(f"/api/v1/users/{other_id}", headers=admin, json={"venture_id": 1})
+    assert await visible() == {"Inside", "Outside", "Own, unassigned"}
+
+@pytest.mark.asyncio
+async def test_task_board(client: AsyncClient, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    specs = [("LOW", None), ("URGENT", "2026-07-02T00:00:00"), ("URGENT", "2026-07-01T00:00:00"), ("HIGH", None), ("URGENT", None)]
+    ids = [
+        (await client.post("/api/v1/tasks/", headers=manager, json={
+            "title": f"{priority} {due}", "priority": priority, "due_date": due, "assigned_to_ids": [emp_id]
+        })).json()[0]["id"]
+        for priority, due in specs
+    ]
+    await client.post("/api/v1/tasks/bulk", headers=manager, json={"ids": ids[:1], "patch": {"status": "REVIEW"}})
+    await client.post("/api/v1/tasks/", headers=manager, json={"title": "Hidden from the employee"})
+
+    sql_statements.clear()
+    board = (await client.get("/api/v1/tasks/board", headers=employee, params={"per_column": 2})).json()
+    # One windowed query for every column
+    assert len([s for s, _ in sql_statements if "FROM tasks" in s]) == 1
+    columns = {c["status"]: c for c in board["columns"]}
+    assert [c["status"] for c in board["columns"]] == ["ASSIGNED", "IN_PROGRESS", "REVIEW", "COMPLETED"]
+    assigned = columns["ASSIGNED"]
+    assert assigned["count"] == 4
+    assert [t["id"] for t in assigned["items"]] == [ids[2], ids[1]]
+    assert assigned["items"][0]["assignee"]["id"] == emp_id
+    assert columns["REVIEW"]["count"] == 1 and columns["REVIEW"]["next_cursor"] is None
+    assert columns["COMPLETED"] == {"status": "COMPLETED", "count": 0, "items": [], "next_cursor": None}
+
+    rest = (await client.get("/api/v1/tasks/board/ASSIGNED", headers=employee, params={"cursor": assigned["next_cursor"], "limit": 1})).json()
+    assert rest["count"] == 4
+    assert [t["id"] for t in rest["items"]] == [ids[4]]
+    last = (await client.get("/api/v1/tasks/board/ASSIGNED", headers=employee, params={"cursor": rest["next_cursor"]})).json()
+    assert [t["id"] for t in last["items"]] == [ids[3]]
+    assert last["next_cursor"] is None
+    bad = await client.get("/api/v1/tasks/board/ASSIGNED", headers=employee, params={"cursor": encode_cursor("board", [0, "nope", 1])})
+    assert bad.status_code == 400
+
+    # Same visibility as the task list
+    manager_board = (await client.get("/api/v1/tasks/board", headers=manager)).json()
+    assert sum(c["count"] for c in manager_board["columns"]) == 6
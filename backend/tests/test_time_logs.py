@@ -0,0 +1,110 @@
+from datetime import date
+
+import pytest
+from httpx import AsyncClient
+from sqlalchemy import select, update
+
+from app.crud.time_log import find_inconsistent_time_log_daily, rebuild_time_log_daily
+from app.models.time_log import TimeLogDaily
+
+def entry(entry_id: str, task_id: int, start: str, end: str) -> dict:
+    return {"entry_id": entry_id, "task_id": task_id, "start_time": f"2026-05-04T{start}", "end_time": f"2026-05-04T{end}"}
+
+@pytest.mark.asyncio
+async def test_time_log_batch(client: AsyncClient, create_test_data, login, sql_statements):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    mine = [
+        (await client.post("/api/v1/tasks/", headers=manager, json={"title": f"Field {i}", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+        for i in range(2)
+    ]
+    other = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Not mine"})).json()[0]["id"]
+    batch = [
+        entry("a", mine[0], "09:00:00", "10:00:00"),
+        entry("b", mine[1], "10:00:00", "10:30:00"),  # touching is not overlapping
+        entry("c", mine[0], "13:00:00", "13:45:00"),
+    ]
+
+    sql_statements.clear()
+    synced = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": batch})
+    assert synced.status_code == 200
+    assert [(log["client_entry_id"], log["duration_minutes"]) for log in synced.json()["created"]] == [("a", 60), ("b", 30), ("c", 45)]
+    assert len([s for s, _ in sql_statements if s.startswith("INSERT INTO time_logs")]) == 1
+
+    tasks = {t["id"]: t for t in (await client.get("/api/v1/tasks/", headers=employee)).json()}
+    assert tasks[mine[0]]["total_logged_minutes"] == 105
+    assert tasks[mine[0]]["last_logged_at"] == "2026-05-04T13:45:00"
+
+    # Re-sending is a no-op that reports what was stored
+    again = (await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": batch + [entry("d", mine[1], "14:00:00", "14:15:00")]})).json()
+    assert [log["client_entry_id"] for log in again["created"]] == ["d"]
+    assert sorted(log["client_entry_id"] for log in again["duplicates"]) == ["a", "b", "c"]
+
+    # Overlaps with stored logs or within the batch reject the whole batch
+    clash = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        entry("e", mine[1], "16:00:00", "17:00:00"), entry("f", mine[0], "09:30:00", "09:40:00"),
+    ]})
+    assert clash.status_code == 409
+    assert clash.json()["detail"] == "Overlapping time entries: f"
+    inner = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        entry("g", mine[1], "18:00:00", "19:00:00"), entry("h", mine[0], "18:30:00", "20:00:00"),
+    ]})
+    assert inner.status_code == 409
+
+    forbidden = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [entry("i", other, "21:00:00", "22:00:00")]})
+    assert forbidden.status_code == 403
+    backwards = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [entry("j", mine[0], "22:00:00", "21:00:00")]})
+    assert backwards.status_code == 400
+
+    tasks = {t["id"]: t for t in (await client.get("/api/v1/tasks/", headers=employee)).json()}
+    assert tasks[mine[0]]["time_log_count"] == 2
+    assert tasks[mine[1]]["time_log_count"] == 2
+
+@pytest.mark.asyncio
+async def test_time_log_batch_offsets(client: AsyncClient, create_test_data, login):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp_id = create_test_data["employee"].id
+    task = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Abroad", "assigned_to_ids": [emp_id]})).json()[0]["id"]
+
+    # Offsets are stored as naive UTC, and mix with naive (UTC) entries
+    synced = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        {"entry_id": "z", "task_id": task, "start_time": "2026-05-04T08:00:00Z", "end_time": "2026-05-04T09:00:00Z"},
+        {"entry_id": "ist", "task_id": task, "start_time": "2026-05-04T14:30:00+05:30", "end_time": "2026-05-04T15:00:00+05:30"},
+        {"entry_id": "naive", "task_id": task, "start_time": "2026-05-04T10:00:00", "end_time": "2026-05-04T10:30:00"},
+    ]})
+    assert synced.status_code == 200
+    assert [(log["client_entry_id"], log["start_time"], log["duration_minutes"]) for log in synced.json()["created"]] == [
+        ("z", "2026-05-04T08:00:00", 60), ("ist", "2026-05-04T09:00:00", 30), ("naive", "2026-05-04T10:00:00", 30),
+    ]
+    # ...and compared with the stored logs in UTC: 10:15 UTC is inside "naive"
+    clash = await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        {"entry_id": "pst", "task_id": task, "start_time": "2026-05-04T03:15:00-07:00", "end_time": "2026-05-04T03:20:00-07:00"},
+    ]})
+    assert clash.status_code == 409
+
+@pytest.mark.asyncio
+async def test_time_log_daily_rollup(client: AsyncClient, db_session, create_test_data, login):
+    manager = await login("MGR001")
+    employee = await login("EMP001")
+    emp = create_test_data["employee"]
+    task = (await client.post("/api/v1/tasks/", headers=manager, json={"title": "Rolled up", "assigned_to_ids": [emp.id]})).json()[0]["id"]
+    await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [
+        entry("a", task, "09:00:00", "10:00:00"), entry("b", task, "11:00:00", "11:20:00"),
+    ]})
+    # A second write to the same day adds to the existing row
+    await client.post("/api/v1/time-logs/batch", headers=employee, json={"entries": [entry("c", task, "12:00:00", "12:10:00")]})
+
+    rows = (await db_session.execute(select(TimeLogDaily))).scalars().all()
+    assert [(r.day, r.user_id, r.task_id, r.venture_id, r.minutes, r.log_count) for r in rows] == [
+        (date(2026, 5, 4), emp.id, task, emp.venture_id, 90, 3),
+    ]
+
+    # Drift is detected and repaired by the rebuild
+    await db_session.execute(update(TimeLogDaily).values(minutes=1))
+    assert await find_inconsistent_time_log_daily(db_session) == 1
+    assert await rebuild_time_log_daily(db_session) == 1
+    assert await find_inconsistent_time_log_daily(db_session) == 0
+    await db_session.commit()
+    assert (await db_session.execute(select(TimeLogDaily.minutes))).scalar_one() == 90
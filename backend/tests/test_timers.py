@@ -0,0 +1,111 @@
+import asyncio
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy import func, insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.orm import sessionmaker
+
+from app.core.config import settings
+from app.core.principal_cache import principal_cache
+from app.core.security import create_access_token
+from app.crud.time_log import find_inconsistent_task_totals
+from app.database import Base, PrimarySession, configure_sqlite, get_db, get_read_db
+from app.main import app
+from app.models.task import Task
+from app.models.time_log import TimeLog
+from app.models.user import User, UserRole
+from app.models.venture import Venture
+
+CONCURRENCY = 10
+
+@pytest.fixture
+async def concurrent_app(tmp_path):
+    """
+    App on a WAL file database with a session (and connection) per request,
+    so requests really run concurrently; the shared test session cannot.
+    """
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'timers.db'}", pool_size=CONCURRENCY)
+    configure_sqlite(engine.sync_engine)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    sessions = sessionmaker(engine, class_=AsyncSession, sync_session_class=PrimarySession, expire_on_commit=False)
+    async with sessions() as db:
+        await db.execute(insert(Venture), [{"id": 1, "name": "Timers"}])
+        await db.execute(insert(User), [
+            {"id": 1, "emp_id": "EMP", "hashed_password": "x", "full_name": "Employee", "role": UserRole.EMPLOYEE, "venture_id": 1},
+        ])
+        await db.execute(insert(Task), [{"id": i, "title": f"Task {i}", "created_by_id": 1, "assigned_to_id": 1} for i in range(1, 6)])
+        await db.commit()
+
+    async def override_get_db():
+        async with sessions() as db:
+            yield db
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_read_db] = override_get_db
+    principal_cache.clear()
+    async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+        client.headers["Authorization"] = f"Bearer {create_access_token(1)}"
+        yield client, sessions
+    app.dependency_overrides.clear()
+    async with sessions() as db:
+        assert await find_inconsistent_task_totals(db) == []
+    await engine.dispose()
+
+async def hammer(client: AsyncClient, urls: list) -> list:
+    responses = await asyncio.gather(*(client.post(url) for url in urls))
+    return sorted(r.status_code for r in responses)
+
+async def count_logs(sessions) -> int:
+    async with sessions() as db:
+        return (await db.execute(select(func.count(TimeLog.id)))).scalar()
+
+@pytest.mark.asyncio
+async def test_concurrent_start_and_stop(concurrent_app):
+    client, sessions = concurrent_app
+    for _ in range(3):
+        assert await hammer(client, ["/api/v1/tasks/1/timer/start"] * CONCURRENCY) == [200] + [400] * (CONCURRENCY - 1)
+        assert await hammer(client, ["/api/v1/tasks/1/timer/stop"] * CONCURRENCY) == [200] + [400] * (CONCURRENCY - 1)
+    # One log per stopped timer, never a duplicate
+    assert await count_logs(sessions) == 3
+
+@pytest.mark.asyncio
+async def test_single_active_timer_per_user(concurrent_app, monkeypatch):
+    client, sessions = concurrent_app
+    monkeypatch.setattr(settings, "TIMER_SINGLE_ACTIVE_PER_USER", True)
+
+    assert (await client.post("/api/v1/tasks/1/timer/start")).status_code == 200
+    started = (await client.post("/api/v1/tasks/2/timer/start")).json()
+    assert started["active_timer_user_id"] == 1
+    # Starting task 2 stopped and logged task 1
+    assert await count_logs(sessions) == 1
+
+    # Racing starts on every task: whatever wins, one timer is left running
+    urls = [f"/api/v1/tasks/{i}/timer/start" for i in range(1, 6)] * 4
+    statuses = await hammer(client, urls)
+    async with sessions() as db:
+        running = (await db.execute(select(Task.id).where(Task.active_timer_start.isnot(None)))).scalars().all()
+    assert len(running) == 1
+    # Every successful start stopped exactly the timer before it
+    assert await count_logs(sessions) == 1 + statuses.count(200)
+
+    # A start that cannot happen leaves the running timer alone
+    assert (await client.post("/api/v1/tasks/999/timer/start")).status_code == 404
+    assert (await client.post(f"/api/v1/tasks/{running[0]}/timer/start")).status_code == 400
+    async with sessions() as db:
+        assert (await db.execute(select(Task.id).where(Task.active_timer_start.isnot(None)))).scalars().all() == running
+
+@pytest.mark.asyncio
+async def test_concurrent_overlapping_batches(concurrent_app):
+    client, sessions = concurrent_app
+    # Different entry_ids, same hour: idempotency cannot catch these, the overlap check must
+    responses = await asyncio.gather(*(
+        client.post("/api/v1/time-logs/batch", json={"entries": [{
+            "entry_id": f"device-{i}", "task_id": 1 + i % 5,
+            "start_time": "2026-05-04T09:00:00", "end_time": "2026-05-04T10:00:00",
+        }]})
+        for i in range(CONCURRENCY)
+    ))
+    assert sorted(r.status_code for r in responses) == [200] + [409] * (CONCURRENCY - 1)
+    assert await count_logs(sessions) == 1